@@ -0,0 +1,334 @@
+"""
+Headless benchmark suite for MiniJam-Snakes.
+
+Drives real Game, MainMenu and ParticleSystem instances through scripted
+stress scenarios and reports frame rate, per-frame percentiles and peak
+memory as JSON.
+
+Usage:
+    python benchmark.py                          # run all, print JSON
+    python benchmark.py -o bench.json            # save results
+    python benchmark.py -b bench.json            # compare against a baseline
+    python benchmark.py -s confetti_storm -f 600 # one scenario, more frames
+"""
+import os
+
+# Must be set before pygame initialises its video and audio drivers
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+from config import *
+from classes import Game, MainMenu, SoundManager
+from classes.asset_loader import get_loader
+from classes.particle import ParticleSystem
+
+FRAME_DT_MS = 1000 // FPS
+DEFAULT_FRAMES = 300
+
+
+class FixedClock:
+    """Clock stand-in that reports a constant frame time and never sleeps"""
+
+    def tick(self, framerate=0):
+        return FRAME_DT_MS
+
+    def get_time(self):
+        return FRAME_DT_MS
+
+
+def _confirm_full_hands(game):
+    """Queue each player's whole hand and start the simulation"""
+    for player in game.players:
+        player.chosen_cards.extend(player.hand.cards)
+        player.hand.cards.clear()
+        player.confirmed = True
+    # Planning normally takes longer than one move interval
+    game.time = game.settings.snake_speed + 1
+
+
+def _grow_snakes(game, length):
+    for player in game.players:
+        while len(player.snake.segments) < length:
+            player.snake.grow()
+
+
+def _game_step(game, on_restart=None):
+    """Return a step function running one full Game frame"""
+    def step():
+        game.handle_events()
+        game.update()
+        game.draw()
+        if game.show_win_screen and game.win_screen_timer > 1.0:
+            # Keep the simulation busy instead of idling on the win screen
+            game.replay_game()
+            if on_restart:
+                on_restart(game)
+    return step
+
+
+def _new_game(sound_manager, **settings):
+    game_settings = GameSettings()
+    for key, value in settings.items():
+        setattr(game_settings, key, value)
+    game = Game(sound_manager, game_settings)
+    game.clock = FixedClock()
+    # Leave any real match save alone
+    game.autosave_enabled = False
+    game.enter()
+    return game
+
+
+def scenario_max_grid(screen, sound_manager):
+    """30x30 grid simulating at the fastest snake speed"""
+    game = _new_game(sound_manager, grid_size=30, snake_speed=0.1,
+                     hand_size=20)
+    _confirm_full_hands(game)
+    return _game_step(game, _confirm_full_hands)
+
+
+def scenario_big_hand(screen, sound_manager):
+    """Planning phase with a 20-card hand, flipping through every page"""
+    game = _new_game(sound_manager, hand_size=20)
+    frame = [0]
+
+    def step():
+        frame[0] += 1
+        if frame[0] % 30 == 0:
+            hand = game.players[game.turn].hand
+            pages = (len(hand.cards) + CARDS_PER_PAGE - 1) // CARDS_PER_PAGE
+            hand.current_page = (hand.current_page + 1) % max(1, pages)
+        game.handle_events()
+        game.update()
+        game.draw()
+    return step
+
+
+def scenario_long_snakes(screen, sound_manager):
+    """Simulation with both snakes grown to 300 segments"""
+    def restart(game):
+        _confirm_full_hands(game)
+        _grow_snakes(game, 300)
+
+    game = _new_game(sound_manager, grid_size=30, snake_speed=0.1,
+                     hand_size=20)
+    restart(game)
+    return _game_step(game, restart)
+
+
+def scenario_party(screen, sound_manager):
+    """Eight 100-segment snakes simulating on the largest grid"""
+    def restart(game):
+        _confirm_full_hands(game)
+        _grow_snakes(game, 100)
+
+    game = _new_game(sound_manager, grid_size=30, snake_speed=0.1,
+                     hand_size=20, num_players=MAX_PLAYERS)
+    restart(game)
+    return _game_step(game, restart)
+
+
+def scenario_huge_board(screen, sound_manager):
+    """Largest board with long snakes while the camera zooms and pans"""
+    def restart(game):
+        _confirm_full_hands(game)
+        _grow_snakes(game, 300)
+
+    game = _new_game(sound_manager, grid_size=MAX_GRID_SIZE, snake_speed=0.1,
+                     hand_size=20, num_players=4)
+    restart(game)
+    step = _game_step(game, restart)
+    frame = [0]
+
+    def camera_step():
+        frame[0] += 1
+        camera = game.camera
+        camera.zoom_at(0.98 if frame[0] % 120 < 60 else 1.02,
+                       camera.viewport.center)
+        camera.pan(7, 3)
+        step()
+    return camera_step
+
+
+def scenario_collisions(screen, sound_manager):
+    """Repeated collision explosions, as many as one every six frames"""
+    particles = ParticleSystem()
+    frame = [0]
+
+    def step():
+        frame[0] += 1
+        if frame[0] % 6 == 0:
+            particles.emit_collision_explosion(
+                random.randint(100, WIDTH - 100),
+                random.randint(100, HEIGHT - 100),
+                BRIGHT_ORANGE, BOLD_COBALT, count=25)
+        screen.fill(DARK_GRAY)
+        particles.update(FRAME_DT_MS / 1000)
+        particles.draw(screen)
+        pygame.display.flip()
+    return step
+
+
+def scenario_confetti_storm(screen, sound_manager):
+    """Win-screen confetti: an opening salvo plus continuous bursts"""
+    particles = ParticleSystem()
+    for _ in range(5):
+        particles.emit_confetti_burst(random.randint(100, WIDTH - 100),
+                                      random.randint(50, 200), count=30)
+
+    def step():
+        particles.emit_confetti_burst(
+            random.randint(100, WIDTH - 100), 0, count=5)
+        screen.fill(DARK_GRAY)
+        particles.update(FRAME_DT_MS / 1000)
+        particles.draw(screen)
+        pygame.display.flip()
+    return step
+
+
+def scenario_main_menu(screen, sound_manager):
+    """Animated main menu background and buttons"""
+    menu = MainMenu(screen, sound_manager)
+
+    def step():
+        menu.handle_events(pygame.event.get())
+        menu.update(FRAME_DT_MS / 1000)
+        menu.draw()
+    return step
+
+
+# name -> (setup function, frame count when --frames isn't given, or None
+# for DEFAULT_FRAMES)
+SCENARIOS = {
+    'max_grid': (scenario_max_grid, None),
+    'big_hand': (scenario_big_hand, None),
+    'long_snakes': (scenario_long_snakes, None),
+    'party': (scenario_party, None),
+    'huge_board': (scenario_huge_board, None),
+    'collisions': (scenario_collisions, None),
+    'confetti_storm': (scenario_confetti_storm, 3 * FPS),
+    'main_menu': (scenario_main_menu, None),
+}
+
+
+def _percentile(ordered, pct):
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(name, screen, sound_manager, frames, seed):
+    """Run one scenario twice: once timed, once under tracemalloc"""
+    setup, default_frames = SCENARIOS[name]
+    if frames is None:
+        frames = default_frames or DEFAULT_FRAMES
+
+    random.seed(seed)
+    step = setup(screen, sound_manager)
+    frame_times = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        step()
+        frame_times.append((time.perf_counter() - frame_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    # Memory pass is separate so tracing overhead doesn't skew the timings
+    random.seed(seed)
+    tracemalloc.start()
+    step = setup(screen, sound_manager)
+    for _ in range(frames):
+        step()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ordered = sorted(frame_times)
+    return {
+        'frames': frames,
+        'fps': round(frames / elapsed, 1),
+        'p50_ms': round(_percentile(ordered, 50), 3),
+        'p95_ms': round(_percentile(ordered, 95), 3),
+        'p99_ms': round(_percentile(ordered, 99), 3),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print per-metric changes against a baseline; return True if regressed"""
+    regressed = False
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name}: no baseline", file=sys.stderr)
+            continue
+        for metric in ('fps', 'p50_ms', 'p95_ms', 'p99_ms', 'peak_kb'):
+            old, new = base.get(metric), metrics[metric]
+            if not old:
+                continue
+            change = (new - old) / old * 100
+            # Higher fps is better; for everything else lower is better
+            worse = -change if metric == 'fps' else change
+            flag = ""
+            if threshold is not None and worse > threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            print(f"{name:<16}{metric:<8}{old:>10} -> {new:<10}"
+                  f"({change:+.1f}%){flag}", file=sys.stderr)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument('-s', '--scenario', action='append',
+                        choices=sorted(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument('-f', '--frames', type=int, default=None,
+                        help=f"frames per scenario (default: {DEFAULT_FRAMES}"
+                             f", or the scenario's own count)")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('-o', '--output', help="write results JSON here")
+    parser.add_argument('-b', '--baseline',
+                        help="baseline JSON to compare against")
+    parser.add_argument('--fail-over', type=float, default=None,
+                        help="exit 1 if any metric is this many percent worse")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    # Decode sounds and music on the loader like the game does, and finish
+    # before timing so no scenario frame pays for a decode
+    loader = get_loader()
+    sound_manager = SoundManager(loader=loader)
+    loader.start()
+    while not loader.done:
+        time.sleep(0.01)
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = run_scenario(name, screen, sound_manager,
+                                     args.frames, args.seed)
+
+    pygame.quit()
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.fail_over):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Offline builder for the CPU player's opening book.
+
+A match always starts from the same two snakes for a given grid size, so
+the best order for a hand depends only on the grid size and which cards
+are in it. This enumerates hand compositions from most to least likely
+under the dealing weights, searches each one against a fixed field of
+random opponent hands on every core, and writes the plans to an indexed
+binary file the game memory-maps (see classes/opening_book.py).
+
+Usage:
+    python build_opening_book.py                       # default grid and hand
+    python build_opening_book.py -g 20 30 -n 5 8 15    # several of each
+    python build_opening_book.py -n 15 --coverage 0.3 --budget 1.0
+"""
+import os
+
+# Must be set before pygame is imported here and in the worker processes
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from config import *
+from classes.card import CardDef, deal_hand
+from classes.card_registry import CARD_REGISTRY, TURN_DIRECTIONS
+from classes.evaluation import Evaluator
+from classes.opening_book import write_book
+from classes.plan_solver import PlanSolver
+from classes.player import start_snakes
+
+# The book is for the CPU's seat in a two player match
+PLAYERS = 2
+SLOT = 1
+
+
+def card_kinds():
+    """Every distinct card that can be dealt, with its chance per card"""
+    total = sum(card_type.weight for card_type in CARD_REGISTRY
+                if card_type.weight > 0)
+    kinds = []
+    for card_type in CARD_REGISTRY:
+        if card_type.weight <= 0:
+            continue
+        if card_type.directional:
+            for direction in TURN_DIRECTIONS:
+                kinds.append((CardDef.get(card_type.name, direction),
+                              card_type.weight / total / len(TURN_DIRECTIONS)))
+        else:
+            kinds.append((CardDef.get(card_type.name),
+                          card_type.weight / total))
+    return kinds
+
+
+def compositions(size, parts):
+    """Every way of splitting size cards over parts kinds"""
+    if parts == 1:
+        yield (size,)
+        return
+    for first in range(size, -1, -1):
+        for rest in compositions(size - first, parts - 1):
+            yield (first,) + rest
+
+
+def likely_hands(size, coverage, limit):
+    """
+    Hand compositions in order of how often they are dealt, until
+    coverage of the probability mass or limit hands.
+
+    Returns ([(probability, hand)], mass covered).
+    """
+    kinds = card_kinds()
+    log_factorial = [math.lgamma(n + 1) for n in range(size + 1)]
+    log_chances = [math.log(chance) for _, chance in kinds]
+    weighted = []
+    for counts in compositions(size, len(kinds)):
+        log_p = log_factorial[size]
+        for count, log_chance in zip(counts, log_chances):
+            log_p += count * log_chance - log_factorial[count]
+        weighted.append((math.exp(log_p), counts))
+    weighted.sort(reverse=True)
+
+    hands = []
+    mass = 0.0
+    for probability, counts in weighted:
+        if mass >= coverage or len(hands) >= limit:
+            break
+        hand = tuple(card for (card, _), count in zip(kinds, counts)
+                     for _ in range(count))
+        hands.append((probability, hand))
+        mass += probability
+    return hands, mass
+
+
+@lru_cache(maxsize=None)
+def opponent_field(size, count, seed):
+    """Orderings of count random hands; the same in every worker"""
+    rng = random.Random(seed)
+    field = []
+    for _ in range(count):
+        hand = deal_hand(size, rng)
+        rng.shuffle(hand)
+        field.append(tuple(hand))
+    return field
+
+
+def solve_hand(job):
+    """Worker: best plan for one hand; returns (grid_size, plan, expected)"""
+    grid_size, hand, budget, opponents, seed = job
+    snakes = start_snakes(grid_size, PLAYERS)
+    me, opponent = snakes[SLOT], snakes[1 - SLOT]
+    solver = PlanSolver(me, opponent, hand, None,
+                        orderings=opponent_field(len(hand), opponents, seed),
+                        evaluator=Evaluator(grid_size))
+    result = solver.deepen(time.perf_counter() + budget)
+    return grid_size, result.plan, result.expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument('-g', '--grid', type=int, nargs='+',
+                        default=[GRID_SIZE], help="grid sizes")
+    parser.add_argument('-n', '--hand', type=int, nargs='+',
+                        default=[MAX_HAND_SIZE], help="hand sizes")
+    parser.add_argument('--coverage', type=float, default=0.5,
+                        help="stop once hands this likely are covered "
+                             "(default: 0.5)")
+    parser.add_argument('--limit', type=int, default=2000,
+                        help="most hands per grid and hand size "
+                             "(default: 2000)")
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help="search seconds per hand (default: 0.5)")
+    parser.add_argument('--opponents', type=int,
+                        default=SOLVER_OPPONENT_SAMPLES,
+                        help="random opponent hands each plan is scored "
+                             "against")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('-o', '--output', default=OPENING_BOOK_FILE)
+    args = parser.parse_args()
+
+    jobs = []
+    for grid_size in args.grid:
+        for size in args.hand:
+            hands, mass = likely_hands(size, args.coverage, args.limit)
+            print(f"grid {grid_size}, {size} cards: {len(hands)} hands, "
+                  f"{mass:.1%} of deals")
+            jobs += [(grid_size, hand, args.budget, args.opponents,
+                      args.seed) for _, hand in hands]
+
+    started = time.perf_counter()
+    entries = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for entry in pool.map(solve_hand, jobs, chunksize=4):
+            entries.append(entry)
+            if len(entries) % 100 == 0 or len(entries) == len(jobs):
+                print(f"\r{len(entries)}/{len(jobs)} hands", end="",
+                      file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    write_book(args.output, entries, players=PLAYERS, slot=SLOT)
+    mean = sum(expected for _, _, expected in entries) / max(1, len(entries))
+    print(f"Wrote {len(entries)} plans to {args.output} in "
+          f"{time.perf_counter() - started:.1f}s "
+          f"(mean expected result {mean:.3f})")
+
+
+if __name__ == "__main__":
+    main()
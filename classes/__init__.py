@@ -1,4 +1,23 @@
-from .game import Game
-from .menu import MainMenu, SettingsMenu
-from .sound_manager import SoundManager
-from .tutorial import TutorialPage
\ No newline at end of file
+import importlib
+
+# Scenes are imported on first use so the first frame only pays for the
+# main menu; `from classes import Game` still works as before.
+_LAZY_IMPORTS = {
+    'Game': '.game',
+    'MainMenu': '.menu',
+    'SettingsMenu': '.settings_menu',
+    'SoundManager': '.sound_manager',
+    'TutorialPage': '.tutorial',
+    'FrameProfiler': '.profiler',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,108 @@
+import pygame
+import threading
+
+
+class AssetLoader:
+    """Loads fonts, sounds and pre-rendered sprites on a worker thread"""
+
+    def __init__(self):
+        self._jobs = []
+        self._events = {}
+        self._results = {}
+        self._errors = {}
+        self._thread = None
+        # SDL_ttf shares one FreeType library; opening faces must be serialized
+        self._font_lock = threading.Lock()
+        self.loaded = 0
+
+    def add(self, key, load_fn):
+        """Queue an asset; must be called before start()"""
+        if key in self._events:
+            return
+        self._events[key] = threading.Event()
+        self._jobs.append((key, load_fn))
+
+    def add_font(self, path, size):
+        self.add(('font', path, size), lambda: self._open_font(path, size))
+
+    def start(self):
+        """Start loading queued assets in order on a daemon thread"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, args=(list(self._jobs),), daemon=True)
+        self._thread.start()
+
+    def _run(self, jobs):
+        for key, load_fn in jobs:
+            try:
+                self._results[key] = load_fn()
+            except Exception as e:
+                print(f"Warning: Could not preload asset {key}: {e}")
+                self._errors[key] = e
+            finally:
+                self.loaded += 1
+                self._events[key].set()
+
+    def get(self, key, load_fn=None):
+        """
+        Return an asset, blocking only until that asset is ready.
+
+        Assets that were never queued (or failed in the worker) are loaded
+        synchronously with load_fn and cached.
+        """
+        if key in self._results:
+            return self._results[key]
+
+        event = self._events.get(key)
+        if event is not None and self._thread is not None:
+            event.wait()
+            if key in self._results:
+                return self._results[key]
+
+        if load_fn is None:
+            raise KeyError(f"Asset not available: {key}")
+        value = load_fn()
+        self._results[key] = value
+        return value
+
+    def is_ready(self, key):
+        return key in self._results or key in self._errors
+
+    def font(self, path, size):
+        """Return a shared Font object for (path, size)"""
+        return self.get(('font', path, size),
+                        lambda: self._open_font(path, size))
+
+    def _open_font(self, path, size):
+        with self._font_lock:
+            return pygame.font.Font(path, size)
+
+    @property
+    def total(self):
+        return len(self._jobs)
+
+    @property
+    def progress(self):
+        """Fraction of queued assets that have finished loading"""
+        return self.loaded / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return self.loaded >= self.total
+
+
+_loader = None
+
+
+def get_loader():
+    """Return the process-wide asset loader"""
+    global _loader
+    if _loader is None:
+        _loader = AssetLoader()
+    return _loader
+
+
+def load_font(path, size):
+    """Shared, cached font lookup used by scenes and widgets"""
+    return get_loader().font(path, size)
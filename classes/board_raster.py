@@ -0,0 +1,155 @@
+import pygame
+from config import *
+
+try:
+    import numpy as np
+except ImportError:  # Optional; without it big boards draw cell by cell
+    np = None
+
+_COLORKEY = (255, 0, 255)
+
+
+class BoardRaster:
+    """
+    Whole board as one palette-indexed image, one pixel per cell.
+
+    Zoomed out on a big board, thousands of cells and segments are in view.
+    Instead of a draw.rect for each, the board is kept as a NumPy array of
+    palette indexes (0 empty, then body and head for each player) that is
+    only repainted where the occupancy grid reports a change. Each frame
+    the visible part is scaled up to the viewport in a single blit, and
+    hiding or showing a snake is just a palette change.
+    """
+
+    available = np is not None
+
+    def __init__(self, occupancy, empty_color=GRASSY_GREEN,
+                 gap_color=DARK_GRAY):
+        self.occupancy = occupancy
+        self.grid_size = occupancy.grid_size
+        self.empty_color = empty_color
+        self.gap_color = gap_color
+
+        # Palette index per cell, indexed by y * grid_size + x like the
+        # occupancy grid; reshaped and transposed to [x, y] for surfarray
+        self.cells = np.zeros(self.grid_size * self.grid_size, dtype=np.uint8)
+        self.surface = pygame.Surface((self.grid_size, self.grid_size),
+                                      depth=8)
+        self.changed = occupancy.watch()
+        self._heads = []      # cell index of each snake's head when painted
+        self._shown = None    # owners whose colors are in the palette
+        self._gaps = None     # colorkeyed lattice of cell gaps
+        self._gaps_key = None
+        self._repaint_all()
+
+    def covers(self, camera):
+        """True when cells are small enough on screen to draw as an image"""
+        return camera.active and camera.step * camera.zoom <= RASTER_MAX_CELL_PX
+
+    def _repaint_all(self):
+        cells = self.cells
+        cells.fill(0)
+        # Lower owners win shared cells, so paint them last
+        for owner in reversed(range(len(self.occupancy.owned))):
+            owned = self.occupancy.owned[owner]
+            if owned:
+                cells[np.fromiter(owned, dtype=np.intp)] = 1 + 2 * owner
+        self._heads = self._head_cells()
+        for owner in reversed(range(len(self._heads))):
+            cells[self._heads[owner]] = 2 + 2 * owner
+        self.changed.clear()
+        self._upload()
+
+    def _head_cells(self):
+        size = self.grid_size
+        return [snake.segments[0][1] * size + snake.segments[0][0]
+                for snake in self.occupancy.snakes]
+
+    def _upload(self):
+        size = self.grid_size
+        pygame.surfarray.blit_array(self.surface,
+                                    self.cells.reshape(size, size).T)
+
+    def _flush(self):
+        """Repaint the cells changed since the last frame"""
+        changed = self.changed
+        heads = self._head_cells()
+        if heads != self._heads:
+            # Moves and reversals both change which cell is a head
+            changed.update(self._heads)
+            changed.update(heads)
+            self._heads = heads
+        if not changed:
+            return
+
+        head_owners = {}
+        for owner in reversed(range(len(heads))):
+            head_owners[heads[owner]] = owner
+
+        cells = self.cells
+        counts = self.occupancy.counts
+        owned = self.occupancy.owned
+        for index in changed:
+            owner = head_owners.get(index)
+            if owner is not None:
+                cells[index] = 2 + 2 * owner
+                continue
+            value = 0
+            if counts[index]:
+                for owner, owner_cells in enumerate(owned):
+                    if index in owner_cells:
+                        value = 1 + 2 * owner
+                        break
+            cells[index] = value
+        changed.clear()
+        self._upload()
+
+    def _set_shown(self, owners):
+        """Give hidden snakes the empty color"""
+        owners = frozenset(owners)
+        if owners == self._shown:
+            return
+        palette = [self.empty_color]
+        for owner, snake in enumerate(self.occupancy.snakes):
+            if owner in owners:
+                palette += [snake.body_color, snake.head_color]
+            else:
+                palette += [self.empty_color, self.empty_color]
+        self.surface.set_palette(palette)
+        self._shown = owners
+
+    def _gap_lattice(self, camera, step, gap):
+        """Gap lines for a viewport's worth of cells, cached per zoom"""
+        key = (step, gap)
+        if self._gaps_key != key:
+            width = camera.viewport.width + 2 * step
+            height = camera.viewport.height + 2 * step
+            lattice = pygame.Surface((width, height))
+            lattice.fill(_COLORKEY)
+            lattice.set_colorkey(_COLORKEY)
+            for offset in range(step - gap, max(width, height), step):
+                lattice.fill(self.gap_color, (offset, 0, gap, height))
+                lattice.fill(self.gap_color, (0, offset, width, gap))
+            self._gaps = lattice
+            self._gaps_key = key
+        return self._gaps
+
+    def draw(self, surface, camera, owners):
+        """Draw the visible cells with only the given owners' snakes shown"""
+        self._flush()
+        self._set_shown(owners)
+
+        first_col, first_row, end_col, end_row = camera.visible_cells()
+        cols = end_col - first_col
+        rows = end_row - first_row
+        step = round(camera.step * camera.zoom)
+        area = self.surface.subsurface((first_col, first_row, cols, rows))
+        x, y = camera.cell_to_screen(first_col, first_row)
+        position = (round(x), round(y))
+        surface.blit(pygame.transform.scale(area, (cols * step, rows * step)),
+                     position)
+
+        gap = step - max(1, round(CELL_SIZE * camera.zoom))
+        if gap > 0:
+            surface.blit(self._gap_lattice(camera, step, gap), position,
+                         (0, 0, cols * step, rows * step))
@@ -1,6 +1,7 @@
 import pygame
 import time
 from util import draw_text
+from .asset_loader import load_font
 
 class Button:
     def __init__(self, x, y, width, height, function, *,
@@ -19,7 +20,7 @@ class Button:
         self.border_color = border_color
         self.border_radius = border_radius
         self.border_width = border_width
-        self.font = pygame.font.Font(font, font_size)
+        self.font = load_font(font, font_size)
         self.text_color = text_color
         self.text = text
         self.function = function
@@ -27,7 +28,7 @@ class Button:
         self.click_sound = click_sound
         self.key_binding = key_binding
         self.tooltip_text = tooltip_text
-        self.tooltip_font = pygame.font.Font(font, tooltip_font_size)
+        self.tooltip_font = load_font(font, tooltip_font_size)
         self.toggle = toggle
         self.is_toggled = False
         self.hold_time = hold_time
@@ -38,32 +39,63 @@ class Button:
         self.clicked = False
         self.was_hovered = False
 
+        # Pre-rendered sprites keyed by visual state, rebuilt only on change
+        self._sprites = {}
+        self._tooltip_cache = None
+
     def draw(self, screen):
         if self.hide_when_disabled and self.disabled:
             return
 
         # Greyed out if disabled
         display_color = (100, 100, 100) if self.disabled else self.color
-        inner_rect = self.rect.inflate(-self.border_width *
-                                       2, -self.border_width * 2)
+        screen.blit(self._get_sprite(display_color), self.rect)
+
+        # Draw tooltip if hovered
+        if self.tooltip_text and self.hovered and not self.disabled:
+            tooltip_surface = self._get_tooltip_surface()
+            tooltip_rect = tooltip_surface.get_rect(
+                midtop=(self.rect.centerx, self.rect.bottom + 5))
+            pygame.draw.rect(screen, (0, 0, 0), tooltip_rect.inflate(10, 6))
+            screen.blit(tooltip_surface, tooltip_rect)
 
-        pygame.draw.rect(screen, self.border_color, self.rect,
+    def _get_sprite(self, display_color):
+        """Return the cached surface for the current visual state"""
+        key = (display_color, self.is_toggled, self.text, self.text_color,
+               self.border_color, self.rect.size)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            # Only a handful of states exist; a text change makes old ones stale
+            if any(k[2] != self.text for k in self._sprites):
+                self._sprites.clear()
+            sprite = self._render_sprite(display_color)
+            self._sprites[key] = sprite
+        return sprite
+
+    def _render_sprite(self, display_color):
+        """Render the button body and label onto a new surface"""
+        sprite = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = sprite.get_rect()
+        inner_rect = local_rect.inflate(-self.border_width *
+                                        2, -self.border_width * 2)
+
+        pygame.draw.rect(sprite, self.border_color, local_rect,
                          border_radius=self.border_radius)
-        pygame.draw.rect(screen, display_color, inner_rect,
+        pygame.draw.rect(sprite, display_color, inner_rect,
                          border_radius=self.border_radius)
 
         # Draw text
-        draw_text(screen, self.text, self.font, self.text_color,
-                  self.rect.center)
+        draw_text(sprite, self.text, self.font, self.text_color,
+                  local_rect.center)
+        return sprite
 
-        # Draw tooltip if hovered
-        if self.tooltip_text and self.hovered and not self.disabled:
+    def _get_tooltip_surface(self):
+        """Return the tooltip surface, re-rendering only if the text changed"""
+        if self._tooltip_cache is None or self._tooltip_cache[0] != self.tooltip_text:
             tooltip_surface = self.tooltip_font.render(
                 self.tooltip_text, True, (255, 255, 255))
-            tooltip_rect = tooltip_surface.get_rect(
-                midtop=(self.rect.centerx, self.rect.bottom + 5))
-            pygame.draw.rect(screen, (0, 0, 0), tooltip_rect.inflate(10, 6))
-            screen.blit(tooltip_surface, tooltip_rect)
+            self._tooltip_cache = (self.tooltip_text, tooltip_surface)
+        return self._tooltip_cache[1]
 
     def update(self, events):
         if self.hide_when_disabled and self.disabled:
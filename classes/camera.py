@@ -0,0 +1,131 @@
+import math
+import pygame
+from config import *
+
+
+def view_cells(grid_size):
+    """Cells across the on-screen board area for a grid of this size"""
+    return min(grid_size, VIEWPORT_CELLS)
+
+
+class Camera:
+    """
+    Scroll and zoom over boards bigger than the on-screen board area.
+
+    Board drawing code works in layout pixels (the grid's top-left plus
+    cell * (CELL_SIZE + GAP)) and converts through apply(). When the whole
+    board fits, the camera is inactive and apply() is the identity, so
+    small boards look exactly as before.
+    """
+
+    def __init__(self, viewport, grid_size, cell_size=CELL_SIZE, gap=GAP):
+        self.viewport = pygame.Rect(viewport)
+        self.grid_size = grid_size
+        self.step = cell_size + gap
+        self.board_px = grid_size * self.step - gap
+        self.active = self.board_px > self.viewport.width
+
+        # Never zoom out further than showing the whole board
+        fit_zoom = self.viewport.width / self.board_px
+        self.min_zoom = min(1.0, max(CAMERA_MIN_ZOOM, fit_zoom))
+        # Requested zoom, and the zoom actually used: snapped so a cell step
+        # is a whole number of pixels and cached grid tiles line up exactly
+        self.scale = 1.0
+        self.zoom = 1.0
+        # Board pixel shown at the viewport's top-left corner
+        self.x = 0.0
+        self.y = 0.0
+        self._dragging = False
+
+    def apply(self, x, y):
+        """Convert layout pixels to screen pixels"""
+        if not self.active:
+            return x, y
+        left, top = self.viewport.topleft
+        return (left + (x - left - self.x) * self.zoom,
+                top + (y - top - self.y) * self.zoom)
+
+    def cell_to_screen(self, gx, gy):
+        """Screen position of a cell's top-left corner"""
+        left, top = self.viewport.topleft
+        return (left + (gx * self.step - self.x) * self.zoom,
+                top + (gy * self.step - self.y) * self.zoom)
+
+    def visible_cells(self, margin=0):
+        """(first col, first row, end col, end row) inside the viewport"""
+        if not self.active:
+            return 0, 0, self.grid_size, self.grid_size
+        width = self.viewport.width / self.zoom
+        height = self.viewport.height / self.zoom
+        first_col = max(0, int(self.x // self.step) - margin)
+        first_row = max(0, int(self.y // self.step) - margin)
+        end_col = min(self.grid_size,
+                      math.ceil((self.x + width) / self.step) + margin)
+        end_row = min(self.grid_size,
+                      math.ceil((self.y + height) / self.step) + margin)
+        return first_col, first_row, end_col, end_row
+
+    def _clamp(self):
+        for axis, size in (('x', self.viewport.width),
+                           ('y', self.viewport.height)):
+            limit = self.board_px - size / self.zoom
+            if limit < 0:
+                # Board smaller than the view at this zoom: keep it centered
+                setattr(self, axis, limit / 2)
+            else:
+                setattr(self, axis, max(0.0, min(limit, getattr(self, axis))))
+
+    def pan(self, dx, dy):
+        """Scroll by a distance in screen pixels"""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self._clamp()
+
+    def zoom_at(self, factor, screen_pos):
+        """Zoom keeping the board point under screen_pos in place"""
+        left, top = self.viewport.topleft
+        board_x = self.x + (screen_pos[0] - left) / self.zoom
+        board_y = self.y + (screen_pos[1] - top) / self.zoom
+        self.scale = max(self.min_zoom,
+                         min(CAMERA_MAX_ZOOM, self.scale * factor))
+        self.zoom = max(1, round(self.step * self.scale)) / self.step
+        self.x = board_x - (screen_pos[0] - left) / self.zoom
+        self.y = board_y - (screen_pos[1] - top) / self.zoom
+        self._clamp()
+
+    def center_on(self, cell):
+        """Scroll so a cell sits in the middle of the viewport"""
+        if not self.active:
+            return
+        self.x = (cell[0] + 0.5) * self.step - self.viewport.width / self.zoom / 2
+        self.y = (cell[1] + 0.5) * self.step - self.viewport.height / self.zoom / 2
+        self._clamp()
+
+    def handle_event(self, event):
+        """Mouse wheel zooms; right or middle drag pans"""
+        if not self.active:
+            return
+        if event.type == pygame.MOUSEWHEEL:
+            pos = pygame.mouse.get_pos()
+            if self.viewport.collidepoint(pos):
+                self.zoom_at(CAMERA_ZOOM_STEP ** event.y, pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button in (2, 3):
+            self._dragging = self.viewport.collidepoint(event.pos)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button in (2, 3):
+            self._dragging = False
+        elif event.type == pygame.MOUSEMOTION and self._dragging:
+            self.pan(-event.rel[0], -event.rel[1])
+
+    def update(self, dt):
+        """WASD pans, +/- zoom around the viewport center"""
+        if not self.active:
+            return
+        keys = pygame.key.get_pressed()
+        dx = (keys[pygame.K_d] - keys[pygame.K_a]) * CAMERA_PAN_SPEED * dt
+        dy = (keys[pygame.K_s] - keys[pygame.K_w]) * CAMERA_PAN_SPEED * dt
+        if dx or dy:
+            self.pan(dx, dy)
+        zoom = keys[pygame.K_EQUALS] - keys[pygame.K_MINUS]
+        if zoom:
+            self.zoom_at(CAMERA_ZOOM_STEP ** (zoom * dt * 10),
+                         self.viewport.center)
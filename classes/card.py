@@ -1,29 +1,144 @@
 import pygame
+import random
 from config import *
 from util import draw_text
+from .asset_loader import get_loader, load_font
+from .card_registry import CARD_REGISTRY, TURN_DIRECTIONS
+
+
+def render_card_face(text, selected):
+    """Render a card's background, border and label to its own surface"""
+    face = pygame.Surface((CARD_WIDTH, CARD_HEIGHT), pygame.SRCALPHA)
+    rect = face.get_rect()
+    color = CARD_UNSELECTED if not selected else CARD_SELECTED
+    pygame.draw.rect(face, color, rect, border_radius=10)
+    pygame.draw.rect(face, (50, 50, 80), rect, width=3, border_radius=10)
+
+    font = load_font(MINECRAFT_FONT, 14)
+    draw_text(face, text.replace(" ", "\n"), font, BLACK, rect.center)
+    return face
+
+
+def build_card_faces():
+    """Pre-render every card face in both selection states"""
+    texts = []
+    for card_type in CARD_REGISTRY:
+        if card_type.directional:
+            texts += [f"{card_type.label}\n{direction}"
+                      for direction in TURN_DIRECTIONS]
+        else:
+            texts.append(card_type.label)
+    return {(text, selected): render_card_face(text, selected)
+            for text in texts for selected in (False, True)}
+
+
+def get_card_face(text, selected):
+    """Look up a card face in the atlas, rendering unknown ones on demand"""
+    faces = get_loader().get('card_faces', build_card_faces)
+    face = faces.get((text, selected))
+    if face is None:
+        face = render_card_face(text, selected)
+        faces[(text, selected)] = face
+    return face
+
+
+class CardDef:
+    """
+    Immutable game data for one kind of card.
+
+    Only a handful of distinct cards exist, so instances are shared
+    flyweights obtained through CardDef.get(); hands used for simulation or
+    AI are plain lists of these and never touch pygame.
+    """
+
+    __slots__ = ('card_type', 'effect', 'direction', 'text')
+    _instances = {}
+
+    def __init__(self, effect, direction=None):
+        card_type = CARD_REGISTRY.get(effect)
+        text = card_type.label
+        if direction is not None:
+            text = f"{text}\n{direction}"
+        object.__setattr__(self, 'card_type', card_type)
+        object.__setattr__(self, 'effect', effect)
+        object.__setattr__(self, 'direction', direction)
+        object.__setattr__(self, 'text', text)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CardDef is immutable")
+
+    def __repr__(self):
+        if self.direction is None:
+            return f"CardDef({self.effect!r})"
+        return f"CardDef({self.effect!r}, {self.direction!r})"
+
+    def __reduce__(self):
+        # Unpickling goes back through the flyweight cache
+        return (CardDef.get, (self.effect, self.direction))
+
+    @classmethod
+    def get(cls, effect, direction=None):
+        """Return the shared instance for (effect, direction)"""
+        key = (effect, direction)
+        card = cls._instances.get(key)
+        if card is None:
+            card = cls._instances[key] = cls(effect, direction)
+        return card
+
+    @property
+    def tooltip(self):
+        return self.card_type.tooltip
+
+    def execute(self, snake=None):
+        """
+        Executes the card's effect.
+        """
+        self.card_type.effect(snake, self.direction)
+
+
+def deal_hand(size, rng=random):
+    """Deal a hand of shared CardDefs using the registered weights"""
+    hand = []
+    for name in CARD_REGISTRY.draw_names(size, rng):
+        if CARD_REGISTRY.get(name).directional:
+            hand.append(CardDef.get(name, rng.choice(TURN_DIRECTIONS)))
+        else:
+            hand.append(CardDef.get(name))
+    return hand
 
 
 class Card:
-    def __init__(self, x, y, text, effect, direction=None):
-        self.direction = direction
-        self.effect = effect
+    """On-screen view of a CardDef: position and selection state"""
+
+    __slots__ = ('definition', 'rect', 'selected', 'to_remove')
+
+    def __init__(self, definition, x=0, y=0):
+        self.definition = definition
         self.rect = pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
-        self.text = text
         self.selected = False
         self.to_remove = False
 
+    @property
+    def effect(self):
+        return self.definition.effect
+
+    @property
+    def direction(self):
+        return self.definition.direction
+
+    @property
+    def text(self):
+        return self.definition.text
+
+    @property
+    def tooltip(self):
+        return self.definition.tooltip
+
     def __repr__(self):
-        return f"Card(text={self.text.replace("\n", " ")}, effect={self.effect}, direction={self.direction}, selected={self.selected})"
+        return f"Card({self.definition!r}, selected={self.selected})"
 
     def draw(self, surface):
-        color = CARD_UNSELECTED if not self.selected else CARD_SELECTED
-        pygame.draw.rect(surface, color, self.rect, border_radius=10)
-        pygame.draw.rect(surface, (50, 50, 80), self.rect,
-                         width=3, border_radius=10)
-
-        font = pygame.font.Font(MINECRAFT_FONT, 14)
-        draw_text(surface, self.text.replace(" ", "\n"),
-                  font, BLACK, self.rect.center)
+        surface.blit(get_card_face(self.text, self.selected), self.rect)
 
     def handle_click(self, pos):
         if self.rect.collidepoint(pos):
@@ -35,21 +150,4 @@ class Card:
         """
         Executes the card's effect.
         """
-        if self.effect == "Move":
-            if self.direction:
-                snake.turn(self.direction)
-                snake.move()
-        elif self.effect == "Double Move":
-            snake.move()
-            snake.move()
-        elif self.effect == "Grow":
-            snake.grow()
-            snake.move()
-        elif self.effect == "Shrink":
-            snake.shrink()
-            snake.move()
-        elif self.effect == "Reverse":
-            snake.reverse()
-            snake.move()
-        elif self.effect == "Skip":
-            pass
\ No newline at end of file
+        self.definition.execute(snake)
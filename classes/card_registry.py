@@ -0,0 +1,177 @@
+import importlib
+import json
+import os
+from config import *
+
+# Directions a directional card can be dealt with
+TURN_DIRECTIONS = ("right", "left")
+
+
+class CardType:
+    """Everything the game needs to know about one kind of card"""
+
+    __slots__ = ('name', 'effect', 'weight', 'label', 'tooltip', 'directional')
+
+    def __init__(self, name, effect, weight, label=None, tooltip="",
+                 directional=False):
+        self.name = name
+        # effect(snake, direction) applies the card; direction is None
+        # unless the card is directional
+        self.effect = effect
+        self.weight = weight
+        self.label = label or name
+        self.tooltip = tooltip
+        self.directional = directional
+
+    def __repr__(self):
+        return f"CardType({self.name!r}, weight={self.weight})"
+
+
+def _move(snake, direction):
+    snake.turn(direction)
+    snake.move()
+
+
+def _double_move(snake, direction):
+    snake.move()
+    snake.move()
+
+
+def _grow(snake, direction):
+    snake.grow()
+    snake.move()
+
+
+def _shrink(snake, direction):
+    snake.shrink()
+    snake.move()
+
+
+def _reverse(snake, direction):
+    snake.reverse()
+    snake.move()
+
+
+def _skip(snake, direction):
+    pass
+
+
+# Snake actions a custom card can chain together with "steps"
+STEP_ACTIONS = {
+    'turn': lambda snake, direction: snake.turn(direction),
+    'move': lambda snake, direction: snake.move(),
+    'grow': lambda snake, direction: snake.grow(),
+    'shrink': lambda snake, direction: snake.shrink(),
+    'reverse': lambda snake, direction: snake.reverse(),
+}
+
+
+class CardRegistry:
+    """Dispatch table of card types, in registration order"""
+
+    def __init__(self):
+        self._types = {}
+        self._names = None
+        self._cum_weights = None
+
+    def register(self, name, effect, weight, label=None, tooltip="",
+                 directional=False):
+        """Add or replace a card type"""
+        card_type = CardType(name, effect, weight, label, tooltip, directional)
+        self._types[name] = card_type
+        self._names = None
+        self._cum_weights = None
+        return card_type
+
+    def unregister(self, name):
+        del self._types[name]
+        self._names = None
+        self._cum_weights = None
+
+    def get(self, name):
+        return self._types[name]
+
+    def __contains__(self, name):
+        return name in self._types
+
+    def __iter__(self):
+        return iter(self._types.values())
+
+    def __len__(self):
+        return len(self._types)
+
+    def _build_weights(self):
+        self._names = []
+        self._cum_weights = []
+        total = 0
+        for card_type in self._types.values():
+            if card_type.weight <= 0:
+                continue
+            total += card_type.weight
+            self._names.append(card_type.name)
+            self._cum_weights.append(total)
+
+    def draw_names(self, size, rng):
+        """Pick `size` card type names at random by weight"""
+        if self._names is None:
+            self._build_weights()
+        return rng.choices(self._names, cum_weights=self._cum_weights, k=size)
+
+    def load(self, path):
+        """
+        Register custom cards from a JSON file.
+
+        The file holds a list of objects with "name", "weight" and optional
+        "label", "tooltip" and "directional" keys, plus either "steps" (a
+        list of snake actions from STEP_ACTIONS, run in order) or
+        "function" ("module:function" taking (snake, direction)).
+        """
+        with open(path) as f:
+            entries = json.load(f)
+
+        loaded = []
+        for entry in entries:
+            name = entry['name']
+            if 'function' in entry:
+                module_name, _, attr = entry['function'].partition(':')
+                effect = getattr(importlib.import_module(module_name), attr)
+            else:
+                effect = _chain_steps(name, entry.get('steps', []))
+            self.register(name, effect, entry.get('weight', 0),
+                          label=entry.get('label'),
+                          tooltip=entry.get('tooltip', ""),
+                          directional=entry.get('directional', False))
+            loaded.append(name)
+        return loaded
+
+
+def _chain_steps(name, steps):
+    try:
+        actions = tuple(STEP_ACTIONS[step] for step in steps)
+    except KeyError as e:
+        raise ValueError(f"Card {name!r} has unknown step {e.args[0]!r}")
+
+    def effect(snake, direction):
+        for action in actions:
+            action(snake, direction)
+    return effect
+
+
+CARD_REGISTRY = CardRegistry()
+CARD_REGISTRY.register("Move", _move, 40, tooltip="Turn and move forward",
+                       directional=True)
+CARD_REGISTRY.register("Grow", _grow, 15, tooltip="Add a segment and move")
+CARD_REGISTRY.register("Shrink", _shrink, 15,
+                       tooltip="Remove tail segment and move")
+CARD_REGISTRY.register("Double Move", _double_move, 20,
+                       tooltip="Move forward twice")
+CARD_REGISTRY.register("Reverse", _reverse, 5,
+                       tooltip="Reverse snake direction")
+CARD_REGISTRY.register("Skip", _skip, 5, tooltip="Do nothing")
+
+if os.path.exists(CUSTOM_CARDS_FILE):
+    try:
+        CARD_REGISTRY.load(CUSTOM_CARDS_FILE)
+    except Exception as e:
+        print(f"Warning: Could not load custom cards from "
+              f"{CUSTOM_CARDS_FILE}: {e}")
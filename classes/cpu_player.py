@@ -0,0 +1,290 @@
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from types import SimpleNamespace
+from config import *
+from .player import Player
+from .plan_solver import PlanSolver
+from .evaluation import Evaluator
+
+
+def _snake_state(snake):
+    """Picklable copy of the fields a GhostSnake is built from"""
+    return SimpleNamespace(segments=tuple(snake.segments),
+                           direction=snake.direction,
+                           new_direction=tuple(snake.new_direction),
+                           grid_size=snake.grid_size)
+
+
+def _watch_cancel(solver, job, cancelled, finished):
+    """Keep stopping the solver once its job is cancelled"""
+    while not finished.wait(CPU_CANCEL_POLL):
+        if cancelled.value >= job:
+            solver.stop()
+
+
+def _search_process(requests, results, cancelled):
+    """
+    Search process main loop: one search per request until None arrives.
+
+    Every deepening pass is sent back as (job, PlanResult) and the end of
+    a search as (job, None). Jobs up to cancelled are skipped or stopped.
+    """
+    # Ctrl+C is the game's to handle; it stops this process when it quits
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(os, 'nice'):
+        os.nice(CPU_SEARCH_NICENESS)
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            request = requests.get(timeout=1.0)
+        except queue.Empty:
+            # Don't outlive a game that was killed
+            if not parent.is_alive():
+                return
+            continue
+        if request is None:
+            return
+        job, snake, opponent, hand, opponent_hand, seconds, weights = request
+        if cancelled.value >= job:
+            continue
+        deadline = time.perf_counter() + seconds
+        finished = threading.Event()
+        try:
+            solver = PlanSolver(snake, opponent, hand, opponent_hand,
+                                evaluator=Evaluator(snake.grid_size, weights))
+            threading.Thread(target=_watch_cancel,
+                             args=(solver, job, cancelled, finished),
+                             daemon=True).start()
+            solver.deepen(deadline,
+                          progress=lambda result: results.put((job, result)))
+        except Exception as e:
+            print(f"Warning: CPU search failed: {e}")
+        finally:
+            finished.set()
+            results.put((job, None))
+
+
+class SearchWorker:
+    """
+    Process the CPU players' searches run in.
+
+    A search on a thread of the game's own process holds the GIL for most
+    of every frame it overlaps; in a process of its own, at a lower
+    priority, it only takes the time the frames leave over. Searches run
+    one at a time and are numbered, so results of an abandoned one are
+    told apart and dropped.
+
+    The process is spawned rather than forked on every platform, so it
+    starts clean instead of with a copy of the game's SDL state.
+    """
+
+    def __init__(self):
+        context = multiprocessing.get_context('spawn')
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._cancelled = context.Value('q', 0)
+        self._jobs = 0
+        self._inbox = {}  # job -> results not yet collected
+        self._process = context.Process(
+            target=_search_process,
+            args=(self._requests, self._results, self._cancelled),
+            daemon=True)
+        self._process.start()
+
+    @property
+    def alive(self):
+        return self._process.is_alive()
+
+    def submit(self, snake, opponent, hand, opponent_hand, seconds,
+               weights=None):
+        """Queue a search; returns its job number"""
+        self._jobs += 1
+        self._requests.put((self._jobs, _snake_state(snake),
+                            _snake_state(opponent), list(hand),
+                            list(opponent_hand), seconds, weights))
+        return self._jobs
+
+    def cancel(self, job):
+        """Stop a search, or skip it if it hasn't started"""
+        with self._cancelled.get_lock():
+            self._cancelled.value = max(self._cancelled.value, job)
+        self._inbox.pop(job, None)
+
+    def receive(self, job):
+        """Results of job that arrived since the last call; never blocks"""
+        while True:
+            try:
+                other, result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if other > self._cancelled.value:
+                self._inbox.setdefault(other, []).append(result)
+        return self._inbox.pop(job, [])
+
+
+_worker = None
+
+
+def get_search_worker():
+    """Return the process-wide search worker, starting it if needed"""
+    global _worker
+    if _worker is None or not _worker.alive:
+        _worker = SearchWorker()
+    return _worker
+
+
+class CpuPlanner:
+    """
+    Anytime plan search for one turn, run by the search worker.
+
+    The solver deepens until the time budget is spent, sending back its
+    best plan after every pass; update() takes them in without waiting,
+    so result is usable from the first few milliseconds on. A hand the
+    opening book has a plan for needs no search at all.
+    """
+
+    def __init__(self, snake, opponent, hand, opponent_hand, budget,
+                 weights=None, book=None):
+        self.hand = list(hand)
+        self.budget = budget
+        self.result = None  # best PlanResult so far
+        self.done = False
+        self.started = time.perf_counter()
+
+        self.book_plan = None
+        entry = book.lookup(snake.grid_size, self.hand) if book else None
+        if entry is not None and sorted(entry[0], key=repr) == \
+                sorted(self.hand, key=repr):
+            self.book_plan = entry[0]
+            self.done = True
+            return
+        self._worker = get_search_worker()
+        self._job = self._worker.submit(snake, opponent, self.hand,
+                                        opponent_hand, budget, weights)
+
+    def update(self):
+        """Take in the passes the worker finished since the last call"""
+        if self.done:
+            return
+        for result in self._worker.receive(self._job):
+            if result is None:
+                self.done = True
+            else:
+                self.result = result
+        if not self.done and not self._worker.alive:
+            print("Warning: CPU search process exited")
+            self.done = True
+
+    def stop(self):
+        """Abandon the search; the worker drops it at its next check"""
+        if not self.done:
+            self._worker.cancel(self._job)
+            self.done = True
+
+    @property
+    def progress(self):
+        """Fraction of the time budget used"""
+        if self.done:
+            return 1.0
+        return min(1.0, (time.perf_counter() - self.started) / self.budget)
+
+    @property
+    def depth(self):
+        if self.book_plan is not None:
+            return len(self.hand)
+        return self.result.depth if self.result else 0
+
+    @property
+    def plan(self):
+        """Best plan found, or the hand as dealt if the search failed"""
+        if self.book_plan is not None:
+            return self.book_plan
+        return self.result.plan if self.result else tuple(self.hand)
+
+
+class CpuPlayer(Player):
+    """
+    Player whose cards are chosen by a search instead of the mouse.
+
+    It knows which cards its opponent holds but not the order they were
+    played in. Once the search is done its cards are picked one at a time
+    with the usual animation.
+    """
+
+    is_cpu = True
+
+    def __init__(self, *args, level=1, weights=None, book=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cpu_level = level  # index into CPU_LEVELS
+        self.budget = CPU_LEVELS[level][1]
+        self.weights = weights
+        # OpeningBook to take plans from, when it covers this seat
+        self.book = book
+        self.opponent = None  # Player the search plays against
+        self.planner = None
+        self._picks = None    # CardDefs still to pick, in plan order
+        # Start the search process now rather than on the first CPU turn
+        get_search_worker()
+
+    @property
+    def thinking(self):
+        return self.planner is not None and not self.planner.done
+
+    @property
+    def ready(self):
+        """Every planned card has been picked and has landed"""
+        return self._picks == [] and self.hand_empty()
+
+    def handle_events(self, event):
+        """Input goes to the human players only"""
+
+    def update(self):
+        if not self.confirmed:
+            if self.planner is None:
+                self._start_planning()
+            elif self._picks is None:
+                self.planner.update()
+                if self.planner.done:
+                    self._picks = list(self.planner.plan)
+            # One card in flight at a time, like a player clicking
+            if self._picks and not any(card.to_remove
+                                       for card in self.hand.cards):
+                self._pick(self._picks.pop(0))
+        super().update()
+
+    def _start_planning(self):
+        # A resumed match may have cards picked before the save
+        while self.chosen_cards:
+            self.undo_move()
+        opponent = self.opponent
+        opponent_hand = [card.definition for card in
+                         opponent.hand.cards + opponent.chosen_cards]
+        # Sorted so the opponent's picking order can't leak into the search
+        opponent_hand.sort(key=repr)
+        self.planner = CpuPlanner(
+            self.snake, opponent.snake,
+            [card.definition for card in self.hand.cards], opponent_hand,
+            self.budget, self.weights, self.book)
+
+    def _pick(self, definition):
+        for card in self.hand.cards:
+            if card.definition is definition and not card.to_remove:
+                card.to_remove = True
+                if self.hand.sound_manager:
+                    self.hand.sound_manager.play_sound('card_select')
+                return
+
+    def cancel(self):
+        """Stop any search in progress"""
+        if self.planner is not None:
+            self.planner.stop()
+        self.planner = None
+        self._picks = None
+
+    def restore(self, snapshot):
+        self.cancel()
+        super().restore(snapshot)
@@ -0,0 +1,90 @@
+import json
+import os
+from collections import deque
+from config import *
+from .torus import axis_distances
+
+# Features the weights apply to, each scaled to roughly [-1, 1]
+FEATURES = ('outcome', 'length', 'area', 'distance')
+
+_tuned = None
+
+
+def tuned_weights(path=AI_WEIGHTS_FILE):
+    """Weights written by tune_ai.py, or {} when there are none"""
+    global _tuned
+    if _tuned is None:
+        _tuned = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    weights = json.load(f)
+                _tuned = {name: float(weights[name])
+                          for name in FEATURES if name in weights}
+            except (OSError, ValueError, TypeError) as e:
+                print(f"Warning: Could not load AI weights from {path}: {e}")
+    return _tuned
+
+
+class Evaluator:
+    """
+    Weighted score of a position part way through a planned hand.
+
+    The search uses it to try promising cards first and to build the
+    greedy plan it starts from, so it decides how good the plan is when
+    the time budget runs out before the search is exact. Features:
+
+    - outcome: wins minus losses so far (draws half) over all opponent
+      orderings
+    - length: how much longer than at the start, over the grid size
+    - area: free cells reachable from the head, up to area_cap, over the cap
+    - distance: mean distance to the undecided opponents' heads, over the
+      grid size
+    """
+
+    def __init__(self, grid_size, weights=None, area_cap=AI_AREA_CAP):
+        self.grid_size = grid_size
+        self.weights = dict(AI_WEIGHTS)
+        self.weights.update(tuned_weights())
+        if weights:
+            self.weights.update(weights)
+        self.area_cap = area_cap
+        self._axis = axis_distances(grid_size)
+
+    def area(self, head, blocked):
+        """Free cells reachable from head, counting at most area_cap"""
+        size = self.grid_size
+        seen = {head}
+        queue = deque([head])
+        count = 0
+        while queue and count < self.area_cap:
+            x, y = queue.popleft()
+            for cell in (((x + 1) % size, y), ((x - 1) % size, y),
+                         (x, (y + 1) % size), (x, (y - 1) % size)):
+                if cell not in seen and cell not in blocked:
+                    seen.add(cell)
+                    queue.append(cell)
+                    count += 1
+        return min(count, self.area_cap)
+
+    def evaluate(self, head, growth, opponent_heads, blocked, outcome):
+        """
+        Score one position.
+
+        growth is the change in length since the plan started, blocked the
+        cells our head must not enter and outcome the signed result so far.
+        """
+        size = self.grid_size
+        weights = self.weights
+        score = weights['outcome'] * outcome
+        score += weights['length'] * growth / size
+        if weights['area']:
+            score += weights['area'] * self.area(head, blocked) / self.area_cap
+        if opponent_heads and weights['distance']:
+            axis = self._axis
+            total = 0
+            for x, y in opponent_heads:
+                total += (axis[(head[0] - x) % size]
+                          + axis[(head[1] - y) % size])
+            score += weights['distance'] * total / len(opponent_heads) / size
+        return score
@@ -4,19 +4,33 @@ import random
 import os
 from config import *
 from .grid import Grid
-from util import Direction, draw_text
-from .player import Player
+from .camera import Camera, view_cells
+from util import draw_text
+from .player import Player, start_position
+from .cpu_player import CpuPlayer
+from .opening_book import get_opening_book
+from .occupancy import OccupancyGrid
+from .board_raster import BoardRaster
+from .minimap import Minimap
 from .card import Card
 from .button import Button
 from .sound_manager import SoundManager
 from .particle import ParticleSystem, SnakeCelebration
+from .profiler import FrameProfiler
+from .asset_loader import load_font
+from .match_state import MatchSnapshot, save_snapshot, delete_snapshot
 
 
 class Game:
-    def __init__(self, sound_manager, game_settings):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Snake Card Battle")
+    def __init__(self, sound_manager, game_settings, profiler=None,
+                 resume_snapshot=None):
+        # Reuse the window the GameManager already opened
+        if not pygame.get_init():
+            pygame.init()
+        self.screen = pygame.display.get_surface()
+        if self.screen is None:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Snake Card Battle")
         self.clock = pygame.time.Clock()
 
         # Initialize sound manager
@@ -25,53 +39,30 @@ class Game:
         # Store settings instance (not dict)
         self.settings = game_settings
 
+        # Frame profiler (shared with other scenes when passed in)
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+
         # Validate settings before use
         self.settings.validate()
 
         # Make the grid in the center of the window
-        grid_width = self.settings.grid_size * \
-            CELL_SIZE + (self.settings.grid_size - 1) * GAP
-        grid_height = self.settings.grid_size * \
-            CELL_SIZE + (self.settings.grid_size - 1) * GAP
-        grid_top_left = ((WIDTH - grid_width) // 2,
-                         (HEIGHT - grid_height) // 2)
-        self.grid = Grid(grid_top_left, CELL_SIZE, self.settings.grid_size,
-                         self.settings.grid_size, color=GRASSY_GREEN, gap=GAP)
-
-        # Start planning music
-        self.sound_manager.play_music('planning', loop=True)
+        self.grid = self._create_grid(self.settings.grid_size)
 
-        player_one_start = (SNAKE_INIT_LENGTH, 0)
-        player_one = Player(
-            "Player 1",
-            start_pos=player_one_start,
-            grid_top_left=grid_top_left,
-            init_direction=Direction.RIGHT,
-            sound_manager=self.sound_manager,
-            max_hand_size=self.settings.hand_size,
-            grid_size=self.settings.grid_size
-        )
-        player_two_start = (self.settings.grid_size - SNAKE_INIT_LENGTH - 1,
-                            self.settings.grid_size - 1)
-        player_two = Player(
-            "Player 2",
-            start_pos=player_two_start,
-            grid_top_left=grid_top_left,
-            init_direction=Direction.LEFT,
-            sound_manager=self.sound_manager,
-            max_hand_size=self.settings.hand_size,
-            grid_size=self.settings.grid_size
-        )
+        # Players, turn and round state are set up by enter(), once a match
+        self.players = []
+        self.grid_size = self.settings.grid_size
 
-        self.players = [player_one, player_two]
-        self.turn = 0
-        self.run_simulation = False
+        # Saved match to continue on the next enter() instead of a new one
+        self.resume_snapshot = resume_snapshot
+        self.autosave_enabled = MATCH_AUTOSAVE
 
         self.particle_system = ParticleSystem()
         self.celebration = None
         self.win_animation_started = False
         self.win_screen_timer = 0
         self.show_win_screen = False
+        self.win_overlay = None
+        self.win_text_surfaces = None
 
         self.replay_button = None
         self.menu_button = None
@@ -124,9 +115,16 @@ class Game:
         self.sound_manager.play_music('planning', loop=True)
 
         while self.running:
-            self.handle_events()
-            self.update()
+            self.profiler.begin_frame()
+            with self.profiler.phase('events'):
+                self.handle_events()
+            with self.profiler.phase('update'):
+                self.update()
             self.draw()
+            # Planning is the idle phase where full collections may run
+            self.profiler.end_frame(
+                particles=len(self.particle_system.particles),
+                idle=not self.run_simulation and not self.show_win_screen)
             self.clock.tick(FPS)
 
         return 'menu' if self.return_to_menu else 'quit'
@@ -139,9 +137,17 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+            self.profiler.handle_event(event)
+            self.camera.handle_event(event)
+            if self.minimap is not None:
+                self.minimap.handle_event(event)
             self.players[self.turn].handle_events(event)
 
-        if not self.run_simulation:
+        if not self.run_simulation and self.players[self.turn].is_cpu:
+            # The CPU confirms by itself once its cards are down
+            if self.players[self.turn].ready:
+                self.confirm_selection()
+        elif not self.run_simulation:
             self.undo_button.update(events)
             self.confirm_button.update(events)
 
@@ -167,16 +173,20 @@ class Game:
         self.dt = self.clock.get_time() / 1000
         self.time += self.dt
 
-        self.particle_system.update(self.dt)
+        self.sound_manager.update(self.dt)
 
+        with self.profiler.phase('particles_update'):
+            self.particle_system.update(self.dt)
+
+        self.camera.update(self.dt)
         for player in self.players:
-            player.snake.update_interpolation(self.dt)
+            player.snake.update_interpolation(self.dt, self.camera)
 
         if not self.run_simulation and all(p.confirmed for p in self.players):
             self.run_simulation = True
             self.sound_manager.play_music('simulation', loop=True, fade_ms=500)
 
-        if self.winner in ("one", "two", "draw", "round_end") and not self.win_animation_started:
+        if self.winner is not None and not self.win_animation_started:
             self.start_win_animation()
 
         if self.show_win_screen:
@@ -191,8 +201,10 @@ class Game:
 
         if self.run_simulation and not self.winner:
             if self.time > self.settings.snake_speed:
+                round_before = self._simulation_round()
                 for player in self.players:
-                    player.update()
+                    if player.state != "lose":
+                        player.update()
 
                 self.sound_manager.play_sound('snake_move')
                 self.winner = "round_end" if any(
@@ -200,41 +212,93 @@ class Game:
                 if not self.winner:
                     self.handle_collisions()
                 self.time = 0
+                if not self.winner \
+                        and self._simulation_round() != round_before:
+                    self.autosave()
         else:
-            self.players[self.turn].update()
+            player = self.players[self.turn]
+            player.update()
 
-            if self.players[self.turn].hand_empty():
+            if player.hand_empty():
                 self.confirm_button.disabled = False
             else:
                 self.confirm_button.disabled = True
 
     def draw(self):
-        self.screen.fill(DARK_GRAY)
-        self.grid.draw(self.screen)
+        profiler = self.profiler
+        # Zoomed far out, the raster draws the grid and snakes in one image
+        use_raster = self.raster is not None and self.raster.covers(self.camera)
+
+        with profiler.phase('grid'):
+            self.screen.fill(DARK_GRAY)
+            # Large boards are clipped to the viewport while the board draws
+            if self.camera.active:
+                self.screen.set_clip(self.camera.viewport)
+            if use_raster:
+                self.raster.draw(self.screen, self.camera,
+                                 self._shown_owners())
+            else:
+                self.grid.draw(self.screen, self.camera)
 
         if self.run_simulation or self.show_win_screen:
-            for player in self.players:
-                if self.show_win_screen and self.celebration and player.snake == self.celebration.snake:
-                    self.celebration.draw(self.screen)
-                else:
-                    player.draw(self.screen)
-            self.draw_card_execution_highlight()
+            with profiler.phase('snakes'):
+                for player in self.players:
+                    if self.show_win_screen and self.celebration and player.snake == self.celebration.snake:
+                        self.celebration.draw(self.screen, self.camera)
+                    else:
+                        player.draw_snake(self.screen, self.camera,
+                                          body=not use_raster)
+                self.screen.set_clip(None)
+            with profiler.phase('cards'):
+                for player in self.players:
+                    if not (self.show_win_screen and self.celebration and player.snake == self.celebration.snake):
+                        player.draw_cards(self.screen)
+                self.draw_card_execution_highlight()
         else:
-            self.players[self.turn].draw(self.screen)
-
-        if not self.run_simulation:
-            self.undo_button.draw(self.screen)
-            self.confirm_button.draw(self.screen)
-
-        self.draw_game_state_overlay()
-        self.draw_snake_length_indicator()
-
-        self.particle_system.draw(self.screen)
-
-        if self.show_win_screen:
-            self.draw_win_screen(self.screen)
-
-        pygame.display.flip()
+            with profiler.phase('snakes'):
+                self.players[self.turn].draw_snake(self.screen, self.camera,
+                                                   body=not use_raster)
+                self.screen.set_clip(None)
+            with profiler.phase('cards'):
+                self.players[self.turn].draw_cards(self.screen)
+
+        if self.camera.active:
+            pygame.draw.rect(self.screen, LIGHT_GRAY,
+                             self.camera.viewport.inflate(4, 4), width=2)
+        if self.minimap is not None:
+            with profiler.phase('ui'):
+                self.minimap.draw(self.screen,
+                                  [self.players[i].snake
+                                   for i in self._shown_owners()])
+
+        with profiler.phase('ui'):
+            if not self.run_simulation and not self.players[self.turn].is_cpu:
+                self.undo_button.draw(self.screen)
+                self.confirm_button.draw(self.screen)
+
+            self.draw_game_state_overlay()
+            self.draw_snake_length_indicator()
+
+        with profiler.phase('particles_draw'):
+            self.particle_system.draw(self.screen)
+
+        with profiler.phase('ui'):
+            if self.show_win_screen:
+                self.draw_win_screen(self.screen)
+
+            profiler.draw(self.screen)
+
+        with profiler.phase('flip'):
+            pygame.display.flip()
+
+    def _shown_owners(self):
+        """Players whose snakes the board shows this frame"""
+        if not (self.run_simulation or self.show_win_screen):
+            return (self.turn,)
+        # The celebrating snake is drawn on its own
+        return tuple(i for i, player in enumerate(self.players)
+                     if not (self.celebration
+                             and player.snake == self.celebration.snake))
 
     def undo_last_move(self):
         self.sound_manager.play_sound('undo')
@@ -244,70 +308,152 @@ class Game:
         self.sound_manager.play_sound('card_confirm')
         self.players[self.turn].confirmed = True
         self.turn = (self.turn + 1) % len(self.players)
+        self.camera.center_on(self.players[self.turn].snake.segments[0])
+        self.autosave()
+
+    def snapshot(self):
+        """Capture the match as an immutable MatchSnapshot"""
+        return MatchSnapshot(
+            tuple(player.snapshot() for player in self.players),
+            self.turn, self.run_simulation, self.winner, self.time,
+            self.grid_size)
+
+    def restore(self, snapshot):
+        """Return the match to a captured state"""
+        # The table is rebuilt as saved, whatever the settings are now; the
+        # settings themselves are left for the next new match
+        seats = [player.cpu_level for player in snapshot.players]
+        if snapshot.grid_size != self.grid_size \
+                or seats != [player.cpu_level for player in self.players]:
+            self.reset(snapshot.grid_size, seats)
+
+        for player, player_snapshot in zip(self.players, snapshot.players):
+            player.restore(player_snapshot)
+        self.occupancy.rebuild()
+
+        self.turn = snapshot.turn
+        self.run_simulation = snapshot.run_simulation
+        self.winner = snapshot.winner
+        self.winner_index = next((i for i, player in enumerate(self.players)
+                                  if player.state == "win"), None)
+        self.time = snapshot.time
+        self.camera.center_on(self.players[self.turn].snake.segments[0])
+        self.win_animation_started = False
+        self.show_win_screen = False
+        self.win_screen_timer = 0
+        self.celebration = None
+
+        if self.run_simulation:
+            self.sound_manager.play_music('simulation', loop=True)
+
+    def _simulation_round(self):
+        """Round the card executors are on; 0 before the simulation"""
+        return max((player.card_exec.round for player in self.players
+                    if player.card_exec is not None), default=0)
+
+    def autosave(self):
+        """
+        Write the match in progress to MATCH_SAVE_FILE.
+
+        Called at turn and simulation round boundaries only: every save
+        waits for the disk, which is too slow for every tick or card pick.
+        """
+        if not self.autosave_enabled:
+            return
+        try:
+            save_snapshot(self.snapshot())
+        except OSError as e:
+            print(f"Warning: Could not save match: {e}")
 
     def handle_collisions(self):
-        """Enhanced collision detection with particle effects"""
-        snake1 = self.players[0].snake
-        snake2 = self.players[1].snake
-
-        snake1_head_hit = snake1.segments[0] in snake2.segments
-        snake2_head_hit = snake2.segments[0] in snake1.segments
-
-        collision_occurred = False
-        collision_positions = []
-
-        if snake1_head_hit:
-            collision_occurred = True
-            head_pos = snake1.segments[0]
-            grid_x, grid_y = snake1.grid_top_left
-            screen_x = grid_x + head_pos[0] * \
-                (CELL_SIZE + GAP) + CELL_SIZE // 2
-            screen_y = grid_y + head_pos[1] * \
-                (CELL_SIZE + GAP) + CELL_SIZE // 2
-            collision_positions.append(
-                (screen_x, screen_y, BRIGHT_ORANGE, BOLD_COBALT))
-
-        if snake2_head_hit:
-            collision_occurred = True
-            head_pos = snake2.segments[0]
-            grid_x, grid_y = snake2.grid_top_left
-            screen_x = grid_x + head_pos[0] * \
-                (CELL_SIZE + GAP) + CELL_SIZE // 2
-            screen_y = grid_y + head_pos[1] * \
-                (CELL_SIZE + GAP) + CELL_SIZE // 2
-            collision_positions.append(
-                (screen_x, screen_y, BOLD_COBALT, BRIGHT_ORANGE))
-
-        if collision_occurred:
-            self.sound_manager.play_sound('collision')
-            for x, y, color1, color2 in collision_positions:
-                self.particle_system.emit_collision_explosion(
-                    x, y, color1, color2, count=25)
-
-        if snake1_head_hit and snake2_head_hit:
+        """Resolve head hits for every snake still in play"""
+        alive = [i for i, player in enumerate(self.players)
+                 if player.state != "lose"]
+        crashed = self.occupancy.find_crashes(alive)
+        if not crashed:
+            return
+
+        self.sound_manager.play_sound('collision')
+        for owner in crashed:
+            snake = self.players[owner].snake
+            head_pos = snake.segments[0]
+            # Color the explosion with whoever was hit
+            hit_owner = next(o for o in self.occupancy.owners_at(head_pos)
+                             if o != owner)
+            screen_x, screen_y = self._board_to_screen(snake, head_pos)
+            self.particle_system.emit_collision_explosion(
+                screen_x, screen_y, snake.head_color,
+                self.players[hit_owner].snake.head_color, count=25)
+
+        # Crashed snakes stay on the board as obstacles
+        for owner in crashed:
+            self.players[owner].state = "lose"
+        survivors = [i for i in alive if i not in crashed]
+
+        if not survivors:
             self.winner = "draw"
-            self.players[0].state = "draw"
-            self.players[1].state = "draw"
-        elif snake1_head_hit:
-            self.winner = "two"
-            self.players[0].state = "lose"
-            self.players[1].state = "win"
-        elif snake2_head_hit:
-            self.winner = "one"
-            self.players[0].state = "win"
-            self.players[1].state = "lose"
-
-    def replay_game(self):
-        """Reset game for replay"""
-        self.reset()
+            for owner in crashed:
+                self.players[owner].state = "draw"
+        elif len(survivors) == 1:
+            self.winner = "win"
+            self.winner_index = survivors[0]
+            self.players[survivors[0]].state = "win"
+
+    def _create_grid(self, grid_size):
+        """Build a grid centered in the window for a grid size"""
+        # Boards bigger than the view are shown through a camera, so only
+        # the visible part takes up screen space
+        cells = view_cells(grid_size)
+        grid_width = cells * CELL_SIZE + (cells - 1) * GAP
+        grid_height = cells * CELL_SIZE + (cells - 1) * GAP
+        grid_top_left = ((WIDTH - grid_width) // 2,
+                         (HEIGHT - grid_height) // 2)
+        self.camera = Camera((*grid_top_left, grid_width, grid_height),
+                             grid_size)
+        return Grid(grid_top_left, CELL_SIZE, grid_size, grid_size,
+                    color=GRASSY_GREEN, gap=GAP)
+
+    def _board_to_screen(self, snake, cell):
+        """Screen position of the center of a cell"""
+        grid_x, grid_y = snake.grid_top_left
+        x, y = self.camera.apply(grid_x + cell[0] * (CELL_SIZE + GAP),
+                                 grid_y + cell[1] * (CELL_SIZE + GAP))
+        half_cell = CELL_SIZE * (self.camera.zoom if self.camera.active else 1) / 2
+        return x + half_cell, y + half_cell
+
+    def enter(self):
+        """Start a new match on this warm instance"""
+        self.settings.validate()
+        self.running = True
+        self.return_to_menu = False
+        # A saved match is rebuilt straight from its snapshot rather than on
+        # top of a freshly dealt one
+        snapshot, self.resume_snapshot = self.resume_snapshot, None
+        self.replay_game(snapshot)
+
+    def exit(self):
+        """Drop per-match effects when leaving the game scene"""
+        self._cancel_cpu_search()
+        self.particle_system.clear()
+        self.celebration = None
+
+    def replay_game(self, snapshot=None):
+        """Reset game for replay, or continue from a snapshot"""
         self.particle_system.clear()
         self.win_animation_started = False
         self.show_win_screen = False
         self.celebration = None
         self.replay_button = None
         self.menu_button = None
+        self.win_overlay = None
+        self.win_text_surfaces = None
+        if snapshot is None:
+            self.reset()
+        else:
+            self.restore(snapshot)
 
-        self.sound_manager.play_music('planning', loop=True, fade_ms=500)
+        if not self.run_simulation:
+            self.sound_manager.play_music('planning', loop=True, fade_ms=500)
 
     def goto_menu(self):
         """Return to main menu"""
@@ -315,48 +461,94 @@ class Game:
         self.return_to_menu = True
         self.running = False
 
-    def reset(self):
-        """Enhanced reset that cleans up win screen state"""
+    def reset(self, grid_size=None, seats=None):
+        """
+        Enhanced reset that cleans up win screen state.
+
+        grid_size and seats (the CPU level of each seat, 0 for a person)
+        default to the table the settings ask for.
+        """
         self.turn = 0
         self.run_simulation = False
         self.winner = None
+        self.winner_index = None
         self.time = 0
         self.win_animation_started = False
         self.show_win_screen = False
         self.win_screen_timer = 0
+        self._cancel_cpu_search()
+
+        if grid_size is None:
+            grid_size = self.settings.grid_size
+        if seats is None:
+            seats = self._settings_seats()
+        if self.grid.rows != grid_size:
+            self.grid = self._create_grid(grid_size)
+        self.grid_size = grid_size
+
+        player_count = len(seats)
+        self.occupancy = OccupancyGrid(grid_size)
+        self.players = []
+        for slot in range(player_count):
+            start_pos, direction = self._start_position(slot, player_count)
+            if seats[slot]:
+                player_class, name = CpuPlayer, "CPU"
+                book = get_opening_book()
+                extra = {'level': seats[slot],
+                         'book': (book if book.covers(slot, player_count)
+                                  else None)}
+            else:
+                player_class, name = Player, f"Player {slot + 1}"
+                extra = {}
+            player = player_class(
+                name,
+                start_pos=start_pos,
+                grid_top_left=self.grid.top_left,
+                init_direction=direction,
+                sound_manager=self.sound_manager,
+                max_hand_size=self.settings.hand_size,
+                grid_size=grid_size,
+                slot=slot,
+                player_count=player_count,
+                **extra
+            )
+            self.occupancy.attach(player.snake)
+            self.players.append(player)
+        for player in self.players:
+            if player.is_cpu:
+                player.opponent = self.players[0]
 
-        player_one_start = (SNAKE_INIT_LENGTH, 0)
-        player_one = Player(
-            "Player 1",
-            start_pos=player_one_start,
-            grid_top_left=self.grid.top_left,
-            init_direction=Direction.RIGHT,
-            sound_manager=self.sound_manager,
-            max_hand_size=self.settings.hand_size,
-            grid_size=self.settings.grid_size
-        )
-        player_two_start = (self.settings.grid_size - SNAKE_INIT_LENGTH - 1,
-                            self.settings.grid_size - 1)
-        player_two = Player(
-            "Player 2",
-            start_pos=player_two_start,
-            grid_top_left=self.grid.top_left,
-            init_direction=Direction.LEFT,
-            sound_manager=self.sound_manager,
-            max_hand_size=self.settings.hand_size,
-            grid_size=self.settings.grid_size
-        )
+        self.raster = None
+        self.minimap = None
+        if self.camera.active and BoardRaster.available:
+            self.raster = BoardRaster(self.occupancy)
+        if self.camera.active and Minimap.available:
+            self.minimap = Minimap(self.occupancy, self.camera)
 
-        self.players = [player_one, player_two]
+        self.camera.center_on(self.players[0].snake.segments[0])
+
+    def _settings_seats(self):
+        """CPU level of each seat; with a level set, the CPU takes slot 1"""
+        return [self.settings.cpu_level if slot == 1 else 0
+                for slot in range(self.settings.num_players)]
+
+    def _cancel_cpu_search(self):
+        """Stop background searches of the current match's CPU players"""
+        for player in getattr(self, 'players', ()):
+            if player.is_cpu:
+                player.cancel()
+
+    def _start_position(self, slot, player_count):
+        return start_position(slot, player_count, self.grid_size)
 
     def draw_game_state_overlay(self):
         """Draw turn indicator, round counter, and player status"""
-        font_small = pygame.font.Font(MINECRAFT_FONT, 20)
+        font_small = load_font(MINECRAFT_FONT, 20)
         surface = self.screen
 
         if not self.run_simulation:
             turn_text = f"{self.players[self.turn].name}'s Turn"
-            if self.turn == 0:
+            if self.players[self.turn].side == 0:
                 draw_text(surface, turn_text, font_small, WHITE,
                           (10 + font_small.size(turn_text)[0] // 2, 15))
             else:
@@ -368,14 +560,42 @@ class Game:
             draw_text(surface, cards_text, font_small,
                       LIGHT_GRAY, (WIDTH // 2, 15))
 
+            if self.players[self.turn].is_cpu:
+                self.draw_cpu_progress(self.players[self.turn])
+
         else:
-            if self.players[0].card_exec:
-                current_round = self.players[0].card_exec.round
-                max_rounds = self.players[0].card_exec.max_rounds
+            # Crashed players stop executing, so follow one still in play
+            player = next((p for p in self.players if p.state != "lose"),
+                          self.players[0])
+            if player.card_exec:
+                current_round = player.card_exec.round
+                max_rounds = player.card_exec.max_rounds
                 round_text = f"Round {current_round}/{max_rounds}"
                 draw_text(surface, round_text, font_small,
                           WHITE, (WIDTH // 2, 15))
 
+    def draw_cpu_progress(self, player):
+        """Search depth and time used while the CPU plans"""
+        planner = player.planner
+        if planner is None:
+            return
+        font = load_font(MINECRAFT_FONT, 14)
+        cards = len(planner.hand)
+        if planner.book_plan is not None:
+            text = "Plan from the opening book"
+        elif player.thinking:
+            text = f"Thinking... {planner.depth}/{cards} cards deep"
+        else:
+            text = f"Plan searched {planner.depth}/{cards} cards deep"
+        draw_text(self.screen, text, font, LIGHT_GRAY, (WIDTH // 2, 38))
+
+        bar = pygame.Rect(WIDTH // 2 - 100, 50, 200, 6)
+        pygame.draw.rect(self.screen, (80, 80, 80), bar, border_radius=3)
+        filled = bar.copy()
+        filled.width = round(bar.width * planner.progress)
+        pygame.draw.rect(self.screen, player.snake.head_color, filled,
+                         border_radius=3)
+
     def draw_card_execution_highlight(self):
         """Highlight the card being executed"""
         if not self.run_simulation:
@@ -389,112 +609,127 @@ class Game:
                 if current_idx < len(player.chosen_cards):
                     card = player.chosen_cards[current_idx]
                     glow_rect = card.rect.inflate(10, 10)
-                    glow_color = WARM_GOLDEN if player.name == "Player 1" else LIGHT_SKY_BLUE
+                    glow_color = player.snake.body_color
                     pygame.draw.rect(surface, glow_color,
                                      glow_rect, width=4, border_radius=12)
 
     def draw_win_screen(self, surface):
         """Display winner announcement with animations"""
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        surface.blit(overlay, (0, 0))
+        if self.win_overlay is None:
+            self._prerender_win_screen()
+
+        surface.blit(self.win_overlay, (0, 0))
 
-        font_huge = pygame.font.Font(MINECRAFT_FONT, 72)
-        font_large = pygame.font.Font(MINECRAFT_FONT, 36)
-        font_medium = pygame.font.Font(MINECRAFT_FONT, 24)
+        # Only the bounce offset changes per frame
+        bounce = abs(math.sin(self.win_screen_timer * 3)) * 10
+        title_y = HEIGHT // 2 - 80 - bounce
+
+        title_shadow, title_surface, static_text = self.win_text_surfaces
+        surface.blit(title_shadow, title_shadow.get_rect(
+            center=(WIDTH // 2 + 3, title_y + 3)))
+        surface.blit(title_surface, title_surface.get_rect(
+            center=(WIDTH // 2, title_y)))
+
+        for text_surface, text_rect in static_text:
+            surface.blit(text_surface, text_rect)
+
+        if self.replay_button and self.menu_button:
+            self.replay_button.draw(surface)
+            self.menu_button.draw(surface)
+
+    def _prerender_win_screen(self):
+        """Render the win screen overlay and static text once"""
+        self.win_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self.win_overlay.fill((0, 0, 0, 150))
+
+        font_huge = load_font(MINECRAFT_FONT, 72)
+        font_large = load_font(MINECRAFT_FONT, 36)
+        font_medium = load_font(MINECRAFT_FONT, 24)
 
         if self.winner == "draw":
             title = "DRAW!"
-            subtitle = "Both Snakes Collided"
+            subtitle = ("Both Snakes Collided" if len(self.players) == 2
+                        else "Last Snakes Collided")
             color = LIGHT_GRAY
         elif self.winner == "round_end":
             title = "DRAW!"
             subtitle = "Rounds end"
             color = LIGHT_GRAY
-        elif self.winner == "one":
-            title = "PLAYER 1 WINS!"
-            subtitle = "Orange Snake Victorious!"
-            color = BRIGHT_ORANGE
         else:
-            title = "PLAYER 2 WINS!"
-            subtitle = "Blue Snake Victorious!"
-            color = BOLD_COBALT
+            winner = self.players[self.winner_index]
+            title = f"{winner.name.upper()} WINS!"
+            subtitle = f"{winner.color_name} Snake Victorious!"
+            color = winner.snake.head_color
 
-        bounce = abs(math.sin(self.win_screen_timer * 3)) * 10
-        title_y = HEIGHT // 2 - 80 - bounce
-
-        draw_text(surface, title, font_huge, (0, 0, 0),
-                  (WIDTH // 2 + 3, title_y + 3))
-        draw_text(surface, title, font_huge, color, (WIDTH // 2, title_y))
+        title_shadow = font_huge.render(title, True, (0, 0, 0))
+        title_surface = font_huge.render(title, True, color)
 
-        draw_text(surface, subtitle, font_large,
-                  WHITE, (WIDTH // 2, HEIGHT // 2))
+        static_text = []
+        subtitle_surface = font_large.render(subtitle, True, WHITE)
+        static_text.append((subtitle_surface, subtitle_surface.get_rect(
+            center=(WIDTH // 2, HEIGHT // 2))))
 
-        if self.winner in ("one", "two"):
-            winner_idx = 0 if self.winner == "one" else 1
-            winner_snake = self.players[winner_idx].snake
+        if self.winner == "win":
+            winner_snake = self.players[self.winner_index].snake
             stats = f"Final Length: {len(winner_snake.segments)}"
-            draw_text(surface, stats, font_medium, LIGHT_GRAY,
-                      (WIDTH // 2, HEIGHT // 2 + 50))
+            stats_surface = font_medium.render(stats, True, LIGHT_GRAY)
+            static_text.append((stats_surface, stats_surface.get_rect(
+                center=(WIDTH // 2, HEIGHT // 2 + 50))))
 
-        if self.replay_button and self.menu_button:
-            self.replay_button.draw(surface)
-            self.menu_button.draw(surface)
+        self.win_text_surfaces = (title_shadow, title_surface, static_text)
 
     def draw_snake_length_indicator(self):
-        """Show snake lengths for both players"""
+        """Show snake lengths for every player"""
         if not self.run_simulation:
             return
 
-        font = pygame.font.Font(MINECRAFT_FONT, 18)
+        font = load_font(MINECRAFT_FONT, 18)
         surface = self.screen
 
-        for i, player in enumerate(self.players):
+        for player in self.players:
             length = len(player.snake.segments)
             text = f"Length: {length}"
 
-            if i == 0:
+            if player.side == 0:
                 x = 10 + font.size(text)[0] // 2
-                color = BRIGHT_ORANGE
             else:
                 x = WIDTH - 10 - font.size(text)[0] // 2
-                color = BOLD_COBALT
 
-            y = 15
-            draw_text(surface, text, font, color, (x, y))
+            # Players sharing a side stack downwards
+            y = 15 + (player.slot // 2) * font.get_linesize()
+            draw_text(surface, text, font, player.snake.head_color, (x, y))
 
     def start_win_animation(self):
         """Initialize win screen animation"""
         if self.win_animation_started:
             return
 
+        # The match is over; there is nothing left to resume
+        if self.autosave_enabled:
+            delete_snapshot()
+
         self.sound_manager.play_sound('win')
         self.sound_manager.stop_music(fade_ms=1000)
 
         self.win_animation_started = True
         self.win_screen_timer = 0
         self.show_win_screen = True
+        self._prerender_win_screen()
 
         for _ in range(5):
             x = random.randint(100, WIDTH - 100)
             y = random.randint(50, 200)
             self.particle_system.emit_confetti_burst(x, y, count=30)
 
-        if self.winner in ("one", "two"):
-            winner_idx = 0 if self.winner == "one" else 1
-            winner_snake = self.players[winner_idx].snake
+        if self.winner == "win":
+            winner_snake = self.players[self.winner_index].snake
 
             if winner_snake.segments:
-                head_pos = winner_snake.segments[0]
-                grid_x, grid_y = winner_snake.grid_top_left
-                screen_x = grid_x + head_pos[0] * \
-                    (CELL_SIZE + GAP) + CELL_SIZE // 2
-                screen_y = grid_y + head_pos[1] * \
-                    (CELL_SIZE + GAP) + CELL_SIZE // 2
-
-                color = BRIGHT_ORANGE if self.winner == "one" else BOLD_COBALT
+                screen_x, screen_y = self._board_to_screen(
+                    winner_snake, winner_snake.segments[0])
+
                 self.particle_system.emit_sparkles(
-                    screen_x, screen_y, color, count=20)
+                    screen_x, screen_y, winner_snake.head_color, count=20)
 
             self.celebration = SnakeCelebration(
                 winner_snake,
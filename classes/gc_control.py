@@ -0,0 +1,80 @@
+import gc
+import time
+from collections import deque
+from config import *
+
+
+class FrameGC:
+    """Runs garbage collection between frames instead of mid-animation"""
+
+    def __init__(self, frame_budget_ms=1000 / FPS):
+        self.frame_budget_ms = frame_budget_ms
+        self.active = False
+
+        # Pause history as (milliseconds, generation)
+        self.pauses = deque(maxlen=PROFILER_WINDOW)
+        self.frame_pause_ms = 0.0
+        self._gc_start = None
+        self._frames_since_full = 0
+
+    def start(self):
+        """Switch from automatic to frame-driven collection"""
+        if self.active:
+            return
+        gc.callbacks.append(self._on_gc)
+        gc.disable()
+        self.active = True
+
+    def stop(self):
+        """Restore automatic collection"""
+        if not self.active:
+            return
+        gc.enable()
+        gc.callbacks.remove(self._on_gc)
+        self.active = False
+
+    def freeze(self):
+        """Collect, then move everything alive into the permanent generation"""
+        gc.collect()
+        gc.freeze()
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause_ms = (time.perf_counter() - self._gc_start) * 1000
+            self._gc_start = None
+            self.pauses.append((pause_ms, info['generation']))
+            self.frame_pause_ms += pause_ms
+
+    def end_frame(self, frame_ms, idle=False):
+        """
+        Collect in the time left over from this frame.
+
+        Full collections only run in idle scenes (planning, menus) unless
+        gen-1 collections have piled up; young collections run when there
+        is spare budget, or unconditionally past a hard allocation limit.
+        """
+        if not self.active:
+            return
+
+        self._frames_since_full += 1
+        spare_ms = self.frame_budget_ms - frame_ms
+        # Net allocations, gen-0 runs since gen-1, gen-1 runs since gen-2
+        allocations, young_runs, middle_runs = gc.get_count()
+
+        if (idle and spare_ms > GC_FULL_SPARE_MS
+                and self._frames_since_full >= GC_FULL_INTERVAL) \
+                or middle_runs >= GC_FULL_FORCE:
+            gc.collect(2)
+            self._frames_since_full = 0
+        elif allocations >= GC_YOUNG_THRESHOLD and spare_ms > GC_YOUNG_SPARE_MS:
+            gc.collect(1 if young_runs >= 10 else 0)
+        elif allocations >= GC_YOUNG_LIMIT:
+            gc.collect(0)
+
+    def take_frame_pause_ms(self):
+        """Return and reset GC time spent since the last call"""
+        pause_ms = self.frame_pause_ms
+        self.frame_pause_ms = 0.0
+        return pause_ms
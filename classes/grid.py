@@ -1,4 +1,5 @@
 import pygame
+from config import GRID_BLOCK
 
 
 class Grid:
@@ -10,11 +11,49 @@ class Grid:
         self.color = color
         self.gap = gap
 
-    def draw(self, surface):
+        # GRID_BLOCK x GRID_BLOCK cells pre-rendered at the current zoom
+        self._block = None
+        self._block_zoom = None
+
+    def _render_block(self, zoom):
+        step = (self.cell_size + self.gap) * zoom
+        size = max(1, round(self.cell_size * zoom))
+        radius = round(5 * zoom)
+        block = pygame.Surface((round(GRID_BLOCK * step),) * 2, pygame.SRCALPHA)
+        for row in range(GRID_BLOCK):
+            for col in range(GRID_BLOCK):
+                rect = (round(col * step), round(row * step), size, size)
+                pygame.draw.rect(block, self.color, rect, border_radius=radius)
+        return block
+
+    def draw(self, surface, camera=None):
+        """Blit cached blocks of cells covering the visible part of the board"""
+        if camera is not None and camera.active:
+            zoom = camera.zoom
+            first_col, first_row, end_col, end_row = camera.visible_cells()
+        else:
+            camera = None
+            zoom = 1.0
+            first_col, first_row, end_col, end_row = 0, 0, self.cols, self.rows
+
+        if self._block is None or self._block_zoom != zoom:
+            self._block = self._render_block(zoom)
+            self._block_zoom = zoom
+
+        step = (self.cell_size + self.gap) * zoom
         x0, y0 = self.top_left
-        for row in range(self.rows):
-            for col in range(self.cols):
-                x = x0 + col * (self.cell_size + self.gap)
-                y = y0 + row * (self.cell_size + self.gap)
-                rect = (x, y, self.cell_size, self.cell_size)
-                pygame.draw.rect(surface, self.color, rect, border_radius=5)
+        for block_row in range(first_row // GRID_BLOCK,
+                               (end_row - 1) // GRID_BLOCK + 1):
+            row = block_row * GRID_BLOCK
+            rows = min(GRID_BLOCK, self.rows - row)
+            for block_col in range(first_col // GRID_BLOCK,
+                                   (end_col - 1) // GRID_BLOCK + 1):
+                col = block_col * GRID_BLOCK
+                cols = min(GRID_BLOCK, self.cols - col)
+                if camera is not None:
+                    x, y = camera.cell_to_screen(col, row)
+                else:
+                    x, y = x0 + col * step, y0 + row * step
+                # Partial blocks at the board edge show only real cells
+                area = (0, 0, round(cols * step), round(rows * step))
+                surface.blit(self._block, (round(x), round(y)), area)
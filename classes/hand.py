@@ -1,7 +1,7 @@
-from .card import Card
+from .card import Card, deal_hand
 from config import *
-import random
 import pygame
+from .asset_loader import load_font
 
 
 class Hand:
@@ -13,30 +13,25 @@ class Hand:
         self.sound_manager = sound_manager
 
     def _generate_random_hand(self):
-        hand = []
-        directions = ["right", "left"]
-        effects = CARD_TYPES
-        weights = CARD_WEIGHTS
+        return self._layout_hand(deal_hand(self.max_hand_size))
 
-        for i in range(self.max_hand_size):
-            page = i // CARDS_PER_PAGE
+    def _layout_hand(self, definitions):
+        hand = []
+        for i, definition in enumerate(definitions):
             index_on_page = i % CARDS_PER_PAGE
 
             x = 100 + index_on_page * (CARD_WIDTH + CARD_GAP)
             y = HEIGHT - CARD_HEIGHT - 50
-
-            effect = random.choices(effects, weights=weights, k=1)[0]
-            name = f"{effect}"
-            if effect == "Move":
-                direction = random.choice(directions)
-                name += "\n" + direction
-                card = Card(x, y, name, effect, direction)
-            else:
-                card = Card(x, y, name, effect)
-            hand.append(card)
+            hand.append(Card(definition, x, y))
 
         return hand
 
+    def set_cards(self, definitions):
+        """Replace the hand with views of the given CardDefs"""
+        self.cards = self._layout_hand(definitions)
+        self.current_page = 0
+        self.hovered_card = None
+
     def add_card(self, card):
         card.rect.x = 100 + (len(self.cards) %
                              CARDS_PER_PAGE) * (CARD_WIDTH + CARD_GAP)
@@ -73,7 +68,7 @@ class Hand:
         completed_card = None
 
         for card in self.cards[:]:
-            if getattr(card, "to_remove", False) and chosen_card_target_pos is not None:
+            if card.to_remove and chosen_card_target_pos is not None:
                 target_x, target_y = chosen_card_target_pos
                 # smooth movement
                 card.rect.x += (target_x - card.rect.x) * 0.2
@@ -88,8 +83,7 @@ class Hand:
         # animate remaining cards shifting to fill gaps
         x_start = 100
         y = HEIGHT - CARD_HEIGHT - 50
-        visible_cards = [
-            c for c in self.cards if not getattr(c, 'to_remove', False)]
+        visible_cards = [c for c in self.cards if not c.to_remove]
         for i, card in enumerate(visible_cards):
             target_x = x_start + (i % CARDS_PER_PAGE) * (CARD_WIDTH + CARD_GAP)
             card.rect.x += (target_x - card.rect.x) * 0.2
@@ -101,7 +95,7 @@ class Hand:
         start_index = self.current_page * CARDS_PER_PAGE
         end_index = start_index + CARDS_PER_PAGE
         for card in self.cards[start_index:end_index]:
-            if getattr(card, "to_remove", False):
+            if card.to_remove:
                 continue
             # Lift card slightly when hovered
             if card.rect.collidepoint(pos):
@@ -118,21 +112,12 @@ class Hand:
         for card in self.cards[start_index:end_index]:
             card.draw(surface)
 
-        font = pygame.font.Font(MINECRAFT_FONT, 16)
+        font = load_font(MINECRAFT_FONT, 16)
 
         if self.hovered_card is not None:
             card = self.hovered_card
             # Show card description
-            descriptions = {
-                "Move": "Turn and move forward",
-                "Double Move": "Move forward twice",
-                "Grow": "Add a segment and move",
-                "Shrink": "Remove tail segment and move",
-                "Reverse": "Reverse snake direction",
-                "Skip": "Do nothing"
-            }
-
-            desc = descriptions.get(card.effect, "Unknown")
+            desc = card.tooltip or "Unknown"
 
             # Draw tooltip background
             tooltip_surface = font.render(desc, True, WHITE)
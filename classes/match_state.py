@@ -0,0 +1,199 @@
+import os
+import struct
+from array import array
+from util import Direction
+from config import *
+from .card import CardDef
+
+# Fixed code tables for the save file; order must never change
+_DIRECTIONS = list(Direction)
+_WINNERS = (None, "win", "draw", "round_end")
+_PLAYER_STATES = (None, "round_end", "win", "lose", "draw")
+_TURN_DIRECTIONS = (None, "right", "left")
+
+_MAGIC = b'SNKS'
+_VERSION = 3
+_HEADER = struct.Struct('<4sBHBBBdB')   # magic .. time, player count
+_PLAYER = struct.Struct('<BBBBHHBBBHHH')  # seat, flags .. list lengths
+
+
+class PlayerSnapshot:
+    """Frozen state of one player; every field is immutable and shareable"""
+
+    __slots__ = ('segments', 'direction', 'new_direction', 'hand', 'chosen',
+                 'confirmed', 'state', 'exec_state', 'cpu_level')
+
+    def __init__(self, segments, direction, new_direction, hand, chosen,
+                 confirmed=False, state=None, exec_state=None, cpu_level=0):
+        self.segments = segments            # tuple of (x, y)
+        self.direction = direction
+        self.new_direction = new_direction  # tuple of Direction
+        self.hand = hand                    # tuple of CardDef
+        self.chosen = chosen                # tuple of CardDef
+        self.confirmed = confirmed
+        self.state = state
+        # (current_index, round, finished) once the executor exists
+        self.exec_state = exec_state
+        # Index into CPU_LEVELS of whoever holds the seat; 0 for a person
+        self.cpu_level = cpu_level
+
+
+class MatchSnapshot:
+    """
+    Frozen state of a whole match.
+
+    Snapshots only hold tuples and shared CardDef flyweights, so taking one
+    never copies card views or pygame objects, the same snapshot can be
+    restored any number of times, and branches share everything they
+    don't change.
+    """
+
+    __slots__ = ('players', 'turn', 'run_simulation', 'winner', 'time',
+                 'grid_size')
+
+    def __init__(self, players, turn=0, run_simulation=False, winner=None,
+                 time=0.0, grid_size=GRID_SIZE):
+        self.players = players  # tuple of PlayerSnapshot
+        self.turn = turn
+        self.run_simulation = run_simulation
+        self.winner = winner
+        self.time = time
+        self.grid_size = grid_size
+
+
+def encode_snapshot(snapshot):
+    """Pack a snapshot into bytes; cards are stored as indexes into a table"""
+    card_table = []
+    card_index = {}
+
+    def index_cards(cards):
+        indexes = array('H')
+        for card in cards:
+            index = card_index.get(card)
+            if index is None:
+                index = card_index[card] = len(card_table)
+                card_table.append(card)
+            indexes.append(index)
+        return indexes
+
+    body = []
+    for player in snapshot.players:
+        hand = index_cards(player.hand)
+        chosen = index_cards(player.chosen)
+        exec_index, exec_round, exec_finished = player.exec_state or (0, 0, 0)
+        body.append(_PLAYER.pack(
+            player.cpu_level, player.confirmed, _PLAYER_STATES.index(player.state),
+            player.exec_state is not None, exec_index, exec_round,
+            exec_finished, _DIRECTIONS.index(player.direction),
+            len(player.new_direction), len(player.segments), len(hand),
+            len(chosen)))
+        body.append(bytes(_DIRECTIONS.index(d) for d in player.new_direction))
+        body.append(array('H', [c for cell in player.segments for c in cell])
+                    .tobytes())
+        body.append(hand.tobytes())
+        body.append(chosen.tobytes())
+
+    table = [struct.pack('<H', len(card_table))]
+    for card in card_table:
+        name = card.effect.encode('utf-8')
+        table.append(struct.pack('<BB', len(name),
+                                 _TURN_DIRECTIONS.index(card.direction)))
+        table.append(name)
+
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, snapshot.grid_size, snapshot.turn,
+        snapshot.run_simulation, _WINNERS.index(snapshot.winner),
+        snapshot.time, len(snapshot.players))
+    return b''.join([header, *table, *body])
+
+
+def decode_snapshot(data):
+    """Inverse of encode_snapshot"""
+    view = memoryview(data)
+    (magic, version, grid_size, turn, run_simulation, winner, time,
+     player_count) = _HEADER.unpack_from(view, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a match save file")
+    offset = _HEADER.size
+
+    def read_array(count):
+        nonlocal offset
+        values = array('H')
+        values.frombytes(view[offset:offset + count * 2])
+        offset += count * 2
+        return values
+
+    (card_count,) = struct.unpack_from('<H', view, offset)
+    offset += 2
+    card_table = []
+    for _ in range(card_count):
+        name_length, direction = struct.unpack_from('<BB', view, offset)
+        offset += 2
+        name = bytes(view[offset:offset + name_length]).decode('utf-8')
+        offset += name_length
+        card_table.append(CardDef.get(name, _TURN_DIRECTIONS[direction]))
+
+    players = []
+    for _ in range(player_count):
+        (cpu_level, confirmed, state, has_exec, exec_index, exec_round, exec_finished,
+         direction, turn_count, segment_count, hand_count,
+         chosen_count) = _PLAYER.unpack_from(view, offset)
+        offset += _PLAYER.size
+        if cpu_level >= len(CPU_LEVELS):
+            raise ValueError(f"Unknown CPU level {cpu_level}")
+        new_direction = tuple(_DIRECTIONS[d]
+                              for d in view[offset:offset + turn_count])
+        offset += turn_count
+        coords = read_array(segment_count * 2)
+        segments = tuple(zip(coords[0::2], coords[1::2]))
+        hand = tuple(card_table[i] for i in read_array(hand_count))
+        chosen = tuple(card_table[i] for i in read_array(chosen_count))
+        exec_state = ((exec_index, exec_round, bool(exec_finished))
+                      if has_exec else None)
+        players.append(PlayerSnapshot(
+            segments, _DIRECTIONS[direction], new_direction, hand, chosen,
+            bool(confirmed), _PLAYER_STATES[state], exec_state, cpu_level))
+
+    return MatchSnapshot(tuple(players), turn, bool(run_simulation),
+                         _WINNERS[winner], time, grid_size)
+
+
+def _fsync_directory(directory):
+    """Make a rename in directory durable, where the platform allows it"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Windows can't open a directory
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass    # Some filesystems don't sync directories
+    finally:
+        os.close(fd)
+
+
+def save_snapshot(snapshot, path=MATCH_SAVE_FILE):
+    """Write a snapshot atomically and durably, to survive power cuts too"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(encode_snapshot(snapshot))
+        # The data must be on disk before the rename is
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(directory or os.curdir)
+
+
+def load_snapshot(path=MATCH_SAVE_FILE):
+    with open(path, 'rb') as f:
+        return decode_snapshot(f.read())
+
+
+def delete_snapshot(path=MATCH_SAVE_FILE):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,114 @@
+import math
+import pygame
+from config import *
+
+try:
+    import numpy as np
+except ImportError:  # Optional; without it there is no minimap
+    np = None
+
+
+class Minimap:
+    """
+    Overview of a board bigger than the viewport, in the viewport's corner.
+
+    The occupancy counts are reduced to one pixel per block of cells with
+    NumPy, then cached as a scaled image. Only the blocks containing cells
+    the occupancy grid reports as changed are reduced again, so a frame
+    normally costs one blit plus a rect per head and one for the camera.
+    Clicking the minimap centers the camera there.
+    """
+
+    available = np is not None
+
+    def __init__(self, occupancy, camera, size=MINIMAP_SIZE):
+        self.occupancy = occupancy
+        self.camera = camera
+        self.grid_size = occupancy.grid_size
+
+        # Cells per minimap pixel, and minimap pixels per side before scaling
+        self.block = max(1, math.ceil(self.grid_size / size))
+        self.blocks = math.ceil(self.grid_size / self.block)
+        # Screen pixels per cell
+        self.cell_scale = size / (self.blocks * self.block)
+
+        viewport = camera.viewport
+        self.rect = pygame.Rect(viewport.right - size - MINIMAP_MARGIN,
+                                viewport.top + MINIMAP_MARGIN, size, size)
+
+        self.levels = np.zeros((self.blocks, self.blocks), dtype=np.uint8)
+        self._small = pygame.Surface((self.blocks, self.blocks), depth=8)
+        self._small.set_palette([MINIMAP_BACKGROUND, MINIMAP_SNAKE])
+        self._image = None
+        self.changed = occupancy.watch()
+        self._reduce_all()
+
+    def _counts(self):
+        size = self.grid_size
+        # Zero-copy view; rebuild() replaces the array, so fetch it each time
+        return np.frombuffer(self.occupancy.counts,
+                             dtype=np.uint16).reshape(size, size)
+
+    def _reduce_all(self):
+        padded_size = self.blocks * self.block
+        padded = np.zeros((padded_size, padded_size), dtype=np.uint16)
+        padded[:self.grid_size, :self.grid_size] = self._counts()
+        blocks = padded.reshape(self.blocks, self.block,
+                                self.blocks, self.block)
+        self.levels[:] = blocks.max(axis=(1, 3)) > 0
+        self.changed.clear()
+        self._image = None
+
+    def _refresh(self):
+        """Reduce again only the blocks with changed cells"""
+        if not self.changed:
+            return
+        size = self.grid_size
+        block = self.block
+        dirty = {(index // size // block, index % size // block)
+                 for index in self.changed}
+        self.changed.clear()
+        counts = self._counts()
+        for block_row, block_col in dirty:
+            row = block_row * block
+            col = block_col * block
+            self.levels[block_row, block_col] = \
+                counts[row:row + block, col:col + block].any()
+        self._image = None
+
+    def _cell_to_minimap(self, x, y):
+        return (self.rect.left + x * self.cell_scale,
+                self.rect.top + y * self.cell_scale)
+
+    def handle_event(self, event):
+        """Left click centers the camera on that part of the board"""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 \
+                and self.rect.collidepoint(event.pos):
+            cell = ((event.pos[0] - self.rect.left) / self.cell_scale,
+                    (event.pos[1] - self.rect.top) / self.cell_scale)
+            self.camera.center_on(cell)
+
+    def draw(self, surface, snakes):
+        """Draw the overview with a marker on each of the given snakes' heads"""
+        self._refresh()
+        if self._image is None:
+            pygame.surfarray.blit_array(self._small, self.levels.T)
+            self._image = pygame.transform.scale(self._small, self.rect.size)
+        surface.blit(self._image, self.rect)
+
+        marker = max(3, round(self.cell_scale))
+        for snake in snakes:
+            head_x, head_y = snake.segments[0]
+            x, y = self._cell_to_minimap(head_x + 0.5, head_y + 0.5)
+            pygame.draw.rect(surface, snake.head_color,
+                             (x - marker // 2, y - marker // 2, marker, marker))
+
+        # The part of the board the camera shows
+        camera = self.camera
+        step = camera.step
+        x, y = self._cell_to_minimap(camera.x / step, camera.y / step)
+        width = camera.viewport.width / camera.zoom / step * self.cell_scale
+        height = camera.viewport.height / camera.zoom / step * self.cell_scale
+        view = pygame.Rect(round(x), round(y), round(width), round(height))
+        pygame.draw.rect(surface, WHITE, view.clip(self.rect), width=1)
+        pygame.draw.rect(surface, LIGHT_GRAY, self.rect.inflate(2, 2), width=1)
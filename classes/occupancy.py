@@ -0,0 +1,124 @@
+from array import array
+from .torus import torus_distance, reachable_areas
+
+
+class OccupancyGrid:
+    """
+    Shared count of snake segments per grid cell.
+
+    Snakes attached to the grid report every head, tail and growth change,
+    so the index is never rebuilt during play and "is this head touching
+    another snake" is two lookups however many snakes there are.
+    """
+
+    def __init__(self, grid_size):
+        self.grid_size = grid_size
+        # Segments of any snake per cell, indexed by y * grid_size + x
+        self.counts = array('H', [0]) * (grid_size * grid_size)
+        # Per snake: cell index -> that snake's segments there
+        self.owned = []
+        self.snakes = []
+        # Sets collecting changed cell indexes, one per watch() caller
+        self.watchers = []
+
+    def attach(self, snake):
+        """Start tracking a snake; returns its owner id"""
+        owner = len(self.snakes)
+        self.snakes.append(snake)
+        self.owned.append({})
+        snake.occupancy = self
+        snake.owner = owner
+        for cell in snake.segments:
+            self.add(owner, cell)
+        return owner
+
+    def watch(self):
+        """
+        Return a set that every changed cell index is added to.
+
+        Renderers paint the whole board once, then drain the set each
+        frame to redraw only the cells snakes entered or left.
+        """
+        changed = set()
+        self.watchers.append(changed)
+        return changed
+
+    def rebuild(self):
+        """Recount every attached snake, e.g. after segments were replaced"""
+        # Cells about to be emptied count as changed too
+        for owned in self.owned:
+            for changed in self.watchers:
+                changed.update(owned)
+        self.counts = array('H', [0]) * (self.grid_size * self.grid_size)
+        for owner, snake in enumerate(self.snakes):
+            self.owned[owner] = {}
+            for cell in snake.segments:
+                self.add(owner, cell)
+
+    def add(self, owner, cell):
+        index = cell[1] * self.grid_size + cell[0]
+        self.counts[index] += 1
+        for changed in self.watchers:
+            changed.add(index)
+        owned = self.owned[owner]
+        owned[index] = owned.get(index, 0) + 1
+
+    def remove(self, owner, cell):
+        index = cell[1] * self.grid_size + cell[0]
+        self.counts[index] -= 1
+        for changed in self.watchers:
+            changed.add(index)
+        owned = self.owned[owner]
+        if owned[index] == 1:
+            del owned[index]
+        else:
+            owned[index] -= 1
+
+    def move(self, owner, new_head, old_tail):
+        self.add(owner, new_head)
+        self.remove(owner, old_tail)
+
+    def others_at(self, owner, cell):
+        """Number of other snakes' segments in a cell"""
+        index = cell[1] * self.grid_size + cell[0]
+        return self.counts[index] - self.owned[owner].get(index, 0)
+
+    def owners_at(self, cell):
+        """Owners with a segment in a cell (O(snakes); for effects only)"""
+        index = cell[1] * self.grid_size + cell[0]
+        return [owner for owner, owned in enumerate(self.owned)
+                if index in owned]
+
+    def find_crashes(self, owners):
+        """
+        Return the owners whose head is on another snake, in owner order.
+
+        Every head is tested against the same post-move board, so the
+        result does not depend on the order snakes moved in: a head-on
+        meeting crashes both snakes, and a head entering a body crashes
+        only the snake that entered.
+        """
+        return [owner for owner in owners
+                if self.others_at(owner, self.snakes[owner].segments[0])]
+
+    # Board evaluation for AI and hints
+
+    def distance(self, a, b):
+        """Moves between two cells on the wrapping board, ignoring snakes"""
+        return torus_distance(a, b, self.grid_size)
+
+    def free_mask(self):
+        """[y, x] NumPy bool array, True where no snake is"""
+        import numpy as np
+
+        size = self.grid_size
+        counts = np.frombuffer(self.counts, dtype=np.uint16)
+        return counts.reshape(size, size) == 0
+
+    def reachable_areas(self, owners=None):
+        """Free cells each snake's head can still reach, in owner order"""
+        if owners is None:
+            owners = range(len(self.snakes))
+        return reachable_areas(self.free_mask(),
+                               [self.snakes[owner].segments[0]
+                                for owner in owners])
@@ -0,0 +1,179 @@
+import hashlib
+import mmap
+import os
+import struct
+from config import *
+from .card import CardDef
+
+# File layout: header, card table, hash table of fixed-size slots, then
+# the plans as one byte per card (an index into the card table)
+_MAGIC = b'SNKO'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBBBII')  # magic, version, players, slot,
+                                     # table capacity, entry count
+_SLOT = struct.Struct('<QHBBI')      # key, grid size, plan length,
+                                     # expected result * 255, plan offset
+_TURN_DIRECTIONS = (None, "right", "left")
+
+
+def hand_signature(hand):
+    """Order-free description of a hand: each kind of card with its count"""
+    counts = {}
+    for card in hand:
+        counts[card] = counts.get(card, 0) + 1
+    return "|".join(f"{card.effect}/{card.direction or ''}*{count}"
+                    for card, count in sorted(
+                        counts.items(),
+                        key=lambda item: (item[0].effect,
+                                          item[0].direction or '')))
+
+
+def book_key(grid_size, hand):
+    """64-bit table key for (grid size, hand signature); never 0"""
+    digest = hashlib.blake2b(f"{grid_size}:{hand_signature(hand)}".encode(),
+                             digest_size=8).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+def write_book(path, entries, players=2, slot=1):
+    """
+    Write an opening book.
+
+    entries are (grid_size, plan, expected) with plan a tuple of CardDef in
+    play order and expected its result in [0, 1] (a draw is 0.5). players
+    and slot record the position the plans are for.
+    """
+    card_table = []
+    card_index = {}
+    capacity = 1
+    while capacity < 2 * len(entries):
+        capacity *= 2
+
+    table = bytearray(_SLOT.size * capacity)
+    plans = bytearray()
+    for grid_size, plan, expected in entries:
+        key = book_key(grid_size, plan)
+        index = key & (capacity - 1)
+        while struct.unpack_from('<Q', table, index * _SLOT.size)[0]:
+            index = (index + 1) & (capacity - 1)
+        for card in plan:
+            if card not in card_index:
+                card_index[card] = len(card_table)
+                card_table.append(card)
+        _SLOT.pack_into(table, index * _SLOT.size, key, grid_size, len(plan),
+                        round(expected * 255), len(plans))
+        plans += bytes(card_index[card] for card in plan)
+
+    cards = [struct.pack('<H', len(card_table))]
+    for card in card_table:
+        name = card.effect.encode('utf-8')
+        cards.append(struct.pack('<BB', len(name),
+                                 _TURN_DIRECTIONS.index(card.direction)))
+        cards.append(name)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, players, slot, capacity,
+                             len(entries)))
+        f.write(b''.join(cards))
+        f.write(table)
+        f.write(plans)
+    os.replace(temp_path, path)
+
+
+class OpeningBook:
+    """
+    Precomputed opening plans, memory-mapped from OPENING_BOOK_FILE.
+
+    The file is an open-addressing hash table keyed on (grid size, hand
+    signature), so a lookup hashes the hand and reads a slot or two
+    straight from the mapping; nothing is parsed up front and pages the
+    game never asks for are never read. Written by build_opening_book.py.
+    """
+
+    def __init__(self, path=OPENING_BOOK_FILE):
+        self.players = 0
+        self.slot = None
+        self.count = 0
+        self._map = None
+        try:
+            with open(path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_header()
+        except FileNotFoundError:
+            self._map = None
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: Could not open opening book {path}: {e}")
+            self.close()
+
+    @property
+    def available(self):
+        return self._map is not None
+
+    def _read_header(self):
+        view = self._map
+        (magic, version, self.players, self.slot, self._capacity,
+         self.count) = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not an opening book")
+        offset = _HEADER.size
+        (card_count,) = struct.unpack_from('<H', view, offset)
+        offset += 2
+        self._cards = []
+        for _ in range(card_count):
+            name_length, direction = struct.unpack_from('<BB', view, offset)
+            offset += 2
+            name = view[offset:offset + name_length].decode('utf-8')
+            offset += name_length
+            self._cards.append(CardDef.get(name, _TURN_DIRECTIONS[direction]))
+        self._table = offset
+        self._plans = offset + self._capacity * _SLOT.size
+
+    def covers(self, slot, player_count):
+        """True if the book's plans are for this seat at this table"""
+        return (self.available and slot == self.slot
+                and player_count == self.players)
+
+    def lookup(self, grid_size, hand):
+        """
+        Return (plan, expected) for this hand on this grid, or None.
+
+        plan holds the hand's cards in play order.
+        """
+        if not self.available or not self.count:
+            return None
+        key = book_key(grid_size, hand)
+        mask = self._capacity - 1
+        index = key & mask
+        while True:
+            (slot_key, slot_grid, length, expected,
+             offset) = _SLOT.unpack_from(self._map,
+                                         self._table + index * _SLOT.size)
+            if not slot_key:
+                return None
+            if slot_key == key and slot_grid == grid_size \
+                    and length == len(hand):
+                start = self._plans + offset
+                plan = tuple(self._cards[i]
+                             for i in self._map[start:start + length])
+                return plan, expected / 255
+            index = (index + 1) & mask
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+_book = None
+
+
+def get_opening_book():
+    """Return the process-wide opening book, mapping the file on first use"""
+    global _book
+    if _book is None:
+        _book = OpeningBook()
+    return _book
@@ -171,11 +171,20 @@ class SnakeCelebration:
 
         return screen_x, screen_y
 
-    def draw(self, surface):
+    def draw(self, surface, camera=None):
         """Draw the snake with wiggle effect applied"""
+        size = self.cell_size
+        if camera is not None and camera.active:
+            size = max(1, round(size * camera.zoom))
+        clip = surface.get_clip()
+
         for i, (gx, gy) in enumerate(self.snake.segments):
             x, y = self.get_screen_pos(gx, gy, i)
-            rect = (x, y, self.cell_size, self.cell_size)
+            if camera is not None:
+                x, y = camera.apply(x, y)
+            rect = pygame.Rect(x, y, size, size)
+            if not clip.colliderect(rect):
+                continue
 
             # Pick color (head vs body)
             color = self.snake.head_color if i == 0 else self.snake.body_color
@@ -0,0 +1,216 @@
+import pygame
+from collections import deque
+from util import Direction
+from config import *
+
+_OPPOSITES = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+_TURNS = {
+    Direction.UP:    {"left": Direction.LEFT,  "right": Direction.RIGHT},
+    Direction.DOWN:  {"left": Direction.RIGHT, "right": Direction.LEFT},
+    Direction.LEFT:  {"left": Direction.DOWN,  "right": Direction.UP},
+    Direction.RIGHT: {"left": Direction.UP,    "right": Direction.DOWN},
+}
+
+
+class GhostSnake:
+    """
+    Grid-only stand-in for Snake that card effects can run against.
+
+    Every change is journaled so the last card can be rolled back, and the
+    body is a deque with a flip flag so moves, growth and reversal are all
+    O(1) regardless of length.
+    """
+
+    __slots__ = ('body', 'flipped', 'direction', 'new_direction',
+                 'grid_size', 'trail', '_journal')
+
+    def __init__(self, snake):
+        self.body = deque(snake.segments)
+        # When flipped the head is the right end of body instead of the left
+        self.flipped = False
+        self.direction = snake.direction
+        self.new_direction = list(snake.new_direction)
+        self.grid_size = snake.grid_size
+        # Head cell after every move, in order
+        self.trail = []
+        self._journal = []
+
+    @property
+    def head(self):
+        return self.body[-1] if self.flipped else self.body[0]
+
+    def _add_head(self, cell):
+        if self.flipped:
+            self.body.append(cell)
+        else:
+            self.body.appendleft(cell)
+
+    def _remove_head(self):
+        return self.body.pop() if self.flipped else self.body.popleft()
+
+    def _add_tail(self, cell):
+        if self.flipped:
+            self.body.appendleft(cell)
+        else:
+            self.body.append(cell)
+
+    def _remove_tail(self):
+        return self.body.popleft() if self.flipped else self.body.pop()
+
+    def apply(self, card):
+        """Run a card's effect and return the journal that undoes it"""
+        self._journal = []
+        card.execute(self)
+        return self._journal
+
+    def undo(self, journal):
+        """Roll back the changes recorded by one apply()"""
+        for entry in reversed(journal):
+            op = entry[0]
+            if op == 'turn':
+                self.new_direction.pop()
+            elif op == 'move':
+                _, old_direction, took_turn, old_tail = entry
+                self._remove_head()
+                self._add_tail(old_tail)
+                self.trail.pop()
+                if took_turn:
+                    self.new_direction.insert(0, self.direction)
+                self.direction = old_direction
+            elif op == 'grow':
+                self._remove_tail()
+            elif op == 'shrink':
+                self._add_tail(entry[1])
+            elif op == 'reverse':
+                self.flipped = not self.flipped
+                self.direction = entry[1]
+                self.new_direction = entry[2]
+
+    # Same rules as Snake, minus the pixel interpolation
+
+    def turn(self, turn_dir):
+        if turn_dir not in ("left", "right"):
+            return
+        last_direction = self.new_direction[-1] if self.new_direction else self.direction
+        self.new_direction.append(_TURNS[last_direction][turn_dir])
+        self._journal.append(('turn',))
+
+    def move(self):
+        old_direction = self.direction
+        took_turn = bool(self.new_direction)
+        if took_turn:
+            self.direction = self.new_direction.pop(0)
+
+        dx, dy = self.direction.value
+        head_x, head_y = self.head
+        new_head = ((head_x + dx) % self.grid_size,
+                    (head_y + dy) % self.grid_size)
+        self._add_head(new_head)
+        old_tail = self._remove_tail()
+        self.trail.append(new_head)
+        self._journal.append(('move', old_direction, took_turn, old_tail))
+
+    def grow(self):
+        tail = self.body[0] if self.flipped else self.body[-1]
+        self._add_tail(tail)
+        self._journal.append(('grow',))
+
+    def shrink(self):
+        if len(self.body) > 2:
+            self._journal.append(('shrink', self._remove_tail()))
+
+    def reverse(self):
+        self._journal.append(('reverse', self.direction, self.new_direction))
+        self.flipped = not self.flipped
+        self.direction = _OPPOSITES[self.direction]
+        self.new_direction = [self.direction]
+
+
+class PathPreview:
+    """Translucent projection of a player's planned cards on the board"""
+
+    def __init__(self, snake):
+        self.snake = snake
+        self.ghost = GhostSnake(snake)
+        self._journals = []  # one per planned card
+
+        self._cell = pygame.Surface(
+            (snake.segment_size, snake.segment_size), pygame.SRCALPHA)
+        self._cell.fill((*snake.body_color, GHOST_PATH_ALPHA))
+        self._overlay = None
+        self._overlay_dirty = True
+
+    def push(self, card):
+        """Extend the projection by one planned card"""
+        trail_start = len(self.ghost.trail)
+        self._journals.append(self.ghost.apply(card))
+        if not self._overlay_dirty:
+            for cell in self.ghost.trail[trail_start:]:
+                self._blit_cell(cell)
+
+    def pop(self):
+        """Drop the last planned card from the projection"""
+        if self._journals:
+            self.ghost.undo(self._journals.pop())
+            # Translucent cells can't be erased; redraw on the next frame
+            self._overlay_dirty = True
+
+    def _cell_pos(self, cell):
+        step = self.snake.segment_size + self.snake.gap
+        return cell[0] * step, cell[1] * step
+
+    def _blit_cell(self, cell):
+        self._overlay.blit(self._cell, self._cell_pos(cell))
+
+    def _rebuild_overlay(self):
+        step = self.snake.segment_size + self.snake.gap
+        size = self.ghost.grid_size * step
+        if self._overlay is None:
+            self._overlay = pygame.Surface((size, size), pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 0))
+        for cell in self.ghost.trail:
+            self._blit_cell(cell)
+        self._overlay_dirty = False
+
+    def draw(self, surface, camera=None):
+        if not self.ghost.trail:
+            return
+
+        if camera is not None and camera.active:
+            # The board is too big for a full-size overlay; blit the few
+            # trail cells that are in view instead
+            self._draw_cells(surface, camera)
+        else:
+            camera = None
+            if self._overlay_dirty:
+                self._rebuild_overlay()
+            surface.blit(self._overlay, self.snake.grid_top_left)
+
+        size = self.snake.segment_size
+        x, y = self._cell_pos(self.ghost.head)
+        top_x, top_y = self.snake.grid_top_left
+        x, y = top_x + x, top_y + y
+        if camera is not None:
+            x, y = camera.apply(x, y)
+            size = max(1, round(size * camera.zoom))
+        pygame.draw.rect(surface, self.snake.head_color, (x, y, size, size),
+                         width=2, border_radius=5)
+
+    def _draw_cells(self, surface, camera):
+        size = max(1, round(self.snake.segment_size * camera.zoom))
+        if self._cell.get_width() != size:
+            self._cell = pygame.Surface((size, size), pygame.SRCALPHA)
+            self._cell.fill((*self.snake.body_color, GHOST_PATH_ALPHA))
+            # Overlay cells are drawn at full size
+            self._overlay_dirty = True
+
+        first_col, first_row, end_col, end_row = camera.visible_cells()
+        for gx, gy in self.ghost.trail:
+            if first_col <= gx < end_col and first_row <= gy < end_row:
+                surface.blit(self._cell, camera.cell_to_screen(gx, gy))
@@ -0,0 +1,367 @@
+import math
+import random
+import time
+from config import *
+from .path_preview import GhostSnake
+
+# Outcome points per opponent ordering: a win counts double a draw, so
+# score / (2 * orderings) is the expected result with draws as half a win
+WIN = 2
+DRAW = 1
+
+
+class TrackedGhost(GhostSnake):
+    """GhostSnake that also counts its segments per cell for hit tests"""
+
+    __slots__ = ('cells',)
+
+    def __init__(self, snake):
+        super().__init__(snake)
+        self.cells = {}
+        for cell in self.body:
+            self.cells[cell] = self.cells.get(cell, 0) + 1
+
+    def _add_head(self, cell):
+        super()._add_head(cell)
+        self.cells[cell] = self.cells.get(cell, 0) + 1
+
+    def _add_tail(self, cell):
+        super()._add_tail(cell)
+        self.cells[cell] = self.cells.get(cell, 0) + 1
+
+    def _discard(self, cell):
+        if self.cells[cell] == 1:
+            del self.cells[cell]
+        else:
+            self.cells[cell] -= 1
+        return cell
+
+    def _remove_head(self):
+        return self._discard(super()._remove_head())
+
+    def _remove_tail(self):
+        return self._discard(super()._remove_tail())
+
+
+def distinct_orderings(cards):
+    """Yield every distinct ordering of cards, treating equal cards as one"""
+    kinds = list(dict.fromkeys(cards))
+    remaining = [cards.count(kind) for kind in kinds]
+    order = []
+
+    def extend():
+        if len(order) == len(cards):
+            yield tuple(order)
+            return
+        for i, kind in enumerate(kinds):
+            if remaining[i]:
+                remaining[i] -= 1
+                order.append(kind)
+                yield from extend()
+                order.pop()
+                remaining[i] += 1
+
+    return extend()
+
+
+def count_orderings(cards):
+    """Number of distinct orderings, n! / (k1! k2! ...)"""
+    total = math.factorial(len(cards))
+    for kind in set(cards):
+        total //= math.factorial(cards.count(kind))
+    return total
+
+
+class PlanResult:
+    """Best plan found, with its record against the opponent orderings"""
+
+    __slots__ = ('plan', 'score', 'wins', 'draws', 'opponents', 'nodes',
+                 'complete', 'depth')
+
+    def __init__(self, plan, score, wins, draws, opponents, nodes, complete,
+                 depth):
+        self.plan = plan            # tuple of CardDef, in play order
+        self.score = score          # WIN/DRAW points over all opponents
+        self.wins = wins
+        self.draws = draws
+        self.opponents = opponents  # opponent orderings evaluated against
+        self.nodes = nodes
+        self.complete = complete    # False if the deadline cut it short
+        self.depth = depth          # leading cards searched exhaustively
+
+    @property
+    def exact(self):
+        """True if every ordering of the hand was considered"""
+        return self.complete and self.depth >= len(self.plan)
+
+    @property
+    def win_rate(self):
+        return self.wins / self.opponents if self.opponents else 0.0
+
+    @property
+    def expected(self):
+        """Expected result with a win as 1 and a draw as 0.5"""
+        return self.score / (WIN * self.opponents) if self.opponents else 0.0
+
+
+class PlanSolver:
+    """
+    Best card ordering for one snake against one opponent.
+
+    The opponent's orderings are all enumerated when there are at most
+    max_opponents of them, otherwise a seeded sample is used; orderings
+    can also be passed in directly (opponent_hand is then unused). Each
+    opponent ordering's moves don't depend on ours, so its trajectory is
+    simulated once up front. Our orderings are then searched depth first
+    over distinct cards only, so a hand with three Skips never tries them
+    in 3! orders. Sibling orderings share their prefix, since one journaled
+    ghost is extended and rolled back card by card. An ordering is cut off
+    as soon as the opponents already decided plus a win against every
+    undecided one can't beat the best found so far.
+
+    solve() is exact for small hands. For bigger ones deepen() searches
+    the first cards exhaustively and the rest in the order of the best plan
+    so far, one card deeper per pass, until a deadline.
+    """
+
+    def __init__(self, snake, opponent, hand, opponent_hand,
+                 max_opponents=SOLVER_MAX_OPPONENTS,
+                 samples=SOLVER_OPPONENT_SAMPLES, rounds=MAX_ROUNDS,
+                 rng=None, evaluator=None, orderings=None):
+        self.hand = list(hand)
+        self.rounds = rounds
+        self.me = TrackedGhost(snake)
+        self.start_length = len(snake.segments)
+        # Orders the cards tried at each step; None keeps hand order
+        self.evaluator = evaluator
+
+        if orderings is not None:
+            # Given outright, e.g. orderings of many different dealt hands
+            orderings = [tuple(ordering) for ordering in orderings]
+        else:
+            opponent_hand = list(opponent_hand)
+            if count_orderings(opponent_hand) <= max_opponents:
+                orderings = list(distinct_orderings(opponent_hand))
+            else:
+                rng = rng or random.Random(0)
+                orderings = []
+                for _ in range(samples):
+                    ordering = opponent_hand[:]
+                    rng.shuffle(ordering)
+                    orderings.append(tuple(ordering))
+        self.opponent_orderings = orderings
+
+        # Per opponent ordering, per card step: its head and occupied cells
+        self._heads = []
+        self._bodies = []
+        for ordering in orderings:
+            ghost = GhostSnake(opponent)
+            heads = []
+            bodies = []
+            for _ in range(rounds):
+                for card in ordering:
+                    ghost.apply(card)
+                    heads.append(ghost.head)
+                    bodies.append(frozenset(ghost.body))
+            self._heads.append(heads)
+            self._bodies.append(bodies)
+
+        self._kinds = list(dict.fromkeys(self.hand))
+        self.nodes = 0
+        self._deadline = None
+        self._timed_out = False
+        self._stopped = False
+
+    def stop(self):
+        """Make a running solve() or deepen() return as soon as it can"""
+        self._stopped = True
+
+    def _check(self, step, undecided):
+        """Resolve head hits at one card step; returns (undecided, wins, draws)"""
+        head = self.me.head
+        cells = self.me.cells
+        still = []
+        wins = draws = 0
+        for j in undecided:
+            hit = head in self._bodies[j][step]
+            opponent_hit = self._heads[j][step] in cells
+            if hit and opponent_hit:
+                draws += 1
+            elif opponent_hit:
+                wins += 1
+            elif not hit:
+                still.append(j)
+        return still, wins, draws
+
+    def _evaluate(self, step, undecided, wins, draws):
+        """Evaluator score after the card at step"""
+        total = len(self.opponent_orderings)
+        losses = total - len(undecided) - wins - draws
+        outcome = (WIN * (wins - losses) + DRAW * draws) / (WIN * total)
+        heads = [self._heads[j][step] for j in undecided]
+        # Blocked by the first undecided opponent, as a representative
+        blocked = self._bodies[undecided[0]][step] if undecided else ()
+        return self.evaluator.evaluate(
+            self.me.head, len(self.me.body) - self.start_length, heads,
+            blocked, outcome)
+
+    def _ordered_kinds(self, remaining, step, undecided, wins, draws):
+        """Indexes of the cards still in hand, most promising first"""
+        choices = [i for i in range(len(self._kinds)) if remaining[i]]
+        if self.evaluator is None or len(choices) < 2:
+            return choices
+        scores = {}
+        for i in choices:
+            journal = self.me.apply(self._kinds[i])
+            still, won, drawn = self._check(step, undecided)
+            scores[i] = self._evaluate(step, still, wins + won, draws + drawn)
+            self.me.undo(journal)
+        choices.sort(key=scores.__getitem__, reverse=True)
+        return choices
+
+    def greedy_plan(self):
+        """Take the best-evaluated card at every step; instant but myopic"""
+        remaining = [self.hand.count(kind) for kind in self._kinds]
+        undecided = list(range(len(self.opponent_orderings)))
+        wins = draws = 0
+        plan = []
+        journals = []
+        for step in range(len(self.hand)):
+            i = self._ordered_kinds(remaining, step, undecided, wins,
+                                    draws)[0]
+            remaining[i] -= 1
+            plan.append(self._kinds[i])
+            journals.append(self.me.apply(self._kinds[i]))
+            undecided, won, drawn = self._check(step, undecided)
+            wins += won
+            draws += drawn
+        for journal in reversed(journals):
+            self.me.undo(journal)
+        return tuple(plan)
+
+    def solve(self, deadline=None, depth=None, completion=None, seed=None):
+        """
+        Search the orderings of the hand.
+
+        Every ordering is searched unless depth is given: then only the
+        first depth cards are, each prefix followed by the remaining cards
+        in completion order. With a deadline (a time.perf_counter() value)
+        the search stops there and returns the best ordering found so far.
+        seed is a PlanResult the answer has to beat.
+        """
+        self.nodes = 0
+        self._deadline = deadline
+        self._timed_out = False
+        if depth is None or depth > len(self.hand):
+            depth = len(self.hand)
+        self._depth = depth
+        self._completion = completion if completion is not None else self.hand
+        if seed is None:
+            self._best = None
+            self._best_score = -1
+        else:
+            self._best = (seed.plan, seed.score, seed.wins, seed.draws)
+            self._best_score = seed.score
+
+        remaining = [self.hand.count(kind) for kind in self._kinds]
+        self._search(remaining, [],
+                     list(range(len(self.opponent_orderings))), 0, 0)
+
+        plan, score, wins, draws = self._best
+        return PlanResult(plan, score, wins, draws,
+                          len(self.opponent_orderings), self.nodes,
+                          not self._timed_out, depth)
+
+    def deepen(self, deadline=None, progress=None, max_depth=None):
+        """
+        Anytime search until a deadline, always holding a best plan.
+
+        Starts from the greedy plan, then searches one more leading card
+        exhaustively per pass, finishing each prefix in the order of the
+        best plan so far. progress(result) is called after every pass.
+        max_depth stops after that pass instead, for repeatable results.
+        """
+        self._stopped = False
+        result = self.solve(depth=0, completion=self.greedy_plan())
+        if progress:
+            progress(result)
+        if max_depth is None or max_depth > len(self.hand):
+            max_depth = len(self.hand)
+        for depth in range(1, max_depth + 1):
+            if self._stopped or (deadline is not None
+                                 and time.perf_counter() > deadline):
+                break
+            nodes = result.nodes
+            deeper = self.solve(deadline, depth, result.plan, seed=result)
+            deeper.nodes += nodes
+            if not deeper.complete:
+                # A cut-short pass is no deeper, but may have a better plan
+                deeper.depth = result.depth
+                result = deeper
+                break
+            result = deeper
+            if progress:
+                progress(result)
+        return result
+
+    def _search(self, remaining, plan, undecided, wins, draws):
+        if WIN * (wins + len(undecided)) + draws <= self._best_score:
+            return
+        step = len(plan)
+        if step == self._depth:
+            self._complete(remaining, plan, undecided, wins, draws)
+            return
+
+        for i in self._ordered_kinds(remaining, step, undecided, wins, draws):
+            kind = self._kinds[i]
+            self.nodes += 1
+            remaining[i] -= 1
+            plan.append(kind)
+            journal = self.me.apply(kind)
+            still, won, drawn = self._check(step, undecided)
+            self._search(remaining, plan, still, wins + won, draws + drawn)
+            self.me.undo(journal)
+            plan.pop()
+            remaining[i] += 1
+
+            if self._stopped or (self._deadline is not None
+                                 and time.perf_counter() > self._deadline):
+                if self._best is not None:
+                    self._timed_out = True
+            if self._timed_out:
+                return
+
+    def _complete(self, remaining, plan, undecided, wins, draws):
+        """Follow a prefix with the unused cards in completion order"""
+        left = dict(zip(self._kinds, remaining))
+        tail = []
+        for card in self._completion:
+            if left.get(card):
+                left[card] -= 1
+                tail.append(card)
+        self._finish(tuple(plan) + tuple(tail), len(plan), undecided, wins,
+                     draws)
+
+    def _finish(self, plan, start, undecided, wins, draws):
+        """Play a complete ordering from card step start on and score it"""
+        self.nodes += 1
+        journals = []
+        cards = plan[start:] + plan * (self.rounds - 1)
+        for step, card in enumerate(cards, start):
+            if not undecided:
+                break
+            journals.append(self.me.apply(card))
+            undecided, won, drawn = self._check(step, undecided)
+            wins += won
+            draws += drawn
+            if WIN * (wins + len(undecided)) + draws <= self._best_score:
+                break
+        for journal in reversed(journals):
+            self.me.undo(journal)
+
+        # Opponents neither snake hit by the last round end in a draw
+        draws += len(undecided)
+        score = WIN * wins + draws
+        if score > self._best_score:
+            self._best_score = score
+            self._best = (plan, score, wins, draws)
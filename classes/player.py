@@ -3,19 +3,51 @@ from .hand import Hand
 from util import Direction, draw_dashed_line
 from config import *
 from .card_executer import CardExecuter
+from .path_preview import PathPreview
+from .card import Card
+from .match_state import PlayerSnapshot
+from .camera import view_cells
 import pygame
 
 
+def start_position(slot, player_count, grid_size):
+    """
+    Spread snakes over distinct rows, alternating sides and directions.
+
+    With two players this is the classic layout: top-left heading right
+    and bottom-right heading left.
+    """
+    row = slot * (grid_size - 1) // (player_count - 1)
+    if slot % 2 == 0:
+        return (SNAKE_INIT_LENGTH, row), Direction.RIGHT
+    return (grid_size - SNAKE_INIT_LENGTH - 1, row), Direction.LEFT
+
+
+def start_snakes(grid_size, players=2):
+    """Bare snakes for every seat as a match starts, for offline searches"""
+    snakes = []
+    for slot in range(players):
+        position, direction = start_position(slot, players, grid_size)
+        snakes.append(Snake(position, BLACK, BLACK, init_direction=direction,
+                            grid_size=grid_size))
+    return snakes
+
+
 class Player:
+    is_cpu = False
+    cpu_level = 0
+
     def __init__(self, name, start_pos=(0, 0), grid_top_left=(0, 0),
                  init_direction=Direction.RIGHT, sound_manager=None,
-                 max_hand_size=15, grid_size=20):
+                 max_hand_size=15, grid_size=20, slot=0, player_count=2):
         self.name = name
         self.max_hand_size = max_hand_size
         self.grid_size = grid_size
 
-        head_color = BRIGHT_ORANGE if name == "Player 1" else BOLD_COBALT
-        body_color = WARM_GOLDEN if name == "Player 1" else LIGHT_SKY_BLUE
+        # Even slots sit left of the grid and odd slots right of it
+        self.slot = slot
+        self.side = slot % 2
+        self.color_name, head_color, body_color = PLAYER_COLORS[slot]
         self.snake = Snake(
             start_pos,
             grid_top_left=grid_top_left,
@@ -27,9 +59,12 @@ class Player:
         self.hand = Hand(sound_manager=sound_manager,
                          max_hand_size=max_hand_size)
         self.chosen_cards = []
+        self.preview = PathPreview(self.snake)
 
-        self.chosen_cards_draw_pos = self._calculate_chosen_cards_pos(
+        self.chosen_cards_origin = self._calculate_chosen_cards_pos(
             grid_top_left, grid_size)
+        self.executing_card_y = self._calculate_executing_card_y(player_count)
+        self.chosen_cards_draw_pos = self.chosen_cards_origin
         self.confirmed = False
         self.card_exec = None
         self.state = None
@@ -45,6 +80,7 @@ class Player:
             chosen_card_target_pos=self.chosen_cards_draw_pos)
         if chosen_card:
             self.chosen_cards.append(chosen_card)
+            self.preview.push(chosen_card)
             self.chosen_cards_draw_pos = (
                 self.chosen_cards_draw_pos[0],
                 self.chosen_cards_draw_pos[1] + CARD_GAP
@@ -54,7 +90,17 @@ class Player:
         self.hand.handle_events(event)
 
     def draw(self, surface):
-        self.snake.draw(surface)
+        self.draw_snake(surface)
+        self.draw_cards(surface)
+
+    def draw_snake(self, surface, camera=None, body=True):
+        """Draw the path preview, and the snake unless a board raster shows it"""
+        if not self.confirmed:
+            self.preview.draw(surface, camera)
+        if body:
+            self.snake.draw(surface, camera=camera)
+
+    def draw_cards(self, surface):
         self.hand.draw(surface)
         self._draw_chosen_cards(surface)
 
@@ -66,7 +112,7 @@ class Player:
         else:
             current_idx = self.card_exec.current_index
             current_card = self.chosen_cards[current_idx - 1]
-            current_card.rect.y = HEIGHT // 2
+            current_card.rect.y = self.executing_card_y
             current_card.draw(surface)
 
     def undo_move(self):
@@ -75,6 +121,7 @@ class Player:
 
         print(f"Undoing move for {self.name}")
         last_card = self.chosen_cards.pop()
+        self.preview.pop()
         self.hand.add_card(last_card)
         self.chosen_cards_draw_pos = (
             self.chosen_cards_draw_pos[0],
@@ -86,15 +133,62 @@ class Player:
 
     def _calculate_chosen_cards_pos(self, grid_top_left, grid_size):
         """Calculate position for chosen cards display"""
-        grid_width = grid_size * CELL_SIZE + (grid_size - 1) * GAP
+        cells = view_cells(grid_size)
+        grid_width = cells * CELL_SIZE + (cells - 1) * GAP
 
         return (
             (grid_top_left[0] - CARD_WIDTH) / 2, grid_top_left[1]
-        ) if self.name == "Player 1" else (
+        ) if self.side == 0 else (
             grid_top_left[0] + grid_width + (
                 WIDTH - (grid_top_left[0] + grid_width) - CARD_WIDTH) / 2, grid_top_left[1]
         )
 
+    def _calculate_executing_card_y(self, player_count):
+        """Stack the executing cards of players sharing a side vertically"""
+        rows = (player_count - self.side + 1) // 2
+        row = self.slot // 2
+        step = CARD_HEIGHT + CARD_GAP
+        return HEIGHT // 2 - (rows - 1) * step // 2 + row * step
+
+    def snapshot(self):
+        """Capture this player's state as an immutable PlayerSnapshot"""
+        exec_state = None
+        if self.card_exec is not None:
+            exec_state = (self.card_exec.current_index, self.card_exec.round,
+                          self.card_exec.finished)
+        return PlayerSnapshot(
+            tuple(self.snake.segments), self.snake.direction,
+            tuple(self.snake.new_direction),
+            tuple(card.definition for card in self.hand.cards),
+            tuple(card.definition for card in self.chosen_cards),
+            self.confirmed, self.state, exec_state, self.cpu_level)
+
+    def restore(self, snapshot):
+        """Put this player back into a captured state"""
+        self.snake.set_segments(snapshot.segments)
+        self.snake.direction = snapshot.direction
+        self.snake.new_direction = list(snapshot.new_direction)
+
+        self.hand.set_cards(snapshot.hand)
+        origin_x, origin_y = self.chosen_cards_origin
+        self.chosen_cards = [Card(definition, origin_x, origin_y + i * CARD_GAP)
+                             for i, definition in enumerate(snapshot.chosen)]
+        self.chosen_cards_draw_pos = (
+            origin_x, origin_y + len(self.chosen_cards) * CARD_GAP)
+
+        self.confirmed = snapshot.confirmed
+        self.state = snapshot.state
+        self.card_exec = None
+        if snapshot.exec_state is not None:
+            self.card_exec = CardExecuter(self.chosen_cards)
+            (self.card_exec.current_index, self.card_exec.round,
+             self.card_exec.finished) = snapshot.exec_state
+
+        self.preview = PathPreview(self.snake)
+        if not self.confirmed:
+            for card in self.chosen_cards:
+                self.preview.push(card)
+
     def run_simulation(self):
         rounds_end = self.card_exec.update(self.snake)
         if rounds_end:
@@ -0,0 +1,222 @@
+import pygame
+import csv
+import sys
+import time
+from collections import deque
+from config import *
+from .asset_loader import load_font
+
+
+class _PhaseTimer:
+    """Context manager that times one phase of the current frame"""
+
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._enter_phase(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._exit_phase()
+        return False
+
+
+class FrameProfiler:
+    """Per-frame timing of each subsystem with an overlay and CSV dump"""
+
+    PHASES = ('events', 'update', 'grid', 'snakes', 'cards',
+              'particles_update', 'particles_draw', 'ui', 'flip')
+
+    def __init__(self, window=PROFILER_WINDOW, launch_time=None,
+                 on_first_frame=None):
+        self.window = window
+
+        # perf_counter() at process start, for time to first interactive frame
+        self.launch_time = launch_time
+        self.first_frame_ms = None
+        self.on_first_frame = on_first_frame
+
+        # Optional FrameGC that collects in the spare time after each frame
+        self.gc_control = None
+        self.gc_history = deque(maxlen=window)
+        self.visible = False
+        self.csv_path = None
+        self._csv_file = None
+        self._csv_writer = None
+
+        # Rolling history of per-frame samples (milliseconds)
+        self.history = {name: deque(maxlen=window) for name in self.PHASES}
+        self.frame_history = deque(maxlen=window)
+        self.particle_history = deque(maxlen=window)
+        self.alloc_history = deque(maxlen=window)
+
+        self.frame_count = 0
+        self._frame = dict.fromkeys(self.PHASES, 0.0)
+        self._stack = []
+        self._frame_start = None
+        self._blocks_start = 0
+
+        self.font = None
+        self._overlay = None
+        self._overlay_age = PROFILER_OVERLAY_REFRESH
+
+    def toggle(self):
+        """Show or hide the overlay"""
+        self.visible = not self.visible
+        self._overlay = None
+
+    def handle_event(self, event):
+        """F3 toggles the overlay, F4 toggles CSV recording"""
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_F3:
+            self.toggle()
+        elif event.key == pygame.K_F4:
+            if self._csv_writer is None:
+                self.start_csv(time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+            else:
+                self.stop_csv()
+
+    def start_csv(self, path):
+        """Start appending one row per frame to a CSV file"""
+        self.stop_csv()
+        self.csv_path = path
+        self._csv_file = open(path, 'w', newline='')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_writer.writerow(
+            ['frame', *self.PHASES, 'total', 'gc', 'particles', 'alloc_blocks'])
+        print(f"Profiler: recording to {path}")
+
+    def stop_csv(self):
+        """Stop CSV recording and close the file"""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            print(f"Profiler: saved {self.csv_path}")
+        self._csv_file = None
+        self._csv_writer = None
+
+    def begin_frame(self):
+        """Mark the start of a frame (call before handling events)"""
+        for name in self._frame:
+            self._frame[name] = 0.0
+        self._stack.clear()
+        self._frame_start = time.perf_counter()
+        self._blocks_start = sys.getallocatedblocks()
+
+    def phase(self, name):
+        """Time a block of work; nested phases are timed exclusively"""
+        return _PhaseTimer(self, name)
+
+    def _enter_phase(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            # Pause the enclosing phase while the nested one runs
+            parent = self._stack[-1]
+            self._frame[parent[0]] += now - parent[1]
+        self._stack.append([name, now])
+
+    def _exit_phase(self):
+        now = time.perf_counter()
+        name, start = self._stack.pop()
+        self._frame[name] += now - start
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def end_frame(self, particles=0, idle=False):
+        """Record the finished frame (call before clock.tick)"""
+        if self._frame_start is None:
+            return
+
+        total = (time.perf_counter() - self._frame_start) * 1000
+        alloc_blocks = sys.getallocatedblocks() - self._blocks_start
+        self.frame_count += 1
+
+        gc_ms = 0.0
+        if self.gc_control is not None:
+            self.gc_control.end_frame(total, idle)
+            gc_ms = self.gc_control.take_frame_pause_ms()
+        self.gc_history.append(gc_ms)
+
+        for name, seconds in self._frame.items():
+            self.history[name].append(seconds * 1000)
+        self.frame_history.append(total)
+        self.particle_history.append(particles)
+        self.alloc_history.append(alloc_blocks)
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerow(
+                [self.frame_count,
+                 *(f"{self._frame[name] * 1000:.3f}" for name in self.PHASES),
+                 f"{total:.3f}", f"{gc_ms:.3f}", particles, alloc_blocks])
+
+        self._frame_start = None
+
+        if self.first_frame_ms is None and self.launch_time is not None:
+            self.first_frame_ms = (time.perf_counter() - self.launch_time) * 1000
+            print(f"Time to first interactive frame: {self.first_frame_ms:.0f} ms")
+            if self.on_first_frame is not None:
+                self.on_first_frame(self.first_frame_ms)
+
+    @staticmethod
+    def _summarize(samples):
+        """Return (average, p99) of a sample window"""
+        if not samples:
+            return 0.0, 0.0
+        ordered = sorted(samples)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        return sum(ordered) / len(ordered), p99
+
+    def stats(self):
+        """Rolling (average ms, p99 ms) for each phase and the whole frame"""
+        result = {name: self._summarize(self.history[name])
+                  for name in self.PHASES}
+        result['total'] = self._summarize(self.frame_history)
+        result['gc'] = self._summarize(self.gc_history)
+        return result
+
+    def draw(self, surface):
+        """Draw the overlay if visible; text is refreshed a few times a second"""
+        if not self.visible:
+            return
+
+        self._overlay_age += 1
+        if self._overlay is None or self._overlay_age >= PROFILER_OVERLAY_REFRESH:
+            self._overlay = self._render_overlay()
+            self._overlay_age = 0
+
+        surface.blit(self._overlay, (10, 40))
+
+    def _render_overlay(self):
+        if self.font is None:
+            self.font = load_font(None, 20)
+
+        lines = [f"{'phase':<17}{'avg ms':>8}{'p99 ms':>8}"]
+        for name, (avg, p99) in self.stats().items():
+            lines.append(f"{name:<17}{avg:>8.2f}{p99:>8.2f}")
+
+        particles = self.particle_history[-1] if self.particle_history else 0
+        allocs = self._summarize(self.alloc_history)[0]
+        lines.append(f"particles {particles}")
+        lines.append(f"alloc blocks/frame {allocs:+.0f}")
+        if self.gc_control is not None and self.gc_control.pauses:
+            worst_ms, worst_gen = max(self.gc_control.pauses)
+            lines.append(f"gc worst {worst_ms:.2f} ms (gen {worst_gen})")
+        if self.first_frame_ms is not None:
+            lines.append(f"first frame {self.first_frame_ms:.0f} ms")
+        if self._csv_writer is not None:
+            lines.append(f"REC {self.csv_path}")
+
+        line_height = self.font.get_linesize()
+        width = max(self.font.size(line)[0] for line in lines) + 16
+        height = line_height * len(lines) + 12
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+        for i, line in enumerate(lines):
+            rendered = self.font.render(line, True, (200, 255, 200))
+            overlay.blit(rendered, (8, 6 + i * line_height))
+        return overlay
@@ -0,0 +1,212 @@
+import pygame
+from config import *
+from .button import Button
+from .profiler import FrameProfiler
+from .slider import Slider
+from util import draw_text
+from .asset_loader import load_font
+
+
+class SettingsMenu:
+    """Settings menu with adjustable parameters"""
+
+    def __init__(self, screen, sound_manager, game_settings, profiler=None):
+        self.screen = screen
+        self.sound_manager = sound_manager
+        self.game_settings = game_settings
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.running = True
+        self.next_state = None
+
+        self.title_font = load_font(MINECRAFT_FONT, 48)
+        self.label_font = load_font(MINECRAFT_FONT, 20)
+
+        slider_x = 300
+        slider_width = 200
+        slider_height = 10
+        start_y = 150
+        spacing = 60
+
+        self.sliders = {
+            'music_volume': Slider(
+                slider_x, start_y, slider_width, slider_height,
+                0.0, 1.0, self.sound_manager.music_volume,
+                label="Music Volume", font=MINECRAFT_FONT, font_size=20
+            ),
+            'sfx_volume': Slider(
+                slider_x, start_y + spacing, slider_width, slider_height,
+                0.0, 1.0, self.sound_manager.sfx_volume,
+                label="SFX Volume", font=MINECRAFT_FONT, font_size=20
+            ),
+            'max_rounds': Slider(
+                slider_x, start_y + spacing * 2, slider_width, slider_height,
+                1, 10, self.game_settings.max_rounds,
+                label="Max Rounds", font=MINECRAFT_FONT, font_size=20, force_int=True
+            ),
+            'snake_speed': Slider(
+                slider_x, start_y + spacing * 3, slider_width, slider_height,
+                0.1, 2.0, self.game_settings.snake_speed,
+                label="Snake Speed", font=MINECRAFT_FONT, font_size=20
+            ),
+            'hand_size': Slider(
+                slider_x, start_y + spacing * 4, slider_width, slider_height,
+                5, 20, self.game_settings.hand_size,
+                label="Hand Size", font=MINECRAFT_FONT, font_size=20, force_int=True
+            ),
+            'grid_size': Slider(
+                slider_x, start_y + spacing * 5, slider_width, slider_height,
+                10, MAX_GRID_SIZE, self.game_settings.grid_size,
+                label="Grid Size", font=MINECRAFT_FONT, font_size=20, force_int=True
+            ),
+            'num_players': Slider(
+                slider_x, start_y + spacing * 6, slider_width, slider_height,
+                MIN_PLAYERS, MAX_PLAYERS, self.game_settings.num_players,
+                label="Players", font=MINECRAFT_FONT, font_size=20, force_int=True
+            ),
+            'cpu_level': Slider(
+                slider_x, start_y + spacing * 7, slider_width, slider_height,
+                0, len(CPU_LEVELS) - 1, self.game_settings.cpu_level,
+                label=f"CPU: {CPU_LEVELS[self.game_settings.cpu_level][0]}",
+                font=MINECRAFT_FONT, font_size=20, force_int=True
+            ),
+        }
+
+        button_width = 150
+        button_height = 50
+        button_y = HEIGHT - 100
+
+        self.back_button = Button(
+            x=WIDTH // 2 - button_width - 10, y=button_y,
+            width=button_width, height=button_height,
+            function=self.go_back,
+            text="Back",
+            color=(200, 100, 100),
+            hover_color=(220, 120, 120),
+            click_color=(180, 80, 80),
+            font=MINECRAFT_FONT,
+            font_size=28,
+            text_color=WHITE
+        )
+
+        self.apply_button = Button(
+            x=WIDTH // 2 + 10, y=button_y,
+            width=button_width, height=button_height,
+            function=self.apply_settings,
+            text="Apply",
+            color=(100, 200, 100),
+            hover_color=(120, 220, 120),
+            click_color=(80, 180, 80),
+            font=MINECRAFT_FONT,
+            font_size=28,
+            text_color=WHITE
+        )
+
+        self.buttons = [self.back_button, self.apply_button]
+
+    def enter(self):
+        """Reset loop state and show the currently applied settings"""
+        self.running = True
+        self.next_state = None
+        self._sync_sliders()
+
+    def exit(self):
+        """Nothing to release; the settings screen stays warm between visits"""
+
+    def _sync_sliders(self):
+        """Discard unapplied slider changes by reloading current values"""
+        self.sliders['music_volume'].value = self.sound_manager.music_volume
+        self.sliders['sfx_volume'].value = self.sound_manager.sfx_volume
+        self.sliders['max_rounds'].value = self.game_settings.max_rounds
+        self.sliders['snake_speed'].value = self.game_settings.snake_speed
+        self.sliders['hand_size'].value = self.game_settings.hand_size
+        self.sliders['grid_size'].value = self.game_settings.grid_size
+        self.sliders['num_players'].value = self.game_settings.num_players
+        self.sliders['cpu_level'].value = self.game_settings.cpu_level
+
+    def go_back(self):
+        self.sound_manager.play_sound('button_click')
+        self.next_state = 'menu'
+        self.running = False
+
+    def apply_settings(self):
+        self.sound_manager.play_sound('button_click')
+
+        self.sound_manager.set_music_volume(self.sliders['music_volume'].value)
+        self.sound_manager.set_sfx_volume(self.sliders['sfx_volume'].value)
+
+        self.game_settings.max_rounds = int(self.sliders['max_rounds'].value)
+        self.game_settings.snake_speed = self.sliders['snake_speed'].value
+        self.game_settings.hand_size = int(self.sliders['hand_size'].value)
+        self.game_settings.grid_size = int(self.sliders['grid_size'].value)
+        self.game_settings.num_players = int(
+            self.sliders['num_players'].value)
+        self.game_settings.cpu_level = int(self.sliders['cpu_level'].value)
+
+        self.game_settings.validate()
+
+        print("Settings applied:", self.game_settings.to_dict())
+
+    def handle_events(self, events):
+        for event in events:
+            self.profiler.handle_event(event)
+            if event.type == pygame.QUIT:
+                self.next_state = 'quit'
+                self.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    self.go_back()
+
+        for slider in self.sliders.values():
+            slider.update(events)
+
+        for button in self.buttons:
+            old_hover = button.hovered
+            button.update(events)
+            if button.hovered and not old_hover:
+                self.sound_manager.play_sound('button_hover')
+
+    def update(self, dt):
+        self.sound_manager.update(dt)
+
+    def draw(self):
+        self.screen.fill(DARK_GRAY)
+
+        draw_text(self.screen, "SETTINGS", self.title_font,
+                  LIGHT_GRAY, (WIDTH // 2, 80))
+
+        # The level slider names the level it is on
+        cpu_slider = self.sliders['cpu_level']
+        cpu_slider.label = f"CPU: {CPU_LEVELS[int(cpu_slider.value)][0]}"
+
+        for slider in self.sliders.values():
+            slider.draw(self.screen)
+
+        for button in self.buttons:
+            button.draw(self.screen)
+
+        desc_text = "Adjust game parameters. Changes apply to new games."
+        draw_text(self.screen, desc_text, self.label_font,
+                  (150, 150, 150), (WIDTH // 2, HEIGHT - 120))
+
+        self.profiler.draw(self.screen)
+
+        with self.profiler.phase('flip'):
+            pygame.display.flip()
+
+    def run(self, clock):
+        """Run the settings menu loop"""
+        while self.running:
+            dt = clock.tick(FPS) / 1000
+
+            self.profiler.begin_frame()
+            with self.profiler.phase('events'):
+                events = pygame.event.get()
+                self.handle_events(events)
+
+            with self.profiler.phase('update'):
+                self.update(dt)
+            with self.profiler.phase('ui'):
+                self.draw()
+            self.profiler.end_frame(idle=True)
+
+        return self.next_state
@@ -1,5 +1,6 @@
 import pygame
 from util import draw_text
+from .asset_loader import load_font
 
 
 class Slider:
@@ -13,8 +14,7 @@ class Slider:
         self.value = initial_val
         self.label = label
         self.force_int = force_int
-        self.font = pygame.font.Font(
-            font, font_size) if font else pygame.font.Font(None, font_size)
+        self.font = load_font(font, font_size)
 
         self.dragging = False
         self.handle_radius = height // 2 + 2
@@ -25,6 +25,10 @@ class Slider:
         self.handle_color = (255, 255, 255)
         self.handle_hover_color = (200, 200, 200)
 
+        # Cached text surfaces, re-rendered only when label or value changes
+        self._label_cache = None
+        self._value_cache = None
+
     def get_handle_x(self):
         """Calculate handle x position based on current value"""
         ratio = (self.value - self.min_val) / (self.max_val - self.min_val)
@@ -88,17 +92,32 @@ class Slider:
 
         # Draw label
         if self.label:
-            label_surface = self.font.render(self.label, True, (255, 255, 255))
+            label_surface = self._get_label_surface()
             label_rect = label_surface.get_rect(
                 midright=(self.rect.x - 20, self.rect.centery))
             surface.blit(label_surface, label_rect)
 
         # Draw value
+        value_surface = self._get_value_surface()
+        value_rect = value_surface.get_rect(
+            midleft=(self.rect.right + 20, self.rect.centery))
+        surface.blit(value_surface, value_rect)
+
+    def _get_label_surface(self):
+        """Return the rendered label, re-rendering only if it changed"""
+        if self._label_cache is None or self._label_cache[0] != self.label:
+            label_surface = self.font.render(self.label, True, (255, 255, 255))
+            self._label_cache = (self.label, label_surface)
+        return self._label_cache[1]
+
+    def _get_value_surface(self):
+        """Return the rendered value, re-rendering only if it changed"""
         if isinstance(self.value, float):
             value_text = f"{self.value:.2f}"
         else:
             value_text = str(int(self.value))
-        value_surface = self.font.render(value_text, True, (255, 255, 255))
-        value_rect = value_surface.get_rect(
-            midleft=(self.rect.right + 20, self.rect.centery))
-        surface.blit(value_surface, value_rect)
+
+        if self._value_cache is None or self._value_cache[0] != value_text:
+            value_surface = self.font.render(value_text, True, (255, 255, 255))
+            self._value_cache = (value_text, value_surface)
+        return self._value_cache[1]
@@ -1,11 +1,13 @@
 import pygame
 from util import Direction
 from config import *
+from .snake_body import RunBody
 
 
 class Snake:
     def __init__(self, position, head_color, body_color, grid_top_left=(0, 0),
-                 init_direction=Direction.RIGHT, grid_size=20):
+                 init_direction=Direction.RIGHT, grid_size=20,
+                 run_body=SNAKE_RUN_BODY):
         self.position = position  # (x, y) tuple
         self.head_color = head_color
         self.body_color = body_color
@@ -16,95 +18,177 @@ class Snake:
         self.direction = init_direction
         self.new_direction = [self.direction]
 
-        # List of (x, y) tuples for each segment, index in the grid
-        self.segments = [position]
+        # (x, y) grid cell of each segment, head first: a list, or a
+        # RunBody of straight runs for very long snakes
+        self.run_body = run_body
         self.grid_top_left = grid_top_left
 
+        # Shared OccupancyGrid this snake reports its changes to, if any
+        self.occupancy = None
+        self.owner = None
+
         # Initialize the snake with a given length
+        cells = [position]
         for i in range(1, SNAKE_INIT_LENGTH):
             dx, dy = self.direction.value
-            new_segment = (self.segments[i - 1][0] - dx,
-                           self.segments[i - 1][1] - dy)
-            self.segments.append(new_segment)
+            cells.append((cells[i - 1][0] - dx, cells[i - 1][1] - dy))
+        self.segments = self._make_body(cells)
+
+        # Segment ids: index i has id head_id - i. Ids stay with their cell
+        # as the snake moves, so the culling index only changes at the ends
+        self.head_id = len(self.segments) - 1
+        self.chunks = {}  # (chunk x, chunk y) -> set of segment ids
 
         # For smooth interpolation
-        self.visual_segments = []  # (x, y) in pixels, not grid coords
-        self.target_segments = []   # Target pixel positions
+        self.visual_segments = {}  # index -> [x, y] in pixels, not grid coords
         self.interpolation_speed = INTERPOLATION_SPEED
+        self._visible = None  # indexes to draw, from the last interpolation
+        self._init_visual_positions()
+
+    def _make_body(self, cells):
+        if self.run_body:
+            return RunBody(cells, self.grid_size)
+        return list(cells)
+
+    def set_segments(self, cells):
+        """Replace the whole body, e.g. when restoring a snapshot"""
+        self.segments = self._make_body(cells)
         self._init_visual_positions()
 
     def _init_visual_positions(self):
-        """Initialize visual positions to match current grid positions"""
-        start_x, start_y = self.grid_top_left
-        self.visual_segments = []
-        self.target_segments = []
-
-        for gx, gy in self.segments:
-            x = start_x + gx * (self.segment_size + self.gap)
-            y = start_y + gy * (self.segment_size + self.gap)
-            self.visual_segments.append([x, y])
-            self.target_segments.append([x, y])
-
-    def _update_target_positions(self):
-        """Update target positions based on grid positions"""
-        start_x, start_y = self.grid_top_left
-        self.target_segments = []
-
-        for gx, gy in self.segments:
-            x = start_x + gx * (self.segment_size + self.gap)
-            y = start_y + gy * (self.segment_size + self.gap)
-            self.target_segments.append([x, y])
-
-    def update_interpolation(self, dt):
-        """Smoothly interpolate visual positions towards targets"""
-        # Ensure we have the right number of visual segments
-        while len(self.visual_segments) < len(self.segments):
-            if self.visual_segments:
-                self.visual_segments.append(list(self.visual_segments[-1]))
+        """Snap visuals to the grid and rebuild the culling index"""
+        self.visual_segments = {}
+        self._visible = None
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        self.head_id = len(self.segments) - 1
+        if self.run_body:
+            # Runs are culled whole when drawn; no per-segment index
+            self.chunks = None
+            return
+        self.chunks = {}
+        for i, cell in enumerate(self.segments):
+            self._index_add(self.head_id - i, cell)
+
+    def _index_add(self, segment_id, cell):
+        if self.chunks is None:
+            return
+        key = (cell[0] // SNAKE_INDEX_CHUNK, cell[1] // SNAKE_INDEX_CHUNK)
+        ids = self.chunks.get(key)
+        if ids is None:
+            ids = self.chunks[key] = set()
+        ids.add(segment_id)
+
+    def _index_remove(self, segment_id, cell):
+        if self.chunks is None:
+            return
+        key = (cell[0] // SNAKE_INDEX_CHUNK, cell[1] // SNAKE_INDEX_CHUNK)
+        ids = self.chunks[key]
+        ids.discard(segment_id)
+        if not ids:
+            del self.chunks[key]
+
+    def _target(self, index):
+        """Pixel position of a segment's grid cell"""
+        gx, gy = self.segments[index]
+        step = self.segment_size + self.gap
+        return (self.grid_top_left[0] + gx * step,
+                self.grid_top_left[1] + gy * step)
+
+    def visible_indexes(self, camera=None):
+        """Indexes of segments inside the camera view, head first"""
+        if self.run_body:
+            # Run bodies are drawn per run and snap to their cells; only
+            # the head is drawn and interpolated on its own
+            return (0,)
+        if camera is None or not camera.active:
+            return range(len(self.segments))
+        # One cell of margin for segments still sliding between cells
+        first_col, first_row, end_col, end_row = camera.visible_cells(margin=1)
+        indexes = []
+        for chunk_y in range(first_row // SNAKE_INDEX_CHUNK,
+                             (end_row - 1) // SNAKE_INDEX_CHUNK + 1):
+            for chunk_x in range(first_col // SNAKE_INDEX_CHUNK,
+                                 (end_col - 1) // SNAKE_INDEX_CHUNK + 1):
+                ids = self.chunks.get((chunk_x, chunk_y))
+                if ids:
+                    indexes.extend(self.head_id - segment_id
+                                   for segment_id in ids)
+        indexes.sort()
+        return indexes
+
+    def update_interpolation(self, dt, camera=None):
+        """Smoothly interpolate visible segments towards their grid cells"""
+        indexes = self.visible_indexes(camera)
+        lerp_factor = min(1.0, self.interpolation_speed * dt)
+
+        # Segments coming into view start on their cell; ones that left the
+        # view are forgotten
+        visual = {}
+        for i in indexes:
+            target_x, target_y = self._target(i)
+            current = self.visual_segments.get(i)
+            if current is None:
+                visual[i] = [target_x, target_y]
             else:
-                self._init_visual_positions()
-                return
-
-        while len(self.visual_segments) > len(self.segments):
-            self.visual_segments.pop()
-
-        # Interpolate each segment
-        for i in range(len(self.visual_segments)):
-            if i < len(self.target_segments):
-                target_x, target_y = self.target_segments[i]
-                current_x, current_y = self.visual_segments[i]
-
-                lerp_factor = min(1.0, self.interpolation_speed * dt)
-                new_x = current_x + (target_x - current_x) * lerp_factor
-                new_y = current_y + (target_y - current_y) * lerp_factor
-
-                self.visual_segments[i] = [new_x, new_y]
-
-    def draw(self, surface, use_interpolation=True):
-        """Draw snake with optional smooth interpolation"""
-        if use_interpolation and self.visual_segments:
-            positions = self.visual_segments
-        else:
-            start_x, start_y = self.grid_top_left
-            positions = []
-            for gx, gy in self.segments:
-                x = start_x + gx * (self.segment_size + self.gap)
-                y = start_y + gy * (self.segment_size + self.gap)
-                positions.append([x, y])
-
-        for i, (x, y) in enumerate(positions[::-1]):
-            rect = (x, y, self.segment_size, self.segment_size)
-            color = self.head_color if i == (
-                len(positions) - 1) else self.body_color
-            pygame.draw.rect(surface, color, rect, border_radius=5)
-
-            if i == len(positions) - 1:
-                highlight_rect = (
-                    x + 2, y + 2, self.segment_size - 4, self.segment_size - 4)
+                current_x, current_y = current
+                visual[i] = [current_x + (target_x - current_x) * lerp_factor,
+                             current_y + (target_y - current_y) * lerp_factor]
+        self.visual_segments = visual
+        self._visible = indexes
+
+    def draw(self, surface, use_interpolation=True, camera=None):
+        """Draw the segments in view, with optional smooth interpolation"""
+        indexes = self._visible
+        if indexes is None or not use_interpolation:
+            indexes = self.visible_indexes(camera)
+
+        size = self.segment_size
+        radius = 5
+        if camera is not None and camera.active:
+            size = max(1, round(size * camera.zoom))
+            radius = round(5 * camera.zoom)
+
+        if self.run_body:
+            self._draw_runs(surface, camera, radius)
+
+        # Tail first so the head ends up on top; skip segments removed since
+        # the last interpolation
+        count = len(self.segments)
+        for i in reversed(indexes):
+            if i >= count:
+                continue
+            position = self.visual_segments.get(i) if use_interpolation else None
+            x, y = position if position is not None else self._target(i)
+            if camera is not None:
+                x, y = camera.apply(x, y)
+            rect = (x, y, size, size)
+            color = self.head_color if i == 0 else self.body_color
+            pygame.draw.rect(surface, color, rect, border_radius=radius)
+
+            if i == 0:
+                highlight_rect = (x + 2, y + 2, size - 4, size - 4)
                 highlight_color = tuple(min(255, c + 40)
                                         for c in self.head_color)
                 pygame.draw.rect(surface, highlight_color,
-                                 highlight_rect, border_radius=4)
+                                 highlight_rect, border_radius=max(0, radius - 1))
+
+    def _draw_runs(self, surface, camera, radius):
+        """One rect per straight run of the body; the head is drawn apart"""
+        step = self.segment_size + self.gap
+        zoom = camera.zoom if camera is not None and camera.active else 1
+        left, top = self.grid_top_left
+        clip = surface.get_clip()
+        for gx, gy, width, height in self.segments.rects(skip_head=True):
+            x, y = left + gx * step, top + gy * step
+            if camera is not None:
+                x, y = camera.apply(x, y)
+            rect = pygame.Rect(x, y, round((width * step - self.gap) * zoom),
+                               round((height * step - self.gap) * zoom))
+            if clip.colliderect(rect):
+                pygame.draw.rect(surface, self.body_color, rect,
+                                 border_radius=radius)
 
     def turn(self, turn_dir):
         if turn_dir not in ("left", "right"):
@@ -125,28 +209,41 @@ class Snake:
         self.direction = self.new_direction.pop(
             0) if self.new_direction else self.direction
 
-        dx, dy = self.direction.value
-        new_head = (self.segments[0][0] + dx, self.segments[0][1] + dy)
-        self.segments = [new_head] + self.segments[:-1]
-
         # Teleport snake to opposite side - use instance grid_size
+        dx, dy = self.direction.value
         head_x, head_y = self.segments[0]
-        head_x = head_x % self.grid_size
-        head_y = head_y % self.grid_size
-        self.segments[0] = (head_x, head_y)
+        new_head = ((head_x + dx) % self.grid_size,
+                    (head_y + dy) % self.grid_size)
+        tail_id = self.head_id - (len(self.segments) - 1)
+        self.segments.insert(0, new_head)
+        old_tail = self.segments.pop()
+
+        self.head_id += 1
+        self._index_add(self.head_id, new_head)
+        self._index_remove(tail_id, old_tail)
 
-        self._update_target_positions()
+        if self.occupancy is not None:
+            self.occupancy.move(self.owner, new_head, old_tail)
 
     def grow(self):
         tail = self.segments[-1]
         self.segments.append(tail)
+        self._index_add(self.head_id - (len(self.segments) - 1), tail)
+        if self.occupancy is not None:
+            self.occupancy.add(self.owner, tail)
 
     def shrink(self):
         if len(self.segments) > 2:
-            self.segments.pop()
+            tail_id = self.head_id - (len(self.segments) - 1)
+            tail = self.segments.pop()
+            self._index_remove(tail_id, tail)
+            if self.occupancy is not None:
+                self.occupancy.remove(self.owner, tail)
 
     def reverse(self):
         self.segments.reverse()
+        # Every index changed, so renumber the culling index
+        self._rebuild_index()
 
         opposites = {
             Direction.UP: Direction.DOWN,
@@ -0,0 +1,153 @@
+from collections import deque
+
+
+class RunBody:
+    """
+    Snake body stored as straight runs instead of one tuple per cell.
+
+    Each run is [x, y, dx, dy, length]: the run's cell nearest the head and
+    the step from each of its cells to the next one towards the head, so
+    cell k of the run is (x - k * dx, y - k * dy) wrapped to the board.
+    Stacked cells left by growing are a run with a (0, 0) step. A snake
+    moving in a straight line only changes its head and tail runs, so
+    moves are O(1) and memory grows with the number of turns, not length.
+
+    Supports the list operations Snake uses: len, iteration, indexing,
+    insert at 0, append, pop from the end and reverse.
+    """
+
+    __slots__ = ('grid_size', 'runs', '_length')
+
+    def __init__(self, cells, grid_size):
+        self.grid_size = grid_size
+        self.runs = deque()  # head run first
+        self._length = 0
+        for cell in cells:
+            self.append(cell)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        size = self.grid_size
+        for x, y, dx, dy, length in self.runs:
+            yield (x, y)
+            for k in range(1, length):
+                yield ((x - k * dx) % size, (y - k * dy) % size)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("snake body index out of range")
+        # Walk runs from whichever end is nearer
+        if index < self._length // 2:
+            for run in self.runs:
+                if index < run[4]:
+                    return self._cell(run, index)
+                index -= run[4]
+        index = self._length - 1 - index
+        for run in reversed(self.runs):
+            if index < run[4]:
+                return self._cell(run, run[4] - 1 - index)
+            index -= run[4]
+
+    def _cell(self, run, k):
+        x, y, dx, dy, _ = run
+        if k == 0:
+            return (x, y)
+        return ((x - k * dx) % self.grid_size, (y - k * dy) % self.grid_size)
+
+    def _step(self, to_cell, from_cell):
+        """Shortest step between two cells on the wrapping board"""
+        size = self.grid_size
+        half = size // 2
+        return ((to_cell[0] - from_cell[0] + half) % size - half,
+                (to_cell[1] - from_cell[1] + half) % size - half)
+
+    def insert(self, index, cell):
+        """Add a new head; only index 0 is supported"""
+        if index != 0:
+            raise ValueError("RunBody can only insert at the head")
+        self._length += 1
+        if not self.runs:
+            self.runs.append([cell[0], cell[1], None, None, 1])
+            return
+        run = self.runs[0]
+        dx, dy = self._step(cell, (run[0], run[1]))
+        if run[4] == 1 or (dx == run[2] and dy == run[3]):
+            run[0], run[1], run[2], run[3] = cell[0], cell[1], dx, dy
+            run[4] += 1
+        else:
+            self.runs.appendleft([cell[0], cell[1], None, None, 1])
+
+    def append(self, cell):
+        """Add a new tail cell"""
+        self._length += 1
+        if not self.runs:
+            self.runs.append([cell[0], cell[1], None, None, 1])
+            return
+        run = self.runs[-1]
+        dx, dy = self._step(self._cell(run, run[4] - 1), cell)
+        if run[4] == 1 or (dx == run[2] and dy == run[3]):
+            run[2], run[3] = dx, dy
+            run[4] += 1
+        else:
+            self.runs.append([cell[0], cell[1], None, None, 1])
+
+    def pop(self, index=-1):
+        """Remove and return the tail cell; only index -1 is supported"""
+        if index != -1:
+            raise ValueError("RunBody can only pop the tail")
+        if not self.runs:
+            raise IndexError("pop from empty snake body")
+        run = self.runs[-1]
+        cell = self._cell(run, run[4] - 1)
+        run[4] -= 1
+        if not run[4]:
+            self.runs.pop()
+        self._length -= 1
+        return cell
+
+    def reverse(self):
+        """Swap head and tail; O(runs)"""
+        runs = deque()
+        for run in self.runs:
+            x, y, dx, dy, length = run
+            if length > 1:
+                x, y = self._cell(run, length - 1)
+                dx, dy = -dx, -dy
+            runs.appendleft([x, y, dx, dy, length])
+        self.runs = runs
+
+    def rects(self, skip_head=False):
+        """
+        Yield (x, y, width, height) in cells covering the body: one per
+        straight run, split where a run wraps around the board edge.
+        """
+        size = self.grid_size
+        start = 1 if skip_head else 0
+        for run in self.runs:
+            x, y, dx, dy, length = run
+            first, start = start, 0
+            if first >= length:
+                continue
+            if length - first == 1 or (dx == 0 and dy == 0):
+                yield (*self._cell(run, first), 1, 1)
+                continue
+            if abs(dx) + abs(dy) != 1:
+                # Not a line of neighbours (only from hand-made bodies)
+                for k in range(first, length):
+                    yield (*self._cell(run, k), 1, 1)
+                continue
+
+            # Unwrapped span along the run's axis, then cut at the edges
+            span = min(length - first, size)
+            near = (x if dx else y) - first * (dx or dy)
+            far = near - (span - 1) * (dx or dy)
+            low, high = min(near, far), max(near, far)
+            while low <= high:
+                begin = low % size
+                piece = min(high - low + 1, size - begin)
+                yield (begin, y, piece, 1) if dx else (x, begin, 1, piece)
+                low += piece
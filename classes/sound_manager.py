@@ -1,13 +1,66 @@
 import pygame
 import os
+import wave
+from config import *
 
 
 class SoundManager:
     """Manages all game sounds and music"""
 
-    def __init__(self):
+    # Fallback tones for sounds without a WAV file: name -> (Hz, seconds)
+    PROCEDURAL_TONES = {
+        'card_select': (523, 0.05),   # C5
+        'card_confirm': (659, 0.15),  # E5
+        'collision': (220, 0.2),      # A3
+        'button_hover': (440, 0.03),  # A4
+        'button_click': (523, 0.08),  # C5
+        'undo': (392, 0.1),           # G4
+        'win': (784, 0.3),            # G5
+        'snake_move': (330, 0.04),    # E4
+    }
+    DEFAULT_TONE = (440, 0.1)
+
+    # Playback policy: name -> (priority, max concurrent voices, coalesce ms)
+    # Higher priority sounds may steal channels from lower priority ones.
+    SOUND_POLICIES = {
+        'collision': (10, 2, 0),
+        'win': (10, 1, 0),
+        'card_confirm': (6, 2, 0),
+        'undo': (5, 2, SOUND_COALESCE_MS),
+        'card_select': (5, 2, SOUND_COALESCE_MS),
+        'button_click': (5, 2, SOUND_COALESCE_MS),
+        'snake_move': (2, 1, 60),
+        'button_hover': (1, 1, 80),
+    }
+    DEFAULT_POLICY = (3, 2, SOUND_COALESCE_MS)
+
+    SOUND_FILES = {
+        'card_select': 'assets/sounds/card_select.wav',
+        'card_confirm': 'assets/sounds/card_confirm.wav',
+        'collision': 'assets/sounds/collision.wav',
+        'button_hover': 'assets/sounds/button_hover.wav',
+        'button_click': 'assets/sounds/button_click.wav',
+        'undo': 'assets/sounds/undo.wav',
+        'win': 'assets/sounds/win.wav',
+        'snake_move': 'assets/sounds/snake_move.wav',
+    }
+
+    def __init__(self, loader=None):
         pygame.mixer.init()
 
+        # Channel pool; each entry records (sound name, priority) of its voice
+        pygame.mixer.set_num_channels(SOUND_CHANNELS + MUSIC_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i)
+                         for i in range(SOUND_CHANNELS)]
+        self._channel_owners = [None] * SOUND_CHANNELS
+        self._last_played = {}
+        self.played_counts = {}
+        self.dropped_counts = {}
+        self.merged_counts = {}
+
+        # Optional AssetLoader that decodes sounds in the background
+        self.loader = loader
+
         # Sound effects
         self.sounds = {}
         self.music_tracks = {}
@@ -15,150 +68,339 @@ class SoundManager:
         self.music_volume = 0.5
         self.sfx_volume = 0.7
 
+        # Music is decoded up front and crossfaded between two channels
+        self.music_channels = [pygame.mixer.Channel(SOUND_CHANNELS + i)
+                               for i in range(MUSIC_CHANNELS)]
+        self._music_sounds = {}
+        self._active_music = None
+        self._pending_music = None
+        self._fade = None
+        self.music_paused = False
+
         # Load sounds (with fallback if files don't exist)
         self._load_sounds()
 
     def _load_sounds(self):
-        """Load all sound files with proper error handling"""
-        sound_files = {
-            'card_select': 'assets/sounds/card_select.wav',
-            'card_confirm': 'assets/sounds/card_confirm.wav',
-            'collision': 'assets/sounds/collision.wav',
-            'button_hover': 'assets/sounds/button_hover.wav',
-            'button_click': 'assets/sounds/button_click.wav',
-            'undo': 'assets/sounds/undo.wav',
-            'win': 'assets/sounds/win.wav',
-            'snake_move': 'assets/sounds/snake_move.wav',
-        }
+        """Load all sound files, or queue them on the asset loader"""
+        for name, path in self.SOUND_FILES.items():
+            if self.loader is not None:
+                self.loader.add(('sound', name),
+                                lambda name=name, path=path: self._load_sound(name, path))
+            else:
+                self.sounds[name] = self._load_sound(name, path)
 
-        for name, path in sound_files.items():
-            try:
-                if os.path.exists(path):
-                    self.sounds[name] = pygame.mixer.Sound(path)
-                    self.sounds[name].set_volume(self.sfx_volume)
-                else:
-                    # Generate procedural sound if file doesn't exist
-                    self.sounds[name] = self._generate_sound(name)
-            except Exception as e:
-                print(f"Warning: Could not load sound '{name}': {e}")
-                self.sounds[name] = self._generate_sound(name)
-
-        # Music tracks
+        # Music tracks, decoded off the main thread when a loader is present
         self.music_tracks = {
+            'menu': 'assets/music/menu.mp3',
             'planning': 'assets/music/planning.mp3',
             'simulation': 'assets/music/simulation.mp3',
-            'menu': 'assets/music/menu.mp3',
         }
+        if self.loader is not None:
+            for name, path in self.music_tracks.items():
+                if os.path.exists(path):
+                    self.loader.add(('music', name),
+                                    lambda path=path: pygame.mixer.Sound(path))
+
+    def _load_sound(self, name, path):
+        """Load one sound file with proper error handling"""
+        try:
+            if os.path.exists(path):
+                sound = pygame.mixer.Sound(path)
+                sound.set_volume(self.sfx_volume)
+                return sound
+            # Generate procedural sound if file doesn't exist
+            return self._generate_sound(name)
+        except Exception as e:
+            print(f"Warning: Could not load sound '{name}': {e}")
+            return self._generate_sound(name)
+
+    def _get_sound(self, sound_name):
+        """Return a loaded sound, waiting only for this one if still queued"""
+        sound = self.sounds.get(sound_name)
+        if sound is None and self.loader is not None and sound_name in self.SOUND_FILES:
+            try:
+                sound = self.loader.get(('sound', sound_name))
+            except KeyError:
+                return None
+            sound.set_volume(self.sfx_volume)
+            self.sounds[sound_name] = sound
+        return sound
 
     def _generate_sound(self, sound_type):
-        """Generate simple procedural sounds using pygame"""
-        # Create a simple beep sound as fallback
-        sample_rate = 22050
-        duration = 0.1
-        frequency = 440
-
-        if sound_type == 'card_select':
-            frequency = 523  # C5
-            duration = 0.05
-        elif sound_type == 'card_confirm':
-            frequency = 659  # E5
-            duration = 0.15
-        elif sound_type == 'collision':
-            frequency = 220  # A3
-            duration = 0.2
-        elif sound_type == 'button_hover':
-            frequency = 440  # A4
-            duration = 0.03
-        elif sound_type == 'button_click':
-            frequency = 523  # C5
-            duration = 0.08
-        elif sound_type == 'undo':
-            frequency = 392  # G4
-            duration = 0.1
-        elif sound_type == 'win':
-            frequency = 784  # G5
-            duration = 0.3
-        elif sound_type == 'snake_move':
-            frequency = 330  # E4
-            duration = 0.04
-
-        # Generate sine wave
-        n_samples = int(sample_rate * duration)
+        """Load a procedural fallback tone, synthesizing it on a cache miss"""
+        frequency, duration = self.PROCEDURAL_TONES.get(
+            sound_type, self.DEFAULT_TONE)
+        sample_rate = SOUND_SAMPLE_RATE
+
+        cache_path = os.path.join(
+            SOUND_CACHE_DIR,
+            f"{sound_type}_{frequency}_{duration}_{sample_rate}.wav")
+
+        if not os.path.exists(cache_path):
+            self._synthesize_tone(cache_path, frequency, duration, sample_rate)
+
+        sound = pygame.mixer.Sound(cache_path)
+        sound.set_volume(self.sfx_volume)
+        return sound
+
+    def _synthesize_tone(self, path, frequency, duration, sample_rate):
+        """Write an enveloped sine tone as a 16-bit stereo WAV file"""
         import numpy as np
-        import math
 
         # Create sine wave
-        wave = np.array([
-            int(4096 * math.sin(2 * math.pi * frequency * i / sample_rate))
-            for i in range(n_samples)
-        ], dtype=np.int16)
+        n_samples = int(sample_rate * duration)
+        t = np.arange(n_samples) / sample_rate
+        wave_data = (4096 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
 
         # Apply envelope (fade in/out)
-        envelope = np.linspace(0, 1, n_samples // 10)
-        wave[:len(envelope)] = (wave[:len(envelope)]
-                                * envelope).astype(np.int16)
-        wave[-len(envelope):] = (wave[-len(envelope):]
+        fade = n_samples // 10
+        if fade:
+            envelope = np.linspace(0, 1, fade)
+            wave_data[:fade] = (wave_data[:fade] * envelope).astype(np.int16)
+            wave_data[-fade:] = (wave_data[-fade:]
                                  * envelope[::-1]).astype(np.int16)
 
-        # Create stereo sound
-        stereo_wave = np.column_stack((wave, wave))
+        # Interleave into stereo frames
+        stereo_wave = np.column_stack((wave_data, wave_data))
 
-        sound = pygame.sndarray.make_sound(stereo_wave)
-        sound.set_volume(self.sfx_volume)
-        return sound
+        # Write to a temp file first so a crash never leaves a partial cache entry
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with wave.open(tmp_path, 'wb') as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(stereo_wave.astype('<i2').tobytes())
+        os.replace(tmp_path, path)
 
     def play_sound(self, sound_name):
-        """Play a sound effect"""
-        if sound_name in self.sounds:
-            try:
-                self.sounds[sound_name].play()
-            except Exception as e:
-                print(f"Error playing sound '{sound_name}': {e}")
+        """Play a sound effect through the channel pool"""
+        sound = self._get_sound(sound_name)
+        if sound is None:
+            return
+
+        priority, max_voices, coalesce_ms = self.SOUND_POLICIES.get(
+            sound_name, self.DEFAULT_POLICY)
+
+        # Merge repeats that land inside the coalescing window
+        now = pygame.time.get_ticks()
+        last = self._last_played.get(sound_name)
+        if last is not None and now - last < coalesce_ms:
+            self._count(self.merged_counts, sound_name)
+            return
+
+        channel_index = self._find_channel(sound_name, priority, max_voices)
+        if channel_index is None:
+            self._count(self.dropped_counts, sound_name)
+            return
+
+        try:
+            self.channels[channel_index].play(sound)
+        except Exception as e:
+            print(f"Error playing sound '{sound_name}': {e}")
+            return
+
+        self._channel_owners[channel_index] = (sound_name, priority)
+        self._last_played[sound_name] = now
+        self._count(self.played_counts, sound_name)
+
+    def _find_channel(self, sound_name, priority, max_voices):
+        """Pick a free channel, or steal the lowest-priority voice"""
+        free_index = None
+        voices = 0
+        victim_index = None
+        victim_priority = priority
+
+        for i, channel in enumerate(self.channels):
+            owner = self._channel_owners[i]
+            if not channel.get_busy():
+                self._channel_owners[i] = None
+                if free_index is None:
+                    free_index = i
+                continue
+            if owner is None:
+                continue
+            if owner[0] == sound_name:
+                voices += 1
+            if owner[1] < victim_priority:
+                victim_index = i
+                victim_priority = owner[1]
+
+        if voices >= max_voices:
+            return None
+        if free_index is not None:
+            return free_index
+        if victim_index is not None:
+            self.channels[victim_index].stop()
+            self._count(self.dropped_counts,
+                        self._channel_owners[victim_index][0])
+            return victim_index
+        return None
+
+    @staticmethod
+    def _count(counter, sound_name):
+        counter[sound_name] = counter.get(sound_name, 0) + 1
+
+    def get_playback_stats(self):
+        """Totals of played, dropped and merged sound requests"""
+        return {
+            'played': sum(self.played_counts.values()),
+            'dropped': sum(self.dropped_counts.values()),
+            'merged': sum(self.merged_counts.values()),
+        }
+
+    def _get_music(self, track_name):
+        """Return a decoded track, or None while it is still being decoded"""
+        sound = self._music_sounds.get(track_name)
+        if sound is not None:
+            return sound
+
+        key = ('music', track_name)
+        if self.loader is not None and not self.loader.is_ready(key):
+            return None
+
+        try:
+            if self.loader is not None:
+                sound = self.loader.get(key)
+            else:
+                sound = pygame.mixer.Sound(self.music_tracks[track_name])
+        except Exception as e:
+            print(f"Error loading music '{track_name}': {e}")
+            return None
+
+        self._music_sounds[track_name] = sound
+        return sound
 
     def play_music(self, track_name, loop=True, fade_ms=1000):
-        """Play background music with optional fade-in"""
+        """
+        Crossfade to a track.
+
+        With an asset loader the track starts once the loader has decoded
+        it, without blocking; without one it is decoded here, synchronously.
+        """
         if track_name == self.current_music:
             return  # Already playing
 
         if track_name in self.music_tracks:
             music_path = self.music_tracks[track_name]
+            if not os.path.exists(music_path):
+                print(f"Music file not found: {music_path}")
+                return
 
-            # Stop current music with fade out
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.fadeout(fade_ms)
+            self.current_music = track_name
+            self._pending_music = None
 
-            try:
-                if os.path.exists(music_path):
-                    pygame.mixer.music.load(music_path)
-                    pygame.mixer.music.set_volume(self.music_volume)
-                    pygame.mixer.music.play(-1 if loop else 0, fade_ms=fade_ms)
-                    self.current_music = track_name
-                else:
-                    print(f"Music file not found: {music_path}")
-            except Exception as e:
-                print(f"Error playing music '{track_name}': {e}")
+            sound = self._get_music(track_name)
+            if sound is None:
+                # Picked up by update() as soon as the loader finishes it
+                self._pending_music = (track_name, loop, fade_ms)
+                return
+
+            self._start_music(sound, loop, fade_ms)
+
+    def _start_music(self, sound, loop, fade_ms):
+        """Start a track on the idle music channel and fade between them"""
+        self._finish_fade()
+
+        outgoing = None
+        if self._active_music is not None:
+            outgoing = self.music_channels[self._active_music]
+            incoming_index = 1 - self._active_music
+        else:
+            incoming_index = 0
+
+        incoming = self.music_channels[incoming_index]
+        try:
+            incoming.set_volume(0.0 if fade_ms > 0 else self.music_volume)
+            incoming.play(sound, loops=-1 if loop else 0)
+        except Exception as e:
+            print(f"Error playing music: {e}")
+            return
+
+        self._active_music = incoming_index
+        self._begin_fade(incoming, outgoing, fade_ms)
+
+    def _begin_fade(self, incoming, outgoing, fade_ms):
+        self._fade = {
+            'in': incoming,
+            'out': outgoing if outgoing is not None and outgoing.get_busy() else None,
+            'out_volume': outgoing.get_volume() if outgoing is not None else 0.0,
+            'elapsed': 0.0,
+            'duration': fade_ms / 1000,
+        }
+
+    def _finish_fade(self):
+        """Jump an in-progress fade to its end state"""
+        if self._fade is None:
+            return
+        if self._fade['in'] is not None:
+            self._fade['in'].set_volume(self.music_volume)
+        if self._fade['out'] is not None:
+            self._fade['out'].stop()
+        self._fade = None
+
+    def update(self, dt):
+        """Advance music crossfades; call once per frame"""
+        if self._pending_music is not None:
+            track_name, loop, fade_ms = self._pending_music
+            sound = self._get_music(track_name)
+            if sound is not None:
+                self._pending_music = None
+                self._start_music(sound, loop, fade_ms)
+            elif self.loader is None or self.loader.is_ready(('music', track_name)):
+                # Decoding failed; give up instead of retrying every frame
+                self._pending_music = None
+
+        if self._fade is None or self.music_paused:
+            return
+
+        fade = self._fade
+        fade['elapsed'] += dt
+        if fade['duration'] > 0:
+            progress = min(1.0, fade['elapsed'] / fade['duration'])
+        else:
+            progress = 1.0
+
+        if fade['in'] is not None:
+            fade['in'].set_volume(self.music_volume * progress)
+        if fade['out'] is not None:
+            fade['out'].set_volume(fade['out_volume'] * (1 - progress))
+
+        if progress >= 1.0:
+            self._finish_fade()
 
     def stop_music(self, fade_ms=1000):
         """Stop background music with fade out"""
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.fadeout(fade_ms)
+        self._finish_fade()
+        if self._active_music is not None:
+            outgoing = self.music_channels[self._active_music]
+            self._begin_fade(None, outgoing, fade_ms)
+        self._active_music = None
+        self._pending_music = None
         self.current_music = None
 
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if self._fade is None and self._active_music is not None:
+            self.music_channels[self._active_music].set_volume(
+                self.music_volume)
 
     def set_sfx_volume(self, volume):
         """Set sound effects volume (0.0 to 1.0)"""
         self.sfx_volume = max(0.0, min(1.0, volume))
+        # Sounds still loading pick up the volume when first fetched
         for sound in self.sounds.values():
             sound.set_volume(self.sfx_volume)
 
     def pause_music(self):
         """Pause background music"""
-        pygame.mixer.music.pause()
+        self.music_paused = True
+        for channel in self.music_channels:
+            channel.pause()
 
     def unpause_music(self):
         """Resume background music"""
-        pygame.mixer.music.unpause()
+        self.music_paused = False
+        for channel in self.music_channels:
+            channel.unpause()
@@ -0,0 +1,122 @@
+try:
+    import numpy as np
+except ImportError:  # Optional; only the array helpers need it
+    np = None
+
+# Per grid size: shortest wrapped distance for each axis offset
+_AXIS = {}
+# Per grid size: NumPy table of distances indexed [dy % size, dx % size]
+_TABLES = {}
+
+
+def axis_distances(grid_size):
+    """Shortest distance along one wrapping axis, indexed by offset % size"""
+    table = _AXIS.get(grid_size)
+    if table is None:
+        table = _AXIS[grid_size] = tuple(min(offset, grid_size - offset)
+                                         for offset in range(grid_size))
+    return table
+
+
+def torus_distance(a, b, grid_size):
+    """Moves between two cells on the wrapping board, ignoring obstacles"""
+    axis = axis_distances(grid_size)
+    return (axis[(a[0] - b[0]) % grid_size]
+            + axis[(a[1] - b[1]) % grid_size])
+
+
+def distance_table(grid_size):
+    """(size, size) array of distances by offset, built once per size"""
+    table = _TABLES.get(grid_size)
+    if table is None:
+        axis = np.array(axis_distances(grid_size), dtype=np.uint16)
+        table = _TABLES[grid_size] = axis[:, None] + axis[None, :]
+        table.flags.writeable = False
+    return table
+
+
+def distance_field(cell, grid_size):
+    """Distance from cell to every cell, as a [y, x] array"""
+    return np.roll(distance_table(grid_size), (cell[1], cell[0]), axis=(0, 1))
+
+
+def free_components(free):
+    """
+    Label the connected regions of free cells on the wrapping board.
+
+    A scanline flood fill: NumPy splits every row into runs of free cells
+    (joining runs across the left/right edge), runs that touch vertically
+    are merged by propagating the smallest root, and region sizes are
+    summed per run. All of it is array work over runs rather than cells.
+
+    Returns (labels, sizes): labels is a [y, x] int array with -1 on
+    blocked cells, and sizes[label] is that region's cell count.
+    """
+    size = free.shape[0]
+    # A run starts where a free cell follows a blocked one, wrapping in x
+    starts = free & ~np.roll(free, 1, axis=1)
+    run_ids = np.cumsum(starts.ravel()).reshape(size, size) - 1
+
+    # Cells before a row's first start continue the row's last run; a row
+    # with no start is either fully blocked or one run all the way round
+    row_starts = starts.sum(axis=1)
+    first_run = np.concatenate(([0], np.cumsum(row_starts)[:-1]))
+    last_run = first_run + row_starts - 1
+    before_first = np.cumsum(starts, axis=1) == 0
+    open_rows = (row_starts == 0) & free.all(axis=1)
+    extra = np.cumsum(open_rows) - 1 + int(starts.sum())
+    fallback = np.where(row_starts > 0, last_run, extra)
+    run_ids = np.where(before_first, fallback[:, None], run_ids)
+    run_ids = np.where(free, run_ids, -1)
+    run_count = int(starts.sum()) + int(open_rows.sum())
+    if not run_count:
+        return run_ids, np.zeros(0, dtype=np.int64)
+
+    # Merge runs that touch across rows (including the top/bottom edge):
+    # every run takes the smallest root among its neighbours, with
+    # pointer jumping, until nothing changes
+    below = np.roll(run_ids, -1, axis=0)
+    touching = free & (below >= 0)
+    # Along a row the pair only changes where either run does; column 0
+    # is kept for rows where neither ever changes
+    changes = ((run_ids != np.roll(run_ids, 1, axis=1))
+               | (below != np.roll(below, 1, axis=1)))
+    changes[:, 0] = True
+    touching &= changes
+    upper, lower = run_ids[touching], below[touching]
+    roots = np.arange(run_count)
+    while True:
+        smallest = np.minimum(roots[upper], roots[lower])
+        merged = roots.copy()
+        np.minimum.at(merged, roots[upper], smallest)
+        np.minimum.at(merged, roots[lower], smallest)
+        merged = merged[merged]
+        if np.array_equal(merged, roots):
+            break
+        roots = merged
+
+    _, run_labels = np.unique(roots, return_inverse=True)
+    labels = np.where(free, run_labels[np.maximum(run_ids, 0)], -1)
+    sizes = np.bincount(labels[free])
+    return labels, sizes
+
+
+def reachable_areas(free, heads):
+    """
+    Free cells each head can still reach, for many heads at once.
+
+    A head counts every region next to it once, however many of its
+    neighbours lead there. Cells that will be freed as tails move on are
+    not counted, so the result is a lower bound.
+    """
+    size = free.shape[0]
+    labels, sizes = free_components(free)
+    areas = []
+    for x, y in heads:
+        regions = set()
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            label = labels[(y + dy) % size, (x + dx) % size]
+            if label >= 0:
+                regions.add(int(label))
+        areas.append(sum(int(sizes[label]) for label in regions))
+    return areas
@@ -1,23 +1,26 @@
 import pygame
 from config import *
 from .button import Button
+from .profiler import FrameProfiler
 from util import draw_text
+from .asset_loader import load_font
 
 
 class TutorialPage:
     """Tutorial/Instructions screen"""
 
-    def __init__(self, screen, sound_manager):
+    def __init__(self, screen, sound_manager, profiler=None):
         self.screen = screen
         self.sound_manager = sound_manager
+        self.profiler = profiler if profiler is not None else FrameProfiler()
         self.running = True
         self.next_state = None
 
         # Fonts
-        self.title_font = pygame.font.Font(MINECRAFT_FONT, 48)
-        self.heading_font = pygame.font.Font(MINECRAFT_FONT, 28)
-        self.text_font = pygame.font.Font(MINECRAFT_FONT, 18)
-        self.small_font = pygame.font.Font(MINECRAFT_FONT, 14)
+        self.title_font = load_font(MINECRAFT_FONT, 48)
+        self.heading_font = load_font(MINECRAFT_FONT, 28)
+        self.text_font = load_font(MINECRAFT_FONT, 18)
+        self.small_font = load_font(MINECRAFT_FONT, 14)
 
         # Current page
         self.current_page = 0
@@ -176,6 +179,16 @@ class TutorialPage:
             }
         ]
 
+    def enter(self):
+        """Reset loop state and start again from the first page"""
+        self.running = True
+        self.next_state = None
+        self.current_page = 0
+        self.update_button_states()
+
+    def exit(self):
+        """Nothing to release; the tutorial stays warm between visits"""
+
     def go_back(self):
         self.sound_manager.play_sound('button_click')
         self.next_state = 'menu'
@@ -200,6 +213,7 @@ class TutorialPage:
 
     def handle_events(self, events):
         for event in events:
+            self.profiler.handle_event(event)
             if event.type == pygame.QUIT:
                 self.next_state = 'quit'
                 self.running = False
@@ -219,7 +233,7 @@ class TutorialPage:
                 self.sound_manager.play_sound('button_hover')
 
     def update(self, dt):
-        pass
+        self.sound_manager.update(dt)
 
     def draw(self):
         self.screen.fill(DARK_GRAY)
@@ -269,16 +283,25 @@ class TutorialPage:
         for button in self.buttons:
             button.draw(self.screen)
 
-        pygame.display.flip()
+        self.profiler.draw(self.screen)
+
+        with self.profiler.phase('flip'):
+            pygame.display.flip()
 
     def run(self, clock):
         """Run the tutorial loop"""
         while self.running:
-            events = pygame.event.get()
-            self.handle_events(events)
-
             dt = clock.tick(FPS) / 1000
-            self.update(dt)
-            self.draw()
+
+            self.profiler.begin_frame()
+            with self.profiler.phase('events'):
+                events = pygame.event.get()
+                self.handle_events(events)
+
+            with self.profiler.phase('update'):
+                self.update(dt)
+            with self.profiler.phase('ui'):
+                self.draw()
+            self.profiler.end_frame(idle=True)
 
         return self.next_state
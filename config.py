@@ -28,24 +28,66 @@ GRASSY_GREEN = (100, 200, 100)
 
 # Font
 MINECRAFT_FONT = "assets/fonts/minecraft.ttf"
+MENU_FONTS = [72, 24, 32]                 # Needed before the first frame
+PRELOAD_FONTS = [48, 20, 28, 18, 14, 16, 36]  # Loaded in the background
+
+# Sound settings
+SOUND_CACHE_DIR = ".cache/sounds"  # Synthesized fallback tones are kept here
+SOUND_SAMPLE_RATE = 22050
+SOUND_CHANNELS = 16        # Mixer channels in the voice pool
+SOUND_COALESCE_MS = 40     # Repeats of one sound inside this window are merged
+MUSIC_CHANNELS = 2         # Two channels so tracks can crossfade
 
 # Grid settings (IMMUTABLE - use game_settings for runtime changes)
 GRID_SIZE = 20  # Number of cells in grid (width and height)
 CELL_SIZE = 25  # Size of each cell in pixels
 GAP = 2         # Gap between cells in pixels
+MAX_GRID_SIZE = 500
+GRID_BLOCK = 16      # Cells per side of the cached grid background tile
+
+# Camera (boards wider than VIEWPORT_CELLS scroll and zoom)
+VIEWPORT_CELLS = 30       # Board area on screen, in cells at zoom 1
+CAMERA_MIN_ZOOM = 0.2
+CAMERA_MAX_ZOOM = 2.0
+CAMERA_ZOOM_STEP = 1.15   # Zoom factor per mouse wheel notch
+CAMERA_PAN_SPEED = 600    # Screen pixels per second for WASD panning
+RASTER_MAX_CELL_PX = 12   # Zoomed out to this cell step, draw the board as one image
+
+# Minimap (shown in the viewport's corner while the camera is active)
+MINIMAP_SIZE = 150
+MINIMAP_MARGIN = 8
+MINIMAP_BACKGROUND = (30, 70, 30)
+MINIMAP_SNAKE = LIGHT_GRAY
 
 # Snake settings
 SNAKE_INIT_LENGTH = 5
 SNAKE_SEGMENT_SIZE = CELL_SIZE
 SNAKE_GAP = GAP
 INTERPOLATION_SPEED = 10.0
+SNAKE_INDEX_CHUNK = 8  # Cells per side of a snake's culling index chunk
+SNAKE_RUN_BODY = False  # Store bodies as straight runs (for very long snakes)
+GHOST_PATH_ALPHA = 70  # Opacity of the planned-path preview cells
 
 # Player settings (IMMUTABLE - use game_settings for runtime changes)
 MAX_HAND_SIZE = 15
+NUM_PLAYERS = 2
+MIN_PLAYERS = 2
+MAX_PLAYERS = 8
+# (name, head color, body color) for each player slot, in turn order
+PLAYER_COLORS = [
+    ("Orange", BRIGHT_ORANGE, WARM_GOLDEN),
+    ("Blue", BOLD_COBALT, LIGHT_SKY_BLUE),
+    ("Red", CRIMSON_RED, LIGHT_CORAL),
+    ("Purple", (140, 60, 200), (190, 140, 240)),
+    ("Yellow", (230, 200, 0), (255, 235, 120)),
+    ("Pink", (230, 60, 160), (255, 150, 210)),
+    ("Teal", (0, 150, 150), (100, 210, 210)),
+    ("Silver", (90, 90, 110), (210, 210, 225)),
+]
 
 # Card settings
-CARD_TYPES = ['Move', 'Grow', 'Shrink', 'Double Move', 'Reverse', 'Skip']
-CARD_WEIGHTS = [40, 15, 15, 20, 5, 5]  # Weights for random selection
+# Card types, weights and tooltips are registered in classes/card_registry.py
+CUSTOM_CARDS_FILE = "assets/cards.json"  # Optional extra cards, loaded if present
 CARD_WIDTH = 80
 CARD_HEIGHT = 120
 CARD_GAP = 10
@@ -54,6 +96,37 @@ CARDS_PER_PAGE = 6
 # Game settings (IMMUTABLE - use game_settings for runtime changes)
 MAX_ROUNDS = 3
 SNAKE_MOVE_INTERVAL = 0.5  # seconds between moves
+MATCH_AUTOSAVE = True  # Keep the match in progress on disk for --resume
+MATCH_SAVE_FILE = ".cache/match.sav"
+
+# Plan solver (exact card ordering search for small hands)
+SOLVER_MAX_OPPONENTS = 120    # Enumerate opponent orderings up to this many
+SOLVER_OPPONENT_SAMPLES = 48  # Otherwise play against this many samples
+
+# Computer opponent (takes the second player slot when enabled)
+# (name, seconds of search per turn) per level; level 0 is no CPU
+CPU_LEVELS = [("Off", 0.0), ("Easy", 0.2), ("Hard", 2.0)]
+CPU_LEVEL = 0
+CPU_SEARCH_NICENESS = 10  # Search process priority drop, so frames come first
+CPU_CANCEL_POLL = 0.02    # Seconds between checks for an abandoned search
+# Evaluation weights the search uses to order cards (see classes/evaluation.py)
+AI_WEIGHTS = {'outcome': 4.0, 'length': 0.5, 'area': 1.0, 'distance': 0.5}
+AI_AREA_CAP = 48  # Reachable cells counted before the flood fill stops
+AI_WEIGHTS_FILE = "assets/ai_weights.json"  # Tuned by tune_ai.py; optional
+# Precomputed opening plans (built by build_opening_book.py; optional)
+OPENING_BOOK_FILE = "assets/opening_book.bin"
+
+# Profiler settings (F3 toggles overlay, F4 toggles CSV recording)
+PROFILER_WINDOW = 120          # Frames kept for rolling averages and p99
+PROFILER_OVERLAY_REFRESH = 15  # Frames between overlay text refreshes
+
+# Garbage collection (automatic GC is replaced by collection between frames)
+GC_YOUNG_THRESHOLD = 700   # Net allocations before a young collection
+GC_YOUNG_LIMIT = 5000      # Collect young objects even without spare budget
+GC_YOUNG_SPARE_MS = 2.0    # Spare frame time needed for a young collection
+GC_FULL_SPARE_MS = 8.0     # Spare frame time needed for a full collection
+GC_FULL_INTERVAL = 300     # Minimum frames between idle full collections
+GC_FULL_FORCE = 50         # Gen-1 runs before a full collection is forced
 
 
 class GameSettings:
@@ -65,6 +138,8 @@ class GameSettings:
         self.snake_speed = SNAKE_MOVE_INTERVAL
         self.hand_size = MAX_HAND_SIZE
         self.grid_size = GRID_SIZE
+        self.num_players = NUM_PLAYERS
+        self.cpu_level = CPU_LEVEL
 
     def to_dict(self):
         """Convert settings to dictionary"""
@@ -73,6 +148,8 @@ class GameSettings:
             'snake_speed': self.snake_speed,
             'hand_size': self.hand_size,
             'grid_size': self.grid_size,
+            'num_players': self.num_players,
+            'cpu_level': self.cpu_level,
         }
 
     def from_dict(self, settings_dict):
@@ -82,10 +159,16 @@ class GameSettings:
             'snake_speed', SNAKE_MOVE_INTERVAL)
         self.hand_size = settings_dict.get('hand_size', MAX_HAND_SIZE)
         self.grid_size = settings_dict.get('grid_size', GRID_SIZE)
+        self.num_players = settings_dict.get('num_players', NUM_PLAYERS)
+        self.cpu_level = settings_dict.get('cpu_level', CPU_LEVEL)
 
     def validate(self):
         """Validate settings are within acceptable ranges"""
         self.max_rounds = max(1, min(10, int(self.max_rounds)))
         self.snake_speed = max(0.1, min(2.0, self.snake_speed))
         self.hand_size = max(5, min(20, int(self.hand_size)))
-        self.grid_size = max(10, min(30, int(self.grid_size)))
+        self.grid_size = max(10, min(MAX_GRID_SIZE, int(self.grid_size)))
+        self.num_players = max(MIN_PLAYERS,
+                               min(MAX_PLAYERS, int(self.num_players)))
+        self.cpu_level = max(0, min(len(CPU_LEVELS) - 1,
+                                    int(self.cpu_level)))
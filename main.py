@@ -1,87 +1,189 @@
+import sys
+import time
+
+# Taken before any heavy import so startup cost is included
+LAUNCH_TIME = time.perf_counter()
+
+# The import hook has to be in place before pygame and the game modules load,
+# so the flag is read straight from argv rather than after argument parsing
+from startup_profile import StartupProfiler
+STARTUP_PROFILER = StartupProfiler(enabled='--startup-profile' in sys.argv)
+STARTUP_PROFILER.install()
+
+import argparse
 import pygame
 from config import *
-from classes import *
+# Only what the first frame needs; other scenes are imported on demand
+from classes import FrameProfiler, MainMenu, SoundManager
+from classes.asset_loader import get_loader
+from classes.gc_control import FrameGC
+
+
+def _build_card_faces():
+    # Runs on the loader thread, so the card module is imported there too
+    from classes.card import build_card_faces
+    return build_card_faces()
 
 
 class GameManager:
     """Main game manager that handles state transitions"""
 
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Snake Card Battle")
+    def __init__(self, startup_profiler=None, resume=False):
+        self.startup = startup_profiler or StartupProfiler()
+
+        with self.startup.step('pygame.init'):
+            pygame.init()
+        with self.startup.step('display'):
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+            pygame.display.set_caption("Snake Card Battle")
         self.clock = pygame.time.Clock()
 
-        # Sound manager
-        self.sound_manager = SoundManager()
+        # Background asset loading: fonts first, then sounds and sprites
+        self.loader = get_loader()
+        self._queue_assets()
+
+        # Sound manager (sounds decode on the loader thread)
+        with self.startup.step('SoundManager'):
+            self.sound_manager = SoundManager(loader=self.loader)
+        self.loader.add('card_faces', _build_card_faces)
 
         # Game settings (using GameSettings class instead of dict)
         self.game_settings = GameSettings()
 
-        self.running = True
-        self.current_state = 'menu'  # 'menu', 'game', 'settings', 'tutorial'
+        # Frame profiler shared by every scene (F3 overlay, F4 CSV)
+        self.profiler = FrameProfiler(
+            launch_time=LAUNCH_TIME,
+            on_first_frame=lambda ms: self.startup.report(first_frame_ms=ms))
 
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            if self.current_state == 'menu':
-                # Clear any pending events before entering menu
-                pygame.event.clear()
-
-                menu = MainMenu(self.screen, self.sound_manager)
-                next_state = menu.run(self.clock)
-
-                if next_state == 'game':
-                    self.current_state = 'game'
-                elif next_state == 'settings':
-                    self.current_state = 'settings'
-                elif next_state == 'tutorial':
-                    self.current_state = 'tutorial'
-                elif next_state == 'quit':
-                    self.running = False
-
-            elif self.current_state == 'tutorial':
-                # Clear events before tutorial
-                pygame.event.clear()
-
-                tutorial = TutorialPage(self.screen, self.sound_manager)
-                next_state = tutorial.run(self.clock)
+        # Collection runs between frames instead of in the middle of them
+        self.gc_control = FrameGC()
+        self.profiler.gc_control = self.gc_control
 
-                if next_state == 'menu':
-                    self.current_state = 'menu'
-                elif next_state == 'quit':
-                    self.running = False
-
-            elif self.current_state == 'settings':
-                # Clear events before settings
-                pygame.event.clear()
+        # Scenes are built once on first visit and kept warm afterwards
+        self.scenes = {}
 
-                settings = SettingsMenu(
-                    self.screen, self.sound_manager, self.game_settings)
-                next_state = settings.run(self.clock)
+        self.running = True
+        self.current_state = 'menu'  # 'menu', 'game', 'settings', 'tutorial'
 
-                if next_state == 'menu':
-                    self.current_state = 'menu'
-                elif next_state == 'quit':
+        # Continue the autosaved match straight away (e.g. after a reboot)
+        self.resume_snapshot = None
+        if resume:
+            self._load_resume_snapshot()
+
+        with self.startup.step('loading screen'):
+            self._show_loading_screen(MENU_FONTS)
+
+        # Long-lived objects from loading never need to be scanned again.
+        # Only done here: scenes built later hold per-match objects (and
+        # reference cycles) that must stay collectable, and freezing runs a
+        # full collection the player would feel on first opening a scene
+        self.gc_control.freeze()
+        self.gc_control.start()
+
+    def _load_resume_snapshot(self):
+        from classes.match_state import load_snapshot
+        try:
+            self.resume_snapshot = load_snapshot()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Warning: Could not resume saved match: {e}")
+            return
+        self.current_state = 'game'
+
+    def _queue_assets(self):
+        """Queue every font the scenes use, menu fonts first"""
+        for size in MENU_FONTS + PRELOAD_FONTS:
+            self.loader.add_font(MINECRAFT_FONT, size)
+
+    def _show_loading_screen(self, font_sizes):
+        """Show progress until the first scene's fonts are ready"""
+        # Rendered before the worker starts so the main thread never touches
+        # the font library while the worker is opening faces
+        loading_text = pygame.font.Font(MINECRAFT_FONT, 32).render(
+            "Loading...", True, LIGHT_GRAY)
+        text_rect = loading_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40))
+        bar_rect = pygame.Rect(WIDTH // 2 - 200, HEIGHT // 2, 400, 20)
+
+        self.loader.start()
+        required = [('font', MINECRAFT_FONT, size) for size in font_sizes]
+
+        while not all(self.loader.is_ready(key) for key in required):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
                     self.running = False
+                    return
+
+            self.screen.fill(DARK_GRAY)
+            self.screen.blit(loading_text, text_rect)
+            pygame.draw.rect(self.screen, (80, 80, 80), bar_rect,
+                             border_radius=10)
+            fill_rect = bar_rect.copy()
+            fill_rect.width = int(bar_rect.width * self.loader.progress)
+            pygame.draw.rect(self.screen, LIME_GREEN, fill_rect,
+                             border_radius=10)
+            pygame.display.flip()
+            self.clock.tick(FPS)
+
+    def _get_scene(self, state):
+        """Return the scene for a state, building it on first use only"""
+        scene = self.scenes.get(state)
+        if scene is None:
+            with self.startup.step(f"scene '{state}'"):
+                scene = self._create_scene(state)
+            self.scenes[state] = scene
+        return scene
+
+    def _create_scene(self, state):
+        if state == 'menu':
+            return MainMenu(self.screen, self.sound_manager, self.profiler)
+        elif state == 'tutorial':
+            from classes import TutorialPage
+            return TutorialPage(self.screen, self.sound_manager, self.profiler)
+        elif state == 'settings':
+            from classes import SettingsMenu
+            return SettingsMenu(self.screen, self.sound_manager,
+                                self.game_settings, self.profiler)
+        elif state == 'game':
+            from classes import Game
+            game = Game(self.sound_manager, self.game_settings, self.profiler,
+                        resume_snapshot=self.resume_snapshot)
+            self.resume_snapshot = None
+            return game
+        raise ValueError(f"Unknown state: {state}")
 
-            elif self.current_state == 'game':
-                # Clear events before game
-                pygame.event.clear()
+    def run(self):
+        """Main game loop"""
+        while self.running:
+            # Clear any pending events before entering the next scene
+            pygame.event.clear()
 
-                game = Game(self.sound_manager, self.game_settings)
-                next_state = game.run(self.clock)
+            scene = self._get_scene(self.current_state)
+            scene.enter()
+            next_state = scene.run(self.clock)
+            scene.exit()
 
-                if next_state == 'menu':
-                    self.current_state = 'menu'
-                elif next_state == 'quit':
-                    self.running = False
+            if next_state in (None, 'quit'):
+                self.running = False
+            else:
+                self.current_state = next_state
 
+        self.profiler.stop_csv()
+        self.gc_control.stop()
         pygame.quit()
 
 
 def main():
-    game_manager = GameManager()
+    parser = argparse.ArgumentParser(description="Snake Card Battle")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="print import and init times once the first "
+                             "frame is shown")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue the autosaved match if there is one")
+    args = parser.parse_args()
+
+    game_manager = GameManager(startup_profiler=STARTUP_PROFILER,
+                               resume=args.resume)
     game_manager.run()
 
 
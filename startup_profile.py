@@ -0,0 +1,132 @@
+"""
+Startup profiling for `python main.py --startup-profile`.
+
+Times every module import (inclusive and self time) through a meta path
+hook, plus named initialisation steps, and prints a report once the first
+frame is on screen. Kept free of game imports so it can be installed first.
+"""
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+class _TimedLoader:
+    """Wraps a module loader to time exec_module"""
+
+    def __init__(self, loader, profiler, fullname):
+        self._loader = loader
+        self._profiler = profiler
+        self._fullname = fullname
+
+    def create_module(self, spec):
+        create = getattr(self._loader, 'create_module', None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        self._profiler._begin_import(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end_import()
+
+    def __getattr__(self, name):
+        # Resource readers, is_package, get_data etc. go to the real loader
+        return getattr(self._loader, name)
+
+
+class _TimedFinder:
+    """Meta path finder that wraps the spec found by the other finders"""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(spec.loader, self._profiler,
+                                           fullname)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects import and init timings; a no-op unless enabled"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.imports = {}  # module -> [inclusive seconds, self seconds]
+        self.steps = []    # (label, seconds)
+        # Imports also happen on the asset loader thread
+        self._local = threading.local()
+        self._finder = None
+
+    def install(self):
+        if self.enabled and self._finder is None:
+            self._finder = _TimedFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _import_stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _begin_import(self, fullname):
+        self._import_stack().append([fullname, time.perf_counter(), 0.0])
+
+    def _end_import(self):
+        stack = self._import_stack()
+        fullname, start, children = stack.pop()
+        elapsed = time.perf_counter() - start
+        self.imports[fullname] = [elapsed, elapsed - children]
+        if stack:
+            stack[-1][2] += elapsed
+
+    @contextmanager
+    def step(self, label):
+        """Time a named initialisation step"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((label, time.perf_counter() - start))
+
+    def report(self, first_frame_ms=None, limit=25, file=None):
+        """Print the slowest imports and every init step"""
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        self.uninstall()
+
+        print("Startup profile", file=file)
+        print(f"  {'import':<40}{'total ms':>10}{'self ms':>10}", file=file)
+        slowest = sorted(self.imports.items(),
+                         key=lambda item: item[1][1], reverse=True)
+        for name, (inclusive, own) in slowest[:limit]:
+            print(f"  {name:<40}{inclusive * 1000:>10.1f}{own * 1000:>10.1f}",
+                  file=file)
+        total_imports = sum(own for _, own in self.imports.values())
+        print(f"  {len(self.imports)} modules, {total_imports * 1000:.1f} ms",
+              file=file)
+
+        print(f"  {'init step':<40}{'ms':>10}", file=file)
+        for label, seconds in self.steps:
+            print(f"  {label:<40}{seconds * 1000:>10.1f}", file=file)
+
+        if first_frame_ms is not None:
+            print(f"  first interactive frame after {first_frame_ms:.0f} ms",
+                  file=file)
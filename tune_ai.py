@@ -0,0 +1,184 @@
+"""
+Self-play tuner for the CPU player's evaluation weights.
+
+Each generation mutates the champion's weights into a population of
+challengers, and every challenger plays the champion over the same dealt
+hands, once from each seat. The challenger with the best score takes over
+if it beats the champion by the promotion margin. Games are independent,
+so they are spread over a process pool that uses every core, and the
+searches run to a fixed depth rather than a time budget so results don't
+depend on machine load. State is checkpointed after every generation;
+running again with the same checkpoint resumes where it stopped.
+
+Usage:
+    python tune_ai.py                         # 10 generations, all cores
+    python tune_ai.py -G 50 --games 40        # longer run, more games each
+    python tune_ai.py --checkpoint run.json   # resume or start a named run
+"""
+import os
+
+# Must be set before pygame is imported here and in the worker processes
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import *
+from classes.card import deal_hand
+from classes.evaluation import FEATURES, Evaluator
+from classes.plan_solver import PlanSolver, WIN
+from classes.player import start_snakes
+
+CHECKPOINT_FILE = ".cache/tune_ai.json"
+
+
+def choose_plan(snake, opponent, hand, opponent_hand, weights, depth):
+    """The plan a CPU player with these weights would play"""
+    solver = PlanSolver(snake, opponent, hand, sorted(opponent_hand, key=repr),
+                        evaluator=Evaluator(snake.grid_size, weights))
+    return solver.deepen(max_depth=depth).plan
+
+
+def play_game(job):
+    """
+    Worker: one deal played from both seats.
+
+    Returns the first weights' points out of 2 * WIN (a win is WIN, a
+    draw DRAW, per seat).
+    """
+    first, second, grid_size, hand_size, depth, seed = job
+    rng = random.Random(seed)
+    hands = (deal_hand(hand_size, rng), deal_hand(hand_size, rng))
+    snakes = start_snakes(grid_size)
+
+    points = 0
+    for seat in (0, 1):
+        weights = (first, second) if seat == 0 else (second, first)
+        plans = [choose_plan(snakes[i], snakes[1 - i], hands[i],
+                             hands[1 - i], weights[i], depth)
+                 for i in (0, 1)]
+        # Score the first weights' plan against the single plan it meets
+        me = seat
+        referee = PlanSolver(snakes[me], snakes[1 - me], plans[me], None,
+                             orderings=[plans[1 - me]])
+        points += referee.solve(depth=0, completion=plans[me]).score
+    return points
+
+
+def mutate(weights, sigma, rng):
+    """Gaussian step on every weight, scaled to its size"""
+    return {name: round(value + rng.gauss(0, sigma) * max(abs(value), 0.25),
+                        4)
+            for name, value in weights.items()}
+
+
+def tournament(pool, challengers, champion, args, generation):
+    """Win rate (draws half) of each challenger against the champion"""
+    jobs = []
+    for challenger in challengers:
+        for game in range(args.games):
+            # The same deals for every challenger in a generation
+            seed = hash((args.seed, generation, game)) & 0xFFFFFFFF
+            jobs.append((challenger, champion, args.grid, args.hand,
+                         args.depth, seed))
+    points = list(pool.map(play_game, jobs, chunksize=2))
+    rates = []
+    for i in range(len(challengers)):
+        total = sum(points[i * args.games:(i + 1) * args.games])
+        rates.append(total / (2 * WIN * args.games))
+    return rates
+
+
+def load_checkpoint(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_checkpoint(path, state):
+    """Write atomically, so an interrupted run never loses its checkpoint"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument('-G', '--generations', type=int, default=10,
+                        help="generations to run in total (default: 10)")
+    parser.add_argument('-p', '--population', type=int, default=8,
+                        help="challengers per generation (default: 8)")
+    parser.add_argument('--games', type=int, default=20,
+                        help="deals per challenger, each played from both "
+                             "seats (default: 20)")
+    parser.add_argument('--sigma', type=float, default=0.3,
+                        help="mutation size relative to each weight")
+    parser.add_argument('--promote', type=float, default=0.55,
+                        help="win rate needed to replace the champion "
+                             "(default: 0.55)")
+    parser.add_argument('--depth', type=int, default=1,
+                        help="search depth of both players (default: 1)")
+    parser.add_argument('--grid', type=int, default=GRID_SIZE)
+    parser.add_argument('--hand', type=int, default=MAX_HAND_SIZE)
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--checkpoint', default=CHECKPOINT_FILE)
+    parser.add_argument('-o', '--output', default=AI_WEIGHTS_FILE,
+                        help="where the final champion's weights go")
+    args = parser.parse_args()
+
+    state = load_checkpoint(args.checkpoint)
+    if state is None:
+        champion = Evaluator(args.grid).weights
+        state = {'generation': 0,
+                 'champion': {name: champion[name] for name in FEATURES},
+                 'history': []}
+    else:
+        print(f"Resuming from {args.checkpoint} at generation "
+              f"{state['generation']}")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        while state['generation'] < args.generations:
+            generation = state['generation']
+            started = time.perf_counter()
+            champion = state['champion']
+            rng = random.Random(hash((args.seed, generation)))
+            challengers = [mutate(champion, args.sigma, rng)
+                           for _ in range(args.population)]
+
+            rates = tournament(pool, challengers, champion, args, generation)
+            best = max(range(len(challengers)), key=rates.__getitem__)
+            promoted = rates[best] >= args.promote
+            if promoted:
+                state['champion'] = challengers[best]
+
+            state['history'].append({
+                'generation': generation,
+                'best_win_rate': rates[best],
+                'challenger': challengers[best],
+                'promoted': promoted,
+            })
+            state['generation'] = generation + 1
+            save_checkpoint(args.checkpoint, state)
+
+            print(f"generation {generation + 1}: best challenger "
+                  f"{rates[best]:.1%} vs previous champion"
+                  f"{' -> promoted' if promoted else ''} "
+                  f"({time.perf_counter() - started:.1f}s)")
+
+    save_checkpoint(args.output, state['champion'])
+    print(f"Champion weights written to {args.output}: {state['champion']}")
+
+
+if __name__ == "__main__":
+    main()